@@ -2,9 +2,15 @@ import openai
 import json
 import logging
 import os
+import sys
 from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.llm_response_cache import LLMResponseCache, make_cache_key, prompt_version
+from backend.src.services.article_context import build_article_context
+
 # .env 파일 로드
 load_dotenv()
 
@@ -18,29 +24,17 @@ if not openai.api_key:
     logger.warning("OPENAI_API_KEY가 .env 파일에 설정되지 않았습니다.")
     logger.warning("AI 분류 기능이 제한될 수 있습니다.")
 
-def classify_article_with_ai(title: str, content: str, keywords: List[str]) -> Tuple[str, str, float]:
-    """
-    OpenAI API를 사용하여 기사를 가장 적합한 키워드로 분류해서 기사를 저장해주세요.
-    
-    Args:
-        title: 기사 제목
-        content: 기사 본문
-        keywords: 분류할 키워드 리스트
-    
-    Returns:
-        (best_keyword, reasoning, confidence_score)
-    """
-    
-    try:
-        # 프롬프트 구성
-        prompt = f"""
+CLASSIFY_MODEL = "gpt-3.5-turbo"
+SYSTEM_PROMPT = "당신은 F&F 회사와 사내 소속된 브랜드들의 뉴스 기사 분류 전문가입니다. 주어진 키워드 중에서 기사와 가장 관련성이 높은 키워드를 정확하게 분류해주세요."
+
+CLASSIFY_PROMPT = """
 다음 뉴스 기사를 분석하여 가장 적합한 키워드로 분류해주세요.
 
 **기사 제목**: {title}
 
-**기사 본문**: {content[:2000]}...
+**기사 본문**: {content}...
 
-**분류할 키워드**: {', '.join(keywords)}
+**분류할 키워드**: {keywords}
 
 **분류 기준**:
 - F&F: 패션 회사 F&F와 관련된 내용 (브랜드 소유, 경영, 투자, 엔터테인먼트, 유니스(UNIS), 아홉(AHOF) 등)
@@ -58,19 +52,46 @@ def classify_article_with_ai(title: str, content: str, keywords: List[str]) -> T
 만약 여러 키워드가 동시에 언급되면, 기사의 주요 주제나 핵심 내용을 기준으로 가장 적합한 하나를 선택해주세요.
 """
 
-        # OpenAI API 호출
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "당신은 F&F 회사와 사내 소속된 브랜드들의 뉴스 기사 분류 전문가입니다. 주어진 키워드 중에서 기사와 가장 관련성이 높은 키워드를 정확하게 분류해주세요."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=500
-        )
-        
-        # 응답 파싱
-        result_text = response.choices[0].message.content.strip()
+# 템플릿이 바뀌면 캐시 키도 바뀌도록 템플릿 내용으로 버전을 만든다
+PROMPT_VERSION = prompt_version(SYSTEM_PROMPT, CLASSIFY_PROMPT)
+response_cache = LLMResponseCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "database", "db.sqlite"))
+
+def classify_article_with_ai(title: str, content: str, keywords: List[str]) -> Tuple[str, str, float]:
+    """
+    OpenAI API를 사용하여 기사를 가장 적합한 키워드로 분류해서 기사를 저장해주세요.
+    
+    Args:
+        title: 기사 제목
+        content: 기사 본문
+        keywords: 분류할 키워드 리스트
+    
+    Returns:
+        (best_keyword, reasoning, confidence_score)
+    """
+    
+    try:
+        # 프롬프트 구성 (본문은 토큰 예산 안에서 리드와 키워드 문장 위주로 줄임)
+        context = build_article_context(content, keywords, model=CLASSIFY_MODEL)
+        prompt = CLASSIFY_PROMPT.format(title=title, content=context, keywords=', '.join(keywords))
+
+        # OpenAI API 호출 (같은 프롬프트/모델/키워드/기사 내용이면 저장된 응답 재사용)
+        def request_completion():
+            response = openai.ChatCompletion.create(
+                model=CLASSIFY_MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500
+            )
+            return response.choices[0].message.content
+
+        keyword_list = ', '.join(keywords)
+        cache_key = make_cache_key(PROMPT_VERSION, CLASSIFY_MODEL, keyword_list, title, context)
+        result_text = response_cache.get_or_create(
+            cache_key, request_completion, version=PROMPT_VERSION, model=CLASSIFY_MODEL, keyword=keyword_list
+        ).strip()
         
         # JSON 파싱 시도
         try:
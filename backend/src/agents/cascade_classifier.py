@@ -0,0 +1,226 @@
+"""
+단계별(캐스케이드) 기사 분류
+- 1단계 규칙: database/classify_* 스크립트와 분류 프롬프트의 기준 중 코드로 확실히 판단할 수 있는 것
+  (야구/자동차·펀드·채널 기사 제외, 아홉·롯데온 같은 확정 사례)
+  관계자 멘트나 키워드 미등장처럼 예외가 많은 단서는 규칙으로 결정하지 않고 LLM이 판단
+- 2단계 로컬 모델: KoELECTRA KeywordClassifier (학습된 모델 파일이 있을 때만)
+- 단계 결과의 신뢰도가 그 단계 임계값 이상이면 거기서 결정하고, 아니면 다음 단계로 넘김 (마지막은 LLM)
+- 어느 단계가 결정했는지(decided_by)를 classification_logs에 남기고 단계별 적중률을 집계
+"""
+import os
+import sqlite3
+import sys
+import threading
+from typing import Dict, Any, Optional
+
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.keyword_matcher import KeywordMatcher
+from backend.src.services.baseball_terms import BASEBALL_KEYWORDS, BASEBALL_PATTERNS
+
+# 결정 단계
+TIER_RULE = 'rule'
+TIER_LOCAL = 'local_model'
+TIER_LLM = 'llm'
+TIERS = (TIER_RULE, TIER_LOCAL, TIER_LLM)
+
+# 단계별 결정 임계값 (결과 신뢰도가 이 값 이상이면 그 단계에서 결정)
+CASCADE_RULE_THRESHOLD = float(os.getenv('CASCADE_RULE_THRESHOLD', 0.9))
+CASCADE_LOCAL_THRESHOLD = float(os.getenv('CASCADE_LOCAL_THRESHOLD', 0.95))
+# KeywordClassifier 모델 디렉터리
+CASCADE_LOCAL_MODEL_PATH = os.getenv('CASCADE_LOCAL_MODEL_PATH', 'models/keyword_model')
+
+# 야구 기사 판단: 브랜드 기사에도 흔히 나오는 단어는 빼고 선수/팀/기록 용어만 센다
+BASEBALL_GROUPS = ('MLB', '엠엘비')
+AMBIGUOUS_BASEBALL_TERMS = {
+    'MLB', '메이저리그', '시즌', 'FA', 'IL', 'DL', '옵션', '베이스', '구장', '스타디움', '선발', '마무리',
+    '승리', '패배', '연장', '올스타', '구원', '세팅', '재계약', '자유계약', '트레이드', '콜업', '레이스',
+}
+STRONG_BASEBALL_MATCHER = KeywordMatcher(
+    [term for term in BASEBALL_KEYWORDS if term not in AMBIGUOUS_BASEBALL_TERMS],
+    patterns=BASEBALL_PATTERNS, ignore_case=True
+)
+FASHION_MATCHER = KeywordMatcher(['패션', '의류', '컬렉션', '매장', '모자', '신상', '팝업', '캡', '굿즈'], ignore_case=True)
+
+# 디스커버리 익스페디션 키워드에서 제외할 자동차/펀드/채널 표현
+DISCOVERY_EXCLUDE_MATCHER = KeywordMatcher(
+    ['랜드로버', '디스커버리 스포츠', 'SK디스커버리', '디스커버리 채널', '디스커버리채널', '디스커버리 펀드'],
+    ignore_case=True
+)
+
+# 제목 확정 사례: (키워드, 제목에 하나라도 있으면, 분류, 근거) - database/classify_* 스크립트와 같은 판단
+TITLE_RULES = [
+    ('F&F', ('아홉', 'AHOF'), '보도자료',
+     "'아홉' 혹은 'AHOF'은 F&F엔터테인먼트 소속의 아티스트이다. 그리고 F&F엔터테인먼트는 F&F의 자회사이다."),
+    ('노스페이스', ('롯데온',), '오가닉', '온라인 플랫폼에 노스페이스가 할인 프로모션에 참여한다는 내용이 포함되어 있음'),
+]
+
+
+def _rule_result(classification: str, confidence: float, reason: str, rule: str) -> Dict[str, Any]:
+    return {'classification': classification, 'confidence': confidence, 'reason': reason, 'rule': rule}
+
+
+def classify_by_rules(title: str, content: str, keyword: str, group_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """규칙으로 분류 (해당하는 규칙이 없으면 None)
+
+    제외 대상(야구, 자동차/펀드/채널)을 먼저 보고 확정 사례를 확인한다.
+    모든 규칙은 제목만 본다. 본문에 지나가듯 나온 단어로 기사의 주제를 단정하지 않도록 본문은 LLM이 판단한다.
+    """
+    title = title or ''
+    group = group_name or keyword
+
+    if group in BASEBALL_GROUPS or keyword in BASEBALL_GROUPS:
+        baseball_terms = STRONG_BASEBALL_MATCHER.find_all(title)
+        if (len(baseball_terms) >= 2 or STRONG_BASEBALL_MATCHER.matched_patterns(title)) \
+                and not FASHION_MATCHER.contains_any(title):
+            return _rule_result('해당없음', 0.95, '스포츠 야구 관련 기사로 패션 브랜드 MLB와 연관없음', 'baseball')
+
+    if '디스커버리' in keyword and DISCOVERY_EXCLUDE_MATCHER.contains_any(title):
+        return _rule_result('해당없음', 0.95, '자동차/펀드/채널 관련 기사로 디스커버리 익스페디션 브랜드와 연관없음', 'discovery_exclude')
+
+    for rule_keyword, title_terms, classification, reason in TITLE_RULES:
+        if keyword == rule_keyword and any(term.lower() in title.lower() for term in title_terms):
+            return _rule_result(classification, 1.0, reason, f'title:{title_terms[0]}')
+
+    return None
+
+
+class ClassificationCascade:
+    """규칙 → 로컬 모델 단계 (LLM 호출 전에 확실한 기사를 걸러냄, 스레드 안전)
+
+    local_model은 predict(title, content)를 가진 객체로,
+    - {'classification', 'confidence'}를 돌려주면 그 결과를 그대로 쓰고
+    - KeywordClassifier처럼 {'keyword', 'confidence', 'probabilities'}를 돌려주면 다른 브랜드 기사로
+      확실히 판단될 때만 '해당없음'으로 결정한다 (보도자료/오가닉 구분은 LLM에 넘김).
+    지정하지 않으면 CASCADE_LOCAL_MODEL_PATH의 KeywordClassifier를 처음 쓸 때 불러온다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, local_model=None,
+                 rule_threshold: float = CASCADE_RULE_THRESHOLD, local_threshold: float = CASCADE_LOCAL_THRESHOLD):
+        self.db_path = db_path
+        self.rule_threshold = rule_threshold
+        self.local_threshold = local_threshold
+        self._local_model = local_model
+        self._local_loaded = local_model is not None
+        self._lock = threading.Lock()
+        self._counts = {tier: 0 for tier in TIERS}
+
+    def _get_local_model(self):
+        with self._lock:
+            if not self._local_loaded:
+                self._local_loaded = True
+                if not os.path.isdir(os.path.join(CASCADE_LOCAL_MODEL_PATH, 'koelectra_keyword_model')):
+                    # 학습된 모델이 없으면 로컬 단계는 건너뜀 (KeywordClassifier는 생성 시 디렉터리를 만든다)
+                    return None
+                try:
+                    from backend.src.ml.keyword_classifier import KeywordClassifier
+                    model = KeywordClassifier(self.db_path, model_path=CASCADE_LOCAL_MODEL_PATH)
+                    self._local_model = model if model.load_model() else None
+                except ImportError as e:
+                    print(f"⚠️ 로컬 분류 모델을 사용할 수 없습니다 (규칙 다음 바로 LLM): {e}")
+                    self._local_model = None
+            return self._local_model
+
+    def _classify_local(self, title: str, content: str, keyword: str) -> Optional[Dict[str, Any]]:
+        model = self._get_local_model()
+        if model is None:
+            return None
+        prediction = model.predict(title, content)
+        if prediction.get('classification'):
+            return {
+                'classification': prediction['classification'],
+                'confidence': float(prediction.get('confidence', 0.0)),
+                'reason': f"로컬 모델 분류 ({prediction.get('model_type', 'local')})"
+            }
+        predicted = prediction.get('keyword')
+        own_probability = prediction.get('probabilities', {}).get(keyword, 0.0)
+        if predicted and predicted != keyword and own_probability <= 1 - self.local_threshold:
+            return {
+                'classification': '해당없음',
+                'confidence': float(prediction.get('confidence', 0.0)),
+                'reason': f"로컬 모델이 '{predicted}' 기사로 판단 ('{keyword}' 확률 {own_probability:.2f})"
+            }
+        return None
+
+    def decide(self, title: str, content: str, keyword: str, group_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """규칙/로컬 모델로 결정할 수 있으면 결과(decided_by 포함), 아니면 None (LLM으로 넘김)"""
+        result = classify_by_rules(title, content, keyword, group_name)
+        if result and result['confidence'] >= self.rule_threshold:
+            return self._decided(result, TIER_RULE)
+        try:
+            result = self._classify_local(title, content, keyword)
+        except Exception as e:
+            print(f"⚠️ 로컬 모델 분류 오류, LLM으로 넘깁니다: {e}")
+            result = None
+        if result and result['confidence'] >= self.local_threshold:
+            return self._decided(result, TIER_LOCAL)
+        return None
+
+    def _decided(self, result: Dict[str, Any], tier: str) -> Dict[str, Any]:
+        self.record(tier)
+        return {**result, 'decided_by': tier}
+
+    def record(self, tier: str):
+        """결정 단계 집계 (LLM 단계는 호출하는 쪽에서 기록)"""
+        with self._lock:
+            self._counts[tier] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """이번 실행의 단계별 결정 건수와 비율"""
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        return {
+            'total': total,
+            'tiers': {
+                tier: {'count': count, 'hit_rate': round(count / total, 3) if total else 0.0}
+                for tier, count in counts.items()
+            },
+            'llm_calls_saved': total - counts[TIER_LLM]
+        }
+
+
+def ensure_decided_by_column(conn: sqlite3.Connection):
+    """classification_logs에 decided_by 칼럼이 없으면 추가 (이전 로그는 NULL)"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(classification_logs)")}
+    if 'decided_by' not in columns:
+        conn.execute("ALTER TABLE classification_logs ADD COLUMN decided_by TEXT")
+        conn.commit()
+
+
+def get_tier_statistics(db_path: str, keyword: Optional[str] = None) -> Dict[str, Any]:
+    """classification_logs 기준 단계별 결정 건수/비율/평균 신뢰도 (decided_by가 없는 이전 로그는 제외)
+
+    Returns:
+        Dict[str, Any]: total, tiers(단계별 count/hit_rate/avg_confidence), llm_calls_saved
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        ensure_decided_by_column(conn)
+        query = """
+            SELECT decided_by, COUNT(*), AVG(confidence_score)
+            FROM classification_logs
+            WHERE decided_by IS NOT NULL
+        """
+        params = ()
+        if keyword:
+            query += " AND keyword = ?"
+            params = (keyword,)
+        rows = conn.execute(query + " GROUP BY decided_by", params).fetchall()
+    finally:
+        conn.close()
+    counts = {tier: (0, None) for tier in TIERS}
+    counts.update({tier: (count, avg_confidence) for tier, count, avg_confidence in rows})
+    total = sum(count for count, _ in counts.values())
+    return {
+        'total': total,
+        'tiers': {
+            tier: {
+                'count': count,
+                'hit_rate': round(count / total, 3) if total else 0.0,
+                'avg_confidence': round(avg_confidence, 2) if avg_confidence is not None else None
+            }
+            for tier, (count, avg_confidence) in counts.items()
+        },
+        'llm_calls_saved': total - counts[TIER_LLM][0]
+    }
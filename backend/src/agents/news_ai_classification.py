@@ -1,12 +1,74 @@
 import os
+import sys
 import sqlite3
 import json
+import random
 import re
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError, APIStatusError
 from typing import Dict, List, Tuple, Optional
 import time
 
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.llm_response_cache import LLMResponseCache, make_cache_key, prompt_version
+from backend.src.services.token_counter import count_tokens
+from backend.src.services.article_context import build_article_context
+from backend.src.agents.cascade_classifier import (
+    ClassificationCascade, ensure_decided_by_column, get_tier_statistics, TIER_LLM
+)
+
+CLASSIFY_MODEL = "gpt-4o"
+SYSTEM_PROMPT = "당신은 뉴스 기사 분류 전문가입니다. 정확하고 일관된 분류를 제공해 주세요."
+
+# 동시에 보낼 최대 분류 요청 수 (1이면 한 건씩 순서대로)
+AI_CLASSIFY_MAX_IN_FLIGHT = int(os.getenv('AI_CLASSIFY_MAX_IN_FLIGHT', 4))
+# 429/5xx/연결 오류 시 재시도 횟수와 대기 시간 (지수 백오프 + 지터, 초)
+AI_CLASSIFY_MAX_RETRIES = int(os.getenv('AI_CLASSIFY_MAX_RETRIES', 4))
+AI_CLASSIFY_BACKOFF_BASE = float(os.getenv('AI_CLASSIFY_BACKOFF_BASE', 1.0))
+AI_CLASSIFY_BACKOFF_MAX = 30.0
+# classification_logs에 한 번에 저장할 결과 수
+AI_CLASSIFY_WRITE_BATCH = int(os.getenv('AI_CLASSIFY_WRITE_BATCH', 20))
+# 한 요청에 묶을 최대 기사 수 (1이면 기사마다 따로 요청)
+AI_CLASSIFY_BATCH_MAX_ARTICLES = int(os.getenv('AI_CLASSIFY_BATCH_MAX_ARTICLES', 1))
+# 한 요청에 묶을 기사 제목+본문의 토큰 예산 (이보다 긴 기사는 혼자 요청)
+AI_CLASSIFY_BATCH_TOKEN_BUDGET = int(os.getenv('AI_CLASSIFY_BATCH_TOKEN_BUDGET', 6000))
+# 1이면 규칙 → 로컬 모델로 확실한 기사를 먼저 결정하고 나머지만 LLM에 요청
+AI_CLASSIFY_CASCADE = int(os.getenv('AI_CLASSIFY_CASCADE', 0))
+# 일괄 응답에서 기사 하나당 잡는 출력 토큰 수
+BATCH_OUTPUT_TOKENS_PER_ARTICLE = 150
+
+CLASSIFICATIONS = ('보도자료', '오가닉', '해당없음')
+
+INSERT_LOG_SQL = """
+    INSERT INTO classification_logs 
+    (keyword, group_name, title, content, url, classification_result, confidence_score, reason, processing_time, created_at, is_saved, decided_by)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _is_retryable(error: Exception) -> bool:
+    """일시적인 오류(속도 제한, 서버 오류, 연결 끊김)인지 여부"""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """재시도 대기 시간 (지수 백오프 상한 안에서 무작위, Retry-After가 있으면 그 이상)"""
+    delay = random.uniform(0, min(AI_CLASSIFY_BACKOFF_MAX, AI_CLASSIFY_BACKOFF_BASE * (2 ** attempt)))
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        return max(delay, min(AI_CLASSIFY_BACKOFF_MAX, float(retry_after))) if retry_after else delay
+    except ValueError:
+        return delay
+
+
 class NewsAIClassifier:
     def __init__(self, db_path: str = None):
         if db_path is None:
@@ -28,6 +90,11 @@ class NewsAIClassifier:
         
         # 프롬프트 템플릿 로드
         self.prompts = self._load_prompts()
+        self.model = CLASSIFY_MODEL
+        # 템플릿이 바뀌면 캐시 키도 바뀌도록 템플릿 내용으로 버전을 만든다
+        self.prompt_version = prompt_version(SYSTEM_PROMPT, self.prompts.get('default', ''))
+        self.batch_prompt_version = prompt_version(SYSTEM_PROMPT, self.prompts.get('batch', ''))
+        self.response_cache = LLMResponseCache(self.db_path)
         
     def _load_prompts(self) -> Dict[str, str]:
         """프롬프트 파일에서 기본 템플릿을 로드합니다."""
@@ -41,11 +108,17 @@ class NewsAIClassifier:
             # 기본 프롬프트 추출
             default_match = re.search(r'## 기본 분류 프롬프트\s*\n\s*```(.*?)```', content, re.DOTALL)
             if default_match:
-                return {'default': default_match.group(1).strip()}
+                prompts = {'default': default_match.group(1).strip()}
             else:
                 print("기본 프롬프트를 찾을 수 없습니다.")
                 return {}
             
+            # 일괄 분류 프롬프트 추출 (없으면 기사마다 따로 요청)
+            batch_match = re.search(r'## 일괄 분류 프롬프트\s*\n\s*```(.*?)```', content, re.DOTALL)
+            if batch_match:
+                prompts['batch'] = batch_match.group(1).strip()
+            return prompts
+            
         except FileNotFoundError:
             print(f"프롬프트 파일을 찾을 수 없습니다: {prompt_file}")
             return {}
@@ -90,6 +163,168 @@ class NewsAIClassifier:
             print(f"AI 응답 파싱 오류: {e}")
             return "해당없음", 0.5, "파싱 오류"
 
+    def _request_completion(self, prompt: str, max_tokens: int = 500) -> str:
+        """OpenAI 호출 (429/5xx/연결 오류는 백오프 후 재시도, 그 밖의 오류는 그대로 전달)"""
+        for attempt in range(AI_CLASSIFY_MAX_RETRIES + 1):
+            try:
+                # OpenAI API 최신 방식 호출
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.2,
+                    max_tokens=max_tokens
+                )
+                return response.choices[0].message.content
+            except Exception as e:
+                if attempt >= AI_CLASSIFY_MAX_RETRIES or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(attempt, e)
+                print(f"⏳ OpenAI 일시 오류({e.__class__.__name__}), {delay:.1f}초 후 재시도 ({attempt + 1}/{AI_CLASSIFY_MAX_RETRIES})")
+                time.sleep(delay)
+
+    def _classify_timed(self, title: str, content: str, keyword: str) -> Tuple[Dict, float]:
+        """기사 하나 분류 + 그 기사의 처리 시간 (작업 스레드에서 실행)"""
+        start_time = time.time()
+        result = self.classify_article(title, content, keyword)
+        return result, round(time.time() - start_time, 1)
+
+    def _plan_batches(self, articles: List[Tuple[str, str]], max_articles: int) -> List[List[int]]:
+        """조회 순서대로 기사를 묶음으로 나누기
+
+        묶음마다 최대 max_articles건, 제목+본문 토큰 합이 AI_CLASSIFY_BATCH_TOKEN_BUDGET을
+        넘지 않게 채운다. 짧은 기사는 많이, 긴 기사는 적게 묶이고 예산보다 긴 기사는 혼자 요청한다.
+
+        Args:
+            articles (List[Tuple[str, str]]): (제목, 본문) 목록
+            max_articles (int): 묶음당 최대 기사 수
+
+        Returns:
+            List[List[int]]: 묶음별 articles 인덱스
+        """
+        batches, current, used = [], [], 0
+        for index, (title, content) in enumerate(articles):
+            tokens = count_tokens(f"{title}\n{content or ''}", self.model)
+            if current and (len(current) >= max_articles or used + tokens > AI_CLASSIFY_BATCH_TOKEN_BUDGET):
+                batches.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _build_batch_prompt(self, keyword: str, articles: List[Tuple[str, str]]) -> str:
+        blocks = [f"[{index}] 제목: {title}\n본문: {content}" for index, (title, content) in enumerate(articles)]
+        # 기사 본문의 중괄호가 치환되지 않도록 기사 목록을 마지막에 넣는다
+        return (self.prompts['batch']
+                .replace('{keyword}', keyword)
+                .replace('{count}', str(len(articles)))
+                .replace('{articles}', '\n\n'.join(blocks)))
+
+    @staticmethod
+    def _validate_batch_item(item) -> Optional[Dict]:
+        """일괄 응답 항목 하나를 분류 결과로 변환 (형식이 틀리면 None)"""
+        if not isinstance(item, dict) or item.get('classification') not in CLASSIFICATIONS:
+            return None
+        try:
+            confidence = float(item.get('confidence', 0.5))
+        except (TypeError, ValueError):
+            return None
+        if not 0.0 <= confidence <= 1.0:
+            return None
+        reason = item.get('reason')
+        return {
+            'classification': item['classification'],
+            'confidence': confidence,
+            'reason': reason if isinstance(reason, str) and reason else '근거 없음'
+        }
+
+    def _parse_batch_response(self, response: str, count: int) -> Dict[int, Dict]:
+        """일괄 응답(JSON 배열)을 기사 번호별 분류 결과로 변환
+
+        번호가 없거나 범위를 벗어나거나 중복된 항목, 값이 틀린 항목은 빼고 돌려준다.
+        """
+        text = re.sub(r"^```json|^```|```$", "", response or '', flags=re.MULTILINE).strip()
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError:
+            print(f"일괄 응답 JSON 파싱 실패, 원본 응답: {text[:200]}")
+            return {}
+        if not isinstance(items, list):
+            return {}
+        parsed, duplicated = {}, set()
+        for item in items:
+            index = item.get('index') if isinstance(item, dict) else None
+            if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < count:
+                continue
+            if index in parsed:
+                duplicated.add(index)
+                continue
+            result = self._validate_batch_item(item)
+            if result:
+                parsed[index] = result
+        for index in duplicated:
+            parsed.pop(index, None)
+        return parsed
+
+    def _classify_batch(self, articles: List[Tuple[int, str, str]], keyword: str) -> List[Tuple[int, Dict, float]]:
+        """여러 기사를 한 요청으로 분류 (작업 스레드에서 실행)
+
+        응답이 잘못되었거나 빠진 기사는 기사별 요청(classify_article)으로 다시 분류한다.
+        processing_time은 일괄 요청 시간을 기사 수로 나눈 값 (다시 분류한 기사는 그 시간을 더한다).
+
+        Args:
+            articles (List[Tuple[int, str, str]]): (결과 인덱스, 제목, 본문) 목록
+            keyword (str): 분류 키워드
+
+        Returns:
+            List[Tuple[int, Dict, float]]: (결과 인덱스, 분류 결과, 처리 시간) 목록
+        """
+        if len(articles) == 1 or not self.prompts.get('batch'):
+            return [(index, *self._classify_timed(title, content, keyword)) for index, title, content in articles]
+
+        start_time = time.time()
+        results = {}
+        requested = []
+        for index, title, content in articles:
+            cache_key = make_cache_key(self.batch_prompt_version, self.model, keyword, title, content)
+            cached = self.response_cache.get(cache_key)
+            result = self._validate_batch_item(json.loads(cached)) if cached else None
+            if result:
+                results[index] = result
+            else:
+                requested.append((index, title, content, cache_key))
+
+        if requested:
+            prompt = self._build_batch_prompt(keyword, [(title, content) for _, title, content, _ in requested])
+            max_tokens = BATCH_OUTPUT_TOKENS_PER_ARTICLE * len(requested) + 100
+            try:
+                parsed = self._parse_batch_response(self._request_completion(prompt, max_tokens), len(requested))
+            except Exception as e:
+                print(f"일괄 분류 요청 실패: {e}")
+                parsed = {}
+            for position, (index, title, content, cache_key) in enumerate(requested):
+                if position in parsed:
+                    results[index] = parsed[position]
+                    # 기사별로 저장해 두면 다른 묶음에 섞여도 다시 요청하지 않는다
+                    self.response_cache.put(cache_key, json.dumps(parsed[position], ensure_ascii=False),
+                                            self.batch_prompt_version, self.model, keyword)
+            if len(parsed) < len(requested):
+                print(f"⚠️ 일괄 응답 {len(requested)}건 중 {len(requested) - len(parsed)}건이 없거나 잘못되어 기사별로 다시 분류합니다.")
+
+        share = (time.time() - start_time) / len(articles)
+        classified = []
+        for index, title, content in articles:
+            if index in results:
+                classified.append((index, results[index], round(share, 1)))
+            else:
+                result, processing_time = self._classify_timed(title, content, keyword)
+                classified.append((index, result, round(share + processing_time, 1)))
+        return classified
+
     def classify_article(self, title: str, content: str, keyword: str) -> Dict:
         if self.client is None:
             print("❌ OpenAI API 미연동 상태입니다. 분류를 건너뜁니다.")
@@ -111,22 +346,17 @@ class NewsAIClassifier:
                     'reason': '프롬프트 템플릿 없음'
                 }
             
-            # 프롬프트 생성
+            # 프롬프트 생성 (본문은 토큰 예산 안에서 리드와 키워드 문장 위주로 줄임)
+            content = build_article_context(content, keyword, model=self.model)
             prompt = prompt_template.format(title=title, content=content)
             
-            # OpenAI API 최신 방식 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "당신은 뉴스 기사 분류 전문가입니다. 정확하고 일관된 분류를 제공해 주세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=500
+            # 같은 템플릿/모델/키워드/기사 내용이면 저장된 응답 재사용
+            cache_key = make_cache_key(self.prompt_version, self.model, keyword, title, content)
+            ai_response = self.response_cache.get_or_create(
+                cache_key, lambda: self._request_completion(prompt),
+                version=self.prompt_version, model=self.model, keyword=keyword
             )
             
-            ai_response = response.choices[0].message.content
-            
             # 응답 파싱
             classification, confidence, reason = self._parse_ai_response(ai_response)
             
@@ -144,7 +374,19 @@ class NewsAIClassifier:
                 'reason': f'분류 오류: {str(e)}'
             }
 
-    def classify_articles_by_keyword(self, keyword: str, start_date: str = None, end_date: str = None) -> List[Dict]:
+    def classify_articles_by_keyword(self, keyword: str, start_date: str = None, end_date: str = None,
+                                     max_in_flight: Optional[int] = None,
+                                     batch_max_articles: Optional[int] = None,
+                                     cascade: Optional[bool] = None) -> List[Dict]:
+        """키워드의 기사를 분류해 classification_logs에 저장합니다.
+
+        요청은 최대 max_in_flight(기본 AI_CLASSIFY_MAX_IN_FLIGHT)건까지 동시에 보내고,
+        결과는 AI_CLASSIFY_WRITE_BATCH건씩 모아 저장합니다. processing_time은 기사별 요청 시간입니다.
+        batch_max_articles(기본 AI_CLASSIFY_BATCH_MAX_ARTICLES)가 2 이상이면 기사 여러 건을
+        한 요청으로 묶어 분류합니다 (토큰 예산 안에서, 잘못된 응답은 기사별로 다시 분류).
+        cascade(기본 AI_CLASSIFY_CASCADE)가 켜져 있으면 규칙/로컬 모델로 확실한 기사는 LLM 없이 결정하고,
+        결정한 단계는 classification_logs.decided_by에 남깁니다.
+        """
         # 프롬프트 템플릿이 없으면 분류 자체를 수행하지 않음
         if not self.prompts or not self.prompts.get('default'):
             print("❌ 프롬프트 템플릿이 없어 분류 작업을 중단합니다.")
@@ -173,53 +415,108 @@ class NewsAIClassifier:
                 """, (keyword,))
             articles = cursor.fetchall()
             print(f"키워드 '{keyword}'에 대해 {len(articles)}개의 기사를 분류합니다.")
-            classification_results = []
+
+            # url + 키워드 중복 체크 (이미 분류한 url을 한 번에 조회)
+            cursor.execute("SELECT url FROM classification_logs WHERE keyword = ?", (keyword,))
+            classified_urls = {row[0] for row in cursor.fetchall()}
+            pending = []
             for article in articles:
-                article_id, title, url, keyword, group_name, content, created_at, pub_date = article
-                print(f"기사 ID {article_id} 분류 중...")
-                # url + 키워드 중복 체크
-                cursor.execute("SELECT COUNT(*) FROM classification_logs WHERE url = ? AND keyword = ?", (url, keyword))
-                if cursor.fetchone()[0] > 0:
+                url = article[2]
+                if url in classified_urls:
                     print(f"⚠️ 이미 저장된 url({url}) + 키워드({keyword})이므로 건너뜁니다.")
                     continue
-                start_time = time.time()
-                result = self.classify_article(title, content, keyword)
-                processing_time = round(time.time() - start_time, 1)
-                cursor.execute("""
-                    INSERT INTO classification_logs 
-                    (keyword, group_name, title, content, url, classification_result, confidence_score, reason, processing_time, created_at, is_saved)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    keyword, 
-                    group_name,
-                    title,
-                    content,  # articles의 content 값만 그대로 저장
-                    url,  # 실제 URL 저장
-                    result['classification'], 
-                    result['confidence'],
-                    result['reason'],
-                    processing_time,
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    0  # is_saved 기본값
-                ))
-                print(f"  제목: {title[:50]}...")
-                print(f"  분류: {result['classification']}")
-                print(f"  신뢰도: {result['confidence']:.2f}")
-                print(f"  근거: {result['reason']}")
-                print(f"  처리시간: {processing_time:.1f}초")
-                print()
-                classification_results.append({
-                    'group_name': group_name,
-                    'title': title,
-                    'content': content,  # articles의 content 값만 그대로 저장
-                    'url': url,
-                    'classification_result': result['classification'],
-                    'is_saved': 0,  # 또는 False
-                    'confidence_score': result['confidence'],
-                    'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'processing_time': processing_time,
-                    'reason': result['reason']
-                })
+                classified_urls.add(url)
+                pending.append(article)
+
+            in_flight = max(1, max_in_flight or AI_CLASSIFY_MAX_IN_FLIGHT)
+            batch_max = max(1, batch_max_articles or AI_CLASSIFY_BATCH_MAX_ARTICLES)
+            ensure_decided_by_column(conn)
+
+            # 규칙/로컬 모델로 먼저 결정 (결정하지 못한 기사만 LLM에 요청)
+            use_cascade = AI_CLASSIFY_CASCADE if cascade is None else cascade
+            tiers = ClassificationCascade(self.db_path) if use_cascade else None
+            decided = []
+            llm_indexes = list(range(len(pending)))
+            if tiers:
+                llm_indexes = []
+                for index, article in enumerate(pending):
+                    start_time = time.time()
+                    result = tiers.decide(article[1], article[5], keyword, article[4])
+                    if result:
+                        decided.append((index, result, round(time.time() - start_time, 1)))
+                    else:
+                        llm_indexes.append(index)
+
+            # 분류에 넘길 본문 (토큰 예산 안으로 줄인 것, 저장은 원문 그대로)
+            contexts = {index: build_article_context(pending[index][5], keyword, model=self.model) for index in llm_indexes}
+            planned = self._plan_batches([(pending[index][1], contexts[index]) for index in llm_indexes], batch_max)
+            batches = [[llm_indexes[position] for position in batch] for batch in planned]
+            print(f"분류 대상 {len(pending)}건 → 규칙/로컬 모델 결정 {len(decided)}건, LLM 요청 {len(batches)}건 (동시 {in_flight}건)")
+            results_by_index = {}
+            rows = []
+            with ThreadPoolExecutor(max_workers=in_flight, thread_name_prefix='ai-classify') as pool:
+                futures = [
+                    pool.submit(self._classify_batch, [(index, pending[index][1], contexts[index]) for index in batch], keyword)
+                    for batch in batches
+                ]
+                completed = chain(decided, (item for future in as_completed(futures) for item in future.result()))
+                for index, result, processing_time in completed:
+                    article_id, title, url, keyword, group_name, content, created_at, pub_date = pending[index]
+                    decided_by = result.get('decided_by', TIER_LLM)
+                    if tiers and decided_by == TIER_LLM:
+                        tiers.record(TIER_LLM)
+                    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    rows.append((
+                        keyword,
+                        group_name,
+                        title,
+                        content,  # articles의 content 값만 그대로 저장
+                        url,  # 실제 URL 저장
+                        result['classification'],
+                        result['confidence'],
+                        result['reason'],
+                        processing_time,
+                        now,
+                        0,  # is_saved 기본값
+                        decided_by
+                    ))
+                    print(f"기사 ID {article_id} 분류 완료")
+                    print(f"  제목: {title[:50]}...")
+                    print(f"  분류: {result['classification']}")
+                    print(f"  신뢰도: {result['confidence']:.2f}")
+                    print(f"  근거: {result['reason']}")
+                    print(f"  처리시간: {processing_time:.1f}초")
+                    print(f"  결정 단계: {decided_by}")
+                    print()
+                    results_by_index[index] = {
+                        'group_name': group_name,
+                        'title': title,
+                        'content': content,  # articles의 content 값만 그대로 저장
+                        'url': url,
+                        'classification_result': result['classification'],
+                        'is_saved': 0,  # 또는 False
+                        'confidence_score': result['confidence'],
+                        'created_at': now,
+                        'processing_time': processing_time,
+                        'reason': result['reason'],
+                        'decided_by': decided_by
+                    }
+                    # 결과를 모아서 한 트랜잭션에 저장 (중간에 멈춰도 저장된 만큼은 다음 실행에서 건너뜀)
+                    if len(rows) >= AI_CLASSIFY_WRITE_BATCH:
+                        cursor.executemany(INSERT_LOG_SQL, rows)
+                        conn.commit()
+                        rows = []
+            if rows:
+                cursor.executemany(INSERT_LOG_SQL, rows)
+            # 반환 순서는 조회 순서 그대로
+            classification_results = [results_by_index[index] for index in sorted(results_by_index)]
+            cache_stats = self.response_cache.get_stats()
+            print(f"LLM 응답 캐시: 조회 {cache_stats['lookups']}건 중 {cache_stats['hits']}건 재사용")
+            if tiers:
+                tier_stats = tiers.get_stats()
+                print("결정 단계: " + ", ".join(
+                    f"{tier} {data['count']}건 ({data['hit_rate'] * 100:.1f}%)" for tier, data in tier_stats['tiers'].items()
+                ) + f" → LLM 호출 {tier_stats['llm_calls_saved']}건 절약")
             conn.commit()
             conn.close()
             self._print_classification_summary(classification_results, keyword)
@@ -250,6 +547,14 @@ class NewsAIClassifier:
         print(f"평균 신뢰도: {avg_confidence:.2f}")
         print(f"총 처리된 기사: {len(results)}개")
 
+    def get_cascade_statistics(self, keyword: str = None) -> Dict:
+        """결정 단계(규칙/로컬 모델/LLM)별 분류 건수와 비율을 조회합니다."""
+        try:
+            return get_tier_statistics(self.db_path, keyword)
+        except Exception as e:
+            print(f"단계별 통계 조회 중 오류: {e}")
+            return {}
+
     def get_classification_statistics(self, keyword: str = None) -> Dict:
         """분류 통계를 조회합니다."""
         try:
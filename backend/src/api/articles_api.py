@@ -2,6 +2,7 @@ import sqlite3
 import os
 from flask import Blueprint, request, jsonify
 from backend.src.agents.news_ai_classification import NewsAIClassifier
+from backend.src.agents.cascade_classifier import get_tier_statistics
 from datetime import datetime
 
 articles_bp = Blueprint('articles', __name__)
@@ -164,6 +165,16 @@ def get_articles_stats():
     except Exception as e:
         return jsonify({'error': f'통계 조회 중 오류 발생: {str(e)}'}), 500
 
+@articles_bp.route('/articles/classification/tiers', methods=['GET'])
+def get_classification_tiers():
+    """결정 단계(규칙/로컬 모델/LLM)별 분류 건수와 적중률을 조회합니다."""
+    try:
+        keyword = request.args.get('keyword')
+        return jsonify(get_tier_statistics(DB_PATH, keyword))
+        
+    except Exception as e:
+        return jsonify({'error': f'단계별 통계 조회 중 오류 발생: {str(e)}'}), 500
+
 @articles_bp.route('/articles/classify-batch', methods=['POST'])
 def classify_articles_batch():
     """특정 키워드의 기사들을 일괄 분류합니다."""
@@ -1,15 +1,40 @@
 import os
 import re
-import html
 import sqlite3
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, quote
 from flask import Blueprint, request, jsonify
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.http_client import http_client
+from backend.src.services.text_cleaner import clean_text
+from backend.src.services.date_normalizer import article_dates, parse_naver_pub_date
+from backend.src.services.html_extractor import HtmlExtractor
+from backend.src.services.content_selector_store import ContentSelectorStore
+from backend.src.services.article_filter import (
+    filter_by_title, filter_by_body, filter_stats, TITLE_STAGE, BODY_STAGE
+)
+from backend.src.services.collection_cursor import CollectionCursorStore
+from backend.src.services.naver_quota import NaverQuotaManager, QuotaExceededError, NaverThrottledError, NAVER_API_MAX_RETRIES
+from backend.src.services.url_dedup_index import UrlDedupIndex
+from backend.src.services.near_duplicate_index import NearDuplicateIndex
+from backend.src.services.article_writer import ArticleBatchWriter, KeywordGroupCache
+from backend.src.services.fetch_cache import RunFetchCache
+from backend.src.services.collection_pipeline import CollectionPipeline, STATUS_SAVED, STATUS_DUPLICATE
+from backend.src.services.backfill_store import (
+    BackfillStore, BackfillPausedError, STATUS_RUNNING, STATUS_PAUSED, STATUS_DONE, STATUS_FAILED
+)
+from backend.src.services.collection_metrics import (
+    collection_metrics, format_stage_summary, CollectionRunStore,
+    STAGE_SEARCH, STAGE_TITLE_FILTER, STAGE_FETCH, STAGE_PARSE, STAGE_BODY_FILTER, STAGE_CLUSTER, STAGE_DB_WRITE
+)
+
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
@@ -20,9 +45,59 @@ load_dotenv()
 # 네이버 API 설정
 NAVER_CLIENT_ID = os.getenv('NAVER_CLIENT_ID')
 NAVER_CLIENT_SECRET = os.getenv('NAVER_CLIENT_SECRET')
+# 검색 API 주소 (벤치마크 시 로컬 대체 서버 주소로 바꾼다)
+NAVER_API_BASE_URL = os.getenv('NAVER_API_BASE_URL', 'https://openapi.naver.com')
+
+# 수집 동시성 설정
+COLLECTION_KEYWORD_WORKERS = int(os.getenv('COLLECTION_KEYWORD_WORKERS', 4))  # 동시에 검색할 키워드 수
+COLLECTION_FETCH_WORKERS = int(os.getenv('COLLECTION_FETCH_WORKERS', 16))     # 전체 본문 동시 다운로드 수
+COLLECTION_PER_HOST_LIMIT = int(os.getenv('COLLECTION_PER_HOST_LIMIT', 4))    # 언론사(호스트)별 동시 다운로드 수
+
+# 네이버 뉴스 검색 API 한도 (start 최대 1000, display 최대 100)
+NAVER_MAX_START = 1000
+NAVER_MAX_DISPLAY = 100
+# 기간 검색 시 종료일보다 새로운 구간을 건너뛸 때 추정 건너뛰기 수에 곱하는 여유 (넘어가 버리면 한 번 되돌아감)
+DATE_SKIP_SAFETY = 0.8
+
+# 과거 기간 백필 설정 (정기 수집을 방해하지 않도록 천천히, 할당량을 남겨 두고 실행)
+BACKFILL_FETCH_WORKERS = int(os.getenv('BACKFILL_FETCH_WORKERS', 2))              # 본문 동시 다운로드 수
+BACKFILL_PAGE_DELAY = float(os.getenv('BACKFILL_PAGE_DELAY', 2.0))                # 검색 페이지 사이 대기 (초)
+BACKFILL_QUOTA_RESERVE_RATIO = float(os.getenv('BACKFILL_QUOTA_RESERVE_RATIO', 0.5))  # 남은 할당량이 이 비율 아래면 일시 중지
+BACKFILL_PARSE_PROCESSES = int(os.getenv('BACKFILL_PARSE_PROCESSES', -1))  # 백필 중 본문 파싱 프로세스 수 (-1: CPU 코어 수)
 
 # 데이터베이스 설정
-DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'database', 'db.sqlite'))
+# NEWS_DB_PATH로 다른 DB를 지정할 수 있다 (벤치마크/오프라인 테스트용)
+DB_PATH = os.getenv('NEWS_DB_PATH') or os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'database', 'db.sqlite'))
+
+# 키워드별 수집 커서 (증분 수집용)
+cursor_store = CollectionCursorStore(DB_PATH)
+
+# 저장된 기사 URL 중복 검사 인덱스 (앱 시작 시 articles.url로 로드)
+url_index = UrlDedupIndex(DB_PATH)
+
+# 근접 중복(같은 보도자료 재게재) 묶음 색인 - 저장 시 cluster_id 부여
+near_dup_index = NearDuplicateIndex(DB_PATH)
+
+# 키워드 → 그룹명 캐시 (기사마다 keywords 테이블을 조회하지 않음)
+group_cache = KeywordGroupCache(DB_PATH)
+
+# 기사 본문 추출기 (도메인별로 성공한 본문 선택자를 학습해 먼저 시도)
+selector_store = ContentSelectorStore(DB_PATH)
+html_extractor = HtmlExtractor(selector_store=selector_store)
+
+# 네이버 API 호출 속도/일일 할당량 관리 (스케줄러와 모든 엔드포인트가 공유)
+naver_quota = NaverQuotaManager(DB_PATH)
+
+# 수집 실행별 단계 소요 시간 기록 (collection_runs 테이블)
+run_store = CollectionRunStore(DB_PATH)
+
+# 과거 기사 백필 작업/진행 위치
+backfill_store = BackfillStore(DB_PATH)
+
+# 정기 수집 실행 중 표시 (백필은 이 동안 멈춰 기다린다)
+collection_active = threading.Event()
+# 백필 작업은 한 번에 하나만
+backfill_lock = threading.Lock()
 
 # Flask Blueprint 설정
 naver_news_bp = Blueprint('naver_news', __name__)
@@ -44,30 +119,6 @@ DOMAIN_PRESS_MAP = {
 # 데이터 정제 함수들
 # ============================================================================
 
-def clean_text(text):
-    """텍스트 정제 (HTML 태그 제거, NBSP 제거, 공백 정리, psp 제거, ZWNBSP 제거)"""
-    if not text:
-        return ''
-    # HTML 태그 제거
-    text = re.sub(r'<.*?>', '', text)
-    # HTML 엔티티 디코딩
-    text = html.unescape(text)
-    # NBSP 및 특수 공백 문자 제거
-    text = text.replace('&nbsp;', ' ').replace('\xa0', ' ')
-    text = re.sub(r'[\u00A0\u200B\u200C\u200D\uFEFF]', ' ', text)
-    # ZWNBSP(Zero Width No-Break Space) 제거
-    text = text.replace('\uFEFF', '')
-    # ZWNBSP(Zero Width No-Break Space) 추가 제거
-    text = text.replace('\u2060', '')  # WORD JOINER
-    text = text.replace('\u200B', '')  # ZERO WIDTH SPACE
-    text = text.replace('\u200C', '')  # ZERO WIDTH NON-JOINER
-    text = text.replace('\u200D', '')  # ZERO WIDTH JOINER
-    # psp(대소문자 구분 없이) 모두 제거
-    text = re.sub(r'psp', '', text, flags=re.IGNORECASE)
-    # 연속된 공백 정리
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
-
 def clean_press_domain(press):
     """언론사 도메인에서 확장자 제거"""
     if not press:
@@ -83,28 +134,15 @@ def clean_press_domain(press):
     return press.strip()
 
 def format_date(date_str):
-    """날짜 형식을 yyyy-mm-dd HH:MM:SS로 변환"""
+    """날짜 형식을 yyyy-mm-dd HH:MM:SS로 변환 (RFC 2822, ISO, 날짜만, 시간대 없음 순서로 시도, 실패 시 원본)"""
     if not date_str:
         return date_str
     
     try:
-        # RFC 2822 형식 파싱 (예: "Mon, 08 Jul 2025 13:34:51 +0900")
-        date_formats = [
-            "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822
-            "%Y-%m-%d %H:%M:%S",         # ISO 형식
-            "%Y-%m-%d",                  # 날짜만
-            "%d %b %Y %H:%M:%S",         # 시간대 없음
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                return parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                continue
-        
+        # 네이버 pubDate(예: "Mon, 08 Jul 2025 13:34:51 +0900")는 strptime 없이 바로 변환
+        formatted = article_dates.normalize(date_str)
         # 파싱 실패 시 원본 반환
-        return date_str
+        return formatted if formatted is not None else date_str
         
     except Exception as e:
         print(f"날짜 형식 변환 실패: {date_str}, 오류: {e}")
@@ -119,7 +157,11 @@ def get_active_keywords_from_db():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
-    cursor.execute("SELECT keyword, group_name FROM keywords WHERE is_active = 1")
+    # 할당량이 부족할 때 자사 키워드가 먼저 호출되도록 자사 키워드를 앞에 둔다
+    cursor.execute("""
+        SELECT keyword, group_name FROM keywords WHERE is_active = 1
+        ORDER BY CASE WHEN type = '자사' THEN 0 ELSE 1 END
+    """)
     keywords_data = cursor.fetchall()
     
     conn.close()
@@ -137,82 +179,53 @@ def extract_press_from_url(originallink):
     return domain
 
 def extract_article_content(url):
-    """기사 본문 추출"""
+    """기사 본문 추출 (도메인별 학습된 선택자 우선, HTML 파싱은 설정에 따라 프로세스 풀에서 실행)"""
+    domain = extract_press_from_url(url)
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        if 'news.naver.com' in url:
-            content_selectors = [
-                '#articleBody',
-                '#articleBodyContents',
-                '.article_body',
-                '#content',
-                '.news_end',
-            ]
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
-                if content_element:
-                    for unwanted in content_element.select('script, style, .reporter_area, .copyright, .link_news'):
-                        unwanted.decompose()
-                    content = content_element.get_text(strip=True)
-                    if content and len(content) > 100:
-                        return clean_text(content)
-        
-        general_selectors = [
-            'article',
-            '.article-content',
-            '.news-content',
-            '.content',
-            '.post-content',
-            '.entry-content',
-            'main',
-            '.main-content'
-        ]
-        for selector in general_selectors:
-            content_elements = soup.select(selector)
-            for element in content_elements:
-                for unwanted in element.select('script, style, nav, header, footer, .advertisement, .sidebar'):
-                    unwanted.decompose()
-                content = element.get_text(strip=True)
-                if content and len(content) > 200:
-                    return clean_text(content)
-        
-        body = soup.find('body')
-        if body:
-            for unwanted in body.select('script, style, nav, header, footer, .advertisement, .sidebar, .comment'):
-                unwanted.decompose()
-            content = body.get_text(strip=True)
-            if content and len(content) > 300:
-                return clean_text(content)
-        
-        return ""
+        # User-Agent, gzip, keep-alive 헤더는 공용 클라이언트 기본값 사용
+        with collection_metrics.timed(STAGE_FETCH, domain=domain):
+            response = http_client.get(url, timeout=10)
+            response.raise_for_status()
+        with collection_metrics.timed(STAGE_PARSE, domain=domain):
+            return html_extractor.extract(response.content, url, domain=domain)
     except Exception:
         return ""
 
-def save_article_to_db(article, keyword):
-    """기사를 데이터베이스에 저장 (정제 포함)"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+def check_title_stage(article, keyword):
+    """1단계(제목) 필터 적용 - 통과하면 True (제외 시 본문을 내려받지 않는다)"""
+    with collection_metrics.timed(STAGE_TITLE_FILTER, keyword=keyword):
+        title = clean_text(article.get('title', ''))
+        description = clean_text(article.get('description', ''))
+        rejection = filter_by_title(title, description, keyword)
+    filter_stats.record(TITLE_STAGE, rejection[0] if rejection else None)
+    if rejection:
+        print(rejection[1])
+        return False
+    return True
+
+def save_article_to_db(article, keyword, content=None, writer=None):
+    """기사를 데이터베이스에 저장 (정제 포함)
+
+    제목 필터를 먼저 적용해 제외될 기사는 본문을 내려받지 않는다.
+    content가 주어지면 (수집 엔진에서 제목 필터 통과 후 미리 병렬로 추출한 경우)
+    제목 필터와 본문 추출을 다시 하지 않는다.
+    writer(ArticleBatchWriter)가 주어지면 바로 INSERT 하지 않고 일괄 저장 버퍼에 넣는다.
+    """
+    # 중복 URL 검사 (메모리 인덱스, DB 조회 없음)
+    if url_index.contains(article['link']):
+        return False
     
-    # 그룹명 조회
-    cursor.execute("SELECT group_name FROM keywords WHERE keyword=? AND is_active=1", (keyword,))
-    row = cursor.fetchone()
-    group_name = row[0] if row else None
+    # 그룹명 조회 (캐시)
+    group_name = group_cache.get(keyword)
     
-    # 중복 URL 검사
-    cursor.execute("SELECT id FROM articles WHERE url = ?", (article['link'],))
-    if cursor.fetchone():
-        conn.close()
-        return False
+    # 1단계: 제목/요약 기반 필터 (본문 다운로드 전)
+    if content is None:
+        if not check_title_stage(article, keyword):
+            return False
+        content = extract_article_content(article.get('link', ''))
     
     # 원본 데이터 추출
     title = clean_text(article.get('title', ''))
-    content = extract_article_content(article.get('link', ''))
     press = extract_press_from_url(article.get('originallink', ''))
     pub_date = article.get('pubDate', '')
     
@@ -221,82 +234,43 @@ def save_article_to_db(article, keyword):
     press = clean_press_domain(press)
     pub_date = format_date(pub_date)
     
-    # 제목이 모두 영문인지 확인 (한글이 하나도 없으면 제외)
-    if title and not re.search(r'[가-힣]', title):
-        # 영문, 숫자, 특수문자만 있는지 확인
-        if re.search(r'[A-Za-z]', title):
-            print(f"🔤 [필터] 영문 제목 기사 제외: {title[:40]} ...")
-            conn.close()
-            return False
-    
-    # 야구 관련 키워드 리스트
-    baseball_terms = [
-        '이정후', '김하성', '이닝', '실점', '투수', '타자', '홈런', '야구', 'KBO', '삼진', '타율', '도루',
-        '포수', '마운드', '경기', '선발', '불펜', '타점', '득점', '안타', '볼넷', '스트라이크',
-        '포스트시즌', '월드시리즈', '메이저리그', 'MLB', '구단', '감독', '코치', '선수', '타순',
-        '타격', '수비', '연봉', '이적', '트레이드', '시범경기', '플레이오프', '클린업', '사구', '홈플레이트',
-        '외야수', '내야수', '주루', '슬라이딩', '사이드암', '언더핸드', '좌완', '우완', '완투', '완봉', '노히트', '노런'
-    ]
-
-    # MLB/엠엘비 + 야구 기사 필터링
-    if keyword in ['MLB', '엠엘비']:
-        if any(term in title for term in baseball_terms) or any(term in content for term in baseball_terms):
-            print(f"⚾️ [필터] MLB/엠엘비 키워드 야구 기사 제외: {title[:40]} ...")
-            conn.close()
-            return False
+    # 2단계: 본문 기반 필터
+    with collection_metrics.timed(STAGE_BODY_FILTER, keyword=keyword):
+        rejection = filter_by_body(title, content, keyword)
+    filter_stats.record(BODY_STAGE, rejection[0] if rejection else None)
+    if rejection:
+        print(rejection[1])
+        return False
     
-    # F&F 키워드 특별 필터링
-    if keyword == 'F&F':
-        # 1. 제목이나 본문에 실제로 F&F가 없는 기사 필터링 (네이버 API 오탐지 방지)
-        if 'F&F' not in title and 'F&F' not in content and 'f&f' not in title.lower() and 'f&f' not in content.lower():
-            print(f"🔍 [필터] F&F 키워드 오탐지 기사 제외: {title[:40]} ... (제목/본문에 F&F 없음)")
-            conn.close()
+    # 일괄 저장 (다른 키워드 스레드가 같은 URL을 먼저 저장했으면 건너뜀)
+    if writer is not None:
+        if not url_index.add_if_new(article.get('link', '')):
             return False
-        
-        # 2. 지주사 관련주 나열 기사 필터링
-        if '(지주사 관련주)' in content or '지주사 관련주' in content:
-            # 홀딩스/지주 관련 기업명 리스트
-            holding_companies = [
-                '홀딩스', '지주', '대상홀딩스', '한화', '하나금융지주', 'GRT', '한진중공업홀딩스', 
-                '로스웰', '성창기업지주', '평화홀딩스', 'BNK금융지주', '우리산업홀딩스', '휴맥스홀딩스',
-                '비츠로테크', '네오위즈홀딩스', '부방', '한국콜마홀딩스', '디와이', '한미사이언스',
-                'LS전선아시아', '컴투스홀딩스', 'JB금융지주', '솔본', '글로벌에스엠', '엘브이엠씨홀딩스',
-                'KB금융', 'DGB금융지주', '슈프리마에이치큐', 'KC그린홀딩스', 'CNH', 'BGF', '풀무원',
-                '일동홀딩스', '신송홀딩스', '오가닉티코스메틱', '녹십자홀딩스', '신한지주', '우리금융지주',
-                'APS', '휴온스글로벌', '덕산하이메탈', '이지홀딩스', '일진홀딩스', '윙입푸드', '오리온홀딩스',
-                'CR홀딩스', 'SK디스커버리', '코아시아', 'DRB동일', '골든센츄리', '웅진', '롯데지주',
-                '코오롱', '동국홀딩스', '메리츠금융지주', '해성산업', '제일파마홀딩스', 'LG', 'AJ네트웍스',
-                'HDC', '에코프로', '경동인베스트', 'GS', 'SJM홀딩스', '유수홀딩스', '서연',
-                '유비쿼스홀딩스', '샘표', '삼성물산', '이건홀딩스', '이녹스', '금호건설', '동아쏘시오홀딩스',
-                '대덕', '아세아', 'LX홀딩스', '대웅', '솔브레인홀딩스', '동성케미컬', '효성', 'HD현대',
-                '풍산홀딩스', 'NICE', '삼양홀딩스', 'SK스퀘어', '한세예스24홀딩스', 'KPX홀딩스',
-                '한솔홀딩스', '그래디언트', '심텍홀딩스', 'CS홀딩스', 'F&F홀딩스', '영원무역홀딩스',
-                '골프존뉴딘홀딩스', '하이트진로홀딩스', '노루홀딩스', 'KISCO홀딩스', 'AK홀딩스', 'DB',
-                '예스코홀딩스', '코스맥스비티아이', '아이디스홀딩스', '농심홀딩스', '진양홀딩스', '두산밥캣', '헝셍그룹'
-            ]
-            
-            # 본문에서 홀딩스/지주 관련 기업명이 5개 이상 언급되면 필터링
-            holding_count = sum(1 for company in holding_companies if company in content)
-            if holding_count >= 5:
-                print(f"🏢 [필터] F&F 키워드 지주사 관련주 나열 기사 제외: {title[:40]} ... (홀딩스 관련 기업 {holding_count}개 언급)")
-                conn.close()
-                return False
+        with collection_metrics.timed(STAGE_CLUSTER, keyword=keyword):
+            simhash, cluster_id = near_dup_index.assign(title, content)
+        # 버퍼가 차면 add 안에서 커밋까지 한다
+        with collection_metrics.timed(STAGE_DB_WRITE, keyword=keyword):
+            writer.add((keyword, group_name, title, content, press, pub_date, article.get('link', ''), simhash, cluster_id))
+        return True
     
     # 데이터베이스에 저장
-    cursor.execute("""
-        INSERT INTO articles (keyword, group_name, title, content, press, pub_date, url)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (
-        keyword,
-        group_name,
-        title,
-        content,
-        press,
-        pub_date,
-        article.get('link', '')
-    ))
-    conn.commit()
+    with collection_metrics.timed(STAGE_CLUSTER, keyword=keyword):
+        simhash, cluster_id = near_dup_index.assign(title, content)
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            INSERT INTO articles (keyword, group_name, title, content, press, pub_date, url, simhash, cluster_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (keyword, group_name, title, content, press, pub_date, article.get('link', ''), simhash, cluster_id))
+        conn.commit()
+    except sqlite3.IntegrityError:
+        # 인덱스 로드 이후 다른 프로세스가 저장한 URL
+        url_index.add(article.get('link', ''))
+        conn.close()
+        return False
     conn.close()
+    url_index.add(article.get('link', ''))
     return True
 
 # ============================================================================
@@ -304,8 +278,15 @@ def save_article_to_db(article, keyword):
 # ============================================================================
 
 def search_naver_news(keyword, display=10, start=1, sort='date', start_date=None, end_date=None):
-    """네이버 뉴스 API 검색"""
-    url = 'https://openapi.naver.com/v1/search/news.json'
+    """네이버 뉴스 API 검색
+
+    429(속도 제한) 응답은 속도를 낮추고 잠시 기다렸다가 같은 start로 다시 요청한다.
+
+    Raises:
+        QuotaExceededError: 일일 할당량이 부족한 경우
+        NaverThrottledError: NAVER_API_MAX_RETRIES번 재시도해도 429가 계속된 경우
+    """
+    url = f'{NAVER_API_BASE_URL}/v1/search/news.json'
     headers = {
         'X-Naver-Client-Id': NAVER_CLIENT_ID,
         'X-Naver-Client-Secret': NAVER_CLIENT_SECRET
@@ -321,105 +302,183 @@ def search_naver_news(keyword, display=10, start=1, sort='date', start_date=None
     }
     
     print(f"[DEBUG] 네이버 뉴스 API 요청 쿼리: {keyword} → {search_query_encoded}")
-    response = requests.get(url, headers=headers, params=params)
+    for attempt in range(NAVER_API_MAX_RETRIES + 1):
+        # 할당량 확인 및 속도 제한 (부족하면 QuotaExceededError)
+        naver_quota.acquire(keyword)
+        with collection_metrics.timed(STAGE_SEARCH, keyword=keyword):
+            response = http_client.get(url, headers=headers, params=params)
+        if response.status_code != 429:
+            naver_quota.report_success()
+            break
+        # 429 응답 본문에는 items가 없으므로 결과로 돌려주면 검색 끝으로 오인된다
+        naver_quota.report_throttled()
+        if attempt == NAVER_API_MAX_RETRIES:
+            raise NaverThrottledError(
+                f"네이버 API 속도 제한(429)이 {NAVER_API_MAX_RETRIES}번 재시도 후에도 계속됨 (키워드 '{keyword}', start={start})"
+            )
+        delay = naver_quota.throttle_delay(attempt, response.headers.get('Retry-After'))
+        print(f"    ⏳ 네이버 API 속도 제한(429) - {delay:.1f}초 후 start={start} 다시 요청")
+        time.sleep(delay)
     result = response.json()
     
     # 날짜 필터링 (필요시)
     if start_date and end_date and 'items' in result:
-        filtered_items = []
-        for article in result['items']:
-            pub_date_str = article.get('pubDate', '')
-            if pub_date_str:
-                try:
-                    pub_date = datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %z')
-                    pub_date_local = pub_date.replace(tzinfo=None)
-                    if start_date <= pub_date_local <= end_date:
-                        filtered_items.append(article)
-                except ValueError:
-                    continue
+        filtered_items = filter_by_date_range(result['items'], start_date, end_date)
         result['items'] = filtered_items
         result['total'] = len(filtered_items)
     
     return result
 
-def search_naver_news_all_pages(keyword, start_date=None, end_date=None):
-    """페이지 끝까지 최대 100개 기사만 검색하는 함수"""
-    all_articles = []
+def filter_by_date_range(articles, start_date, end_date):
+    """발행 시각이 start_date ~ end_date 안인 기사만 (발행 시각을 알 수 없는 기사는 제외)"""
+    filtered_items = []
+    for article in articles:
+        pub_date_local = parse_naver_pub_date(article.get('pubDate', ''))
+        if pub_date_local and start_date <= pub_date_local <= end_date:
+            filtered_items.append(article)
+    return filtered_items
+
+def get_page_date_span(articles):
+    """페이지 기사들의 (가장 최신, 가장 오래된) 발행 시각 (알 수 없으면 (None, None))"""
+    pub_dates = [d for d in (parse_naver_pub_date(article.get('pubDate', '')) for article in articles) if d]
+    if not pub_dates:
+        return None, None
+    return max(pub_dates), min(pub_dates)
+
+def find_date_range_start(keyword, end_date):
+    """날짜순 검색 결과에서 end_date 이전 기사가 시작되는 start 위치 찾기
+
+    첫 페이지의 기사 발행 간격으로 종료일까지 남은 건수를 추정해 그만큼 건너뛰므로,
+    최근 기사가 많은 키워드의 과거 기간 검색도 페이지를 하나씩 넘기지 않는다.
+    건너뛴 위치가 이미 종료일을 지나쳤으면 마지막으로 확인한 위치로 되돌아간다.
+
+    Returns:
+        (start 위치, 그 위치에서 받은 페이지 기사 목록 또는 None) - 범위에 닿을 수 없으면 (None, None)
+    """
+    start = 1
+    low = 1  # 이 위치 앞의 기사는 모두 종료일보다 새롭다
+    while start <= NAVER_MAX_START:
+        result = search_naver_news(keyword, display=NAVER_MAX_DISPLAY, start=start, sort='date')
+        articles = result.get('items', [])
+        if not articles:
+            return None, None
+        newest, oldest = get_page_date_span(articles)
+        if oldest is None or oldest <= end_date:
+            if start > low and newest is not None and newest <= end_date:
+                # 너무 멀리 건너뜀 - 경계는 [low, start) 사이에 있다
+                print(f"    ↩️ 기간 시작 위치를 지나쳐 start={low}부터 다시 확인합니다.")
+                return low, None
+            return start, articles
+        low = start + len(articles)
+        if low > NAVER_MAX_START:
+            break
+        # 페이지의 발행 간격으로 종료일까지 남은 기사 수 추정
+        span_seconds = max(1.0, (newest - oldest).total_seconds())
+        gap_seconds = (oldest - end_date).total_seconds()
+        skip = int(gap_seconds * len(articles) / span_seconds * DATE_SKIP_SAFETY)
+        start = min(low + skip, NAVER_MAX_START)
+        if start > low:
+            print(f"    ⏩ 종료일보다 새로운 기사 {start - low}건 건너뛰기 (start={start}, 페이지 최오래 {oldest})")
+    print(f"    ⚠️ 검색 가능한 최근 {NAVER_MAX_START}건 안에 기간에 해당하는 기사가 없습니다.")
+    return None, None
+
+def iter_naver_news_pages(keyword, start_date=None, end_date=None, cursor=None, max_articles=100):
+    """검색 결과를 페이지 단위로 내놓는 제너레이터 (최대 max_articles개)
+
+    소비하는 쪽이 다음 페이지를 요청할 때만 API를 호출하므로, 중간에 멈추면 남은 페이지는 검색하지 않는다.
+    cursor(키워드별 수집 커서)가 주어지면 커서보다 오래된 기사가 나오는 즉시 페이지 요청을 멈추고,
+    첫 페이지 display 크기를 최근 신규 기사 수에 맞춰 줄인다.
+    start_date/end_date가 주어지면 결과가 날짜순이라는 점을 이용해 종료일보다 새로운 구간은 건너뛰고,
+    시작일보다 오래된 기사가 나온 페이지에서 검색을 멈춘다.
+    """
+    collected = 0
     page = 1
-    display = 100  # 한 번에 100개씩 가져오기
+    date_range = bool(start_date and end_date)
+    pending_articles = None  # 기간 시작 위치를 찾으면서 이미 받은 페이지
 
     print(f"    🔍 키워드 '{keyword}' 크롤링 시작")
-    print(f"    📄 페이지별 검색 시작...")
-
-    while len(all_articles) < 100:
-        start_index = (page - 1) * display + 1
+    if date_range:
         try:
-            result = search_naver_news(keyword, display=display, start=start_index, sort='date', 
-                                     start_date=start_date, end_date=end_date)
-            articles = result.get('items', [])
-            if not articles:
-                print(f"    📄 페이지 {page}: 더 이상 기사가 없습니다. (총 {len(all_articles)}개 기사 수집 완료)")
+            start_index, pending_articles = find_date_range_start(keyword, end_date)
+        except (QuotaExceededError, NaverThrottledError) as e:
+            print(f"    ⛔ {e}")
+            raise
+        except Exception as e:
+            print(f"    ❌ 기간 시작 위치 검색 중 오류: {e}")
+            return
+        if start_index is None:
+            print(f"    📊 키워드 '{keyword}' 크롤링 완료. 기간 내 기사 없음")
+            return
+        display = NAVER_MAX_DISPLAY
+    else:
+        start_index = 1
+        display = CollectionCursorStore.suggest_display(cursor)  # 커서가 없으면 한 번에 100개씩
+    print(f"    📄 페이지별 검색 시작... (display={display}, start={start_index})")
+
+    while collected < max_articles and start_index <= NAVER_MAX_START:
+        if pending_articles is not None:
+            articles, pending_articles = pending_articles, None
+        else:
+            try:
+                result = search_naver_news(keyword, display=display, start=start_index, sort='date')
+            except QuotaExceededError as e:
+                print(f"    ⛔ {e}")
+                # 한 건도 못 가져왔으면 실패한 키워드로 집계되도록 그대로 올린다
+                if not collected:
+                    raise
                 break
-            # 남은 수만큼만 추가
-            remain = 100 - len(all_articles)
-            all_articles.extend(articles[:remain])
-            print(f"    📄 페이지 {page}: {len(articles[:remain])}개 기사 검색 (start={start_index})")
-            time.sleep(0.1)
-            page += 1
-            if len(all_articles) >= 100:
-                print(f"    ⚠️ 최대 수집 한도(100개)에 도달했습니다.")
+            except NaverThrottledError as e:
+                # 결과 끝으로 처리하면 남은 페이지를 놓치므로 실패한 키워드로 올린다 (커서도 전진하지 않음)
+                print(f"    ⛔ {e}")
+                raise
+            except Exception as e:
+                print(f"    ❌ 페이지 {page} 검색 중 오류: {e}")
                 break
-        except Exception as e:
-            print(f"    ❌ 페이지 {page} 검색 중 오류: {e}")
+            articles = result.get('items', [])
+        if not articles:
+            print(f"    📄 페이지 {page}: 더 이상 기사가 없습니다. (총 {collected}개 기사 수집 완료)")
             break
-    print(f"    📊 키워드 '{keyword}' 크롤링 완료. 총 {len(all_articles)}개 기사 검색")
-    return all_articles
+        # 기간 검색: 이 페이지에 시작일보다 오래된 기사가 있으면 다음 페이지부터는 모두 기간 밖
+        reached_start_date = False
+        if date_range:
+            _, oldest = get_page_date_span(articles)
+            reached_start_date = oldest is not None and oldest < start_date
+            articles = filter_by_date_range(articles, start_date, end_date)
+        # 커서(이전 수집의 최신 기사) 이후의 기사만 사용
+        reached_cursor = False
+        if cursor:
+            for i, article in enumerate(articles):
+                if CollectionCursorStore.is_behind(article, cursor):
+                    articles = articles[:i]
+                    reached_cursor = True
+                    break
+        # 남은 수만큼만 내보낸다
+        articles = articles[:max_articles - collected]
+        collected += len(articles)
+        print(f"    📄 페이지 {page}: {len(articles)}개 기사 검색 (start={start_index})")
+        if articles:
+            yield articles
+        if reached_cursor:
+            print(f"    ⏹️ 이전 수집 위치에 도달했습니다. (커서: {cursor['last_pub_date']})")
+            break
+        if reached_start_date:
+            print(f"    ⏹️ 검색 기간 시작일({start_date}) 이전 기사에 도달했습니다.")
+            break
+        page += 1
+        start_index += display
+        # 작은 페이지가 모두 신규였다면 남은 구간은 최대 크기로 요청
+        display = NAVER_MAX_DISPLAY
+        if collected >= max_articles:
+            print(f"    ⚠️ 최대 수집 한도({max_articles}개)에 도달했습니다.")
+            break
+    print(f"    📊 키워드 '{keyword}' 크롤링 완료. 총 {collected}개 기사 검색")
 
-def filter_and_save_articles(articles, keyword):
-    """기사들을 필터링하고 저장하는 함수"""
-    filtered_articles = []
-    saved_count = 0
-    skipped_count = 0
-    duplicate_count = 0
-    
-    for article in articles:
-        title = clean_text(article.get('title', ''))
-        url = article.get('link', '')
-        
-        # URL 기반 중복 체크
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM articles WHERE url = ?", (url,))
-        is_duplicate = cursor.fetchone() is not None
-        conn.close()
-        
-        if is_duplicate:
-            duplicate_count += 1
-            filtered_articles.append({
-                'title': title,
-                'url': url,
-                'status': 'duplicate',
-                'reason': 'URL 중복'
-            })
-            continue
-        
-        # 본문 추출 및 DB 저장
-        if save_article_to_db(article, keyword):
-            saved_count += 1
-            filtered_articles.append({
-                'title': title,
-                'url': url,
-                'status': 'saved'
-            })
-        else:
-            skipped_count += 1
-    
-    return {
-        'saved_count': saved_count,
-        'skipped_count': skipped_count,
-        'duplicate_count': duplicate_count,
-        'filtered_articles': filtered_articles
-    }
+def search_naver_news_all_pages(keyword, start_date=None, end_date=None, cursor=None):
+    """페이지 끝까지 최대 100개 기사만 검색하는 함수 (전체 목록이 필요할 때만 사용)"""
+    all_articles = []
+    for articles in iter_naver_news_pages(keyword, start_date=start_date, end_date=end_date, cursor=cursor):
+        all_articles.extend(articles)
+    return all_articles
 
 # ============================================================================
 # Flask API 엔드포인트들
@@ -447,8 +506,11 @@ def news_search():
         except ValueError:
             return jsonify({'error': '날짜 형식 오류 (YYYY-MM-DD)'}), 400
     
-    result = search_naver_news(keyword, display=display, start=start, sort=sort, 
-                              start_date=parsed_start_date, end_date=parsed_end_date)
+    try:
+        result = search_naver_news(keyword, display=display, start=start, sort=sort, 
+                                  start_date=parsed_start_date, end_date=parsed_end_date)
+    except (QuotaExceededError, NaverThrottledError) as e:
+        return jsonify({'error': str(e)}), 429
     return jsonify(result)
 
 @naver_news_bp.route('/news/search_all_pages', methods=['POST'])
@@ -471,14 +533,14 @@ def search_all_pages():
         except ValueError:
             return jsonify({'error': '날짜 형식 오류 (YYYY-MM-DD)'}), 400
     
-    # 페이지 끝까지 모든 기사 검색
-    articles = search_naver_news_all_pages(keyword, start_date=parsed_start_date, end_date=parsed_end_date)
-    
-    # 필터링 및 저장
-    filter_result = filter_and_save_articles(articles, keyword)
+    # 검색과 필터링/저장을 스트리밍 파이프라인으로 동시에 진행
+    try:
+        filter_result = collect_articles_streaming(keyword, start_date=parsed_start_date, end_date=parsed_end_date)
+    except (QuotaExceededError, NaverThrottledError) as e:
+        return jsonify({'error': str(e)}), 429
     return jsonify({
         'message': f'{filter_result["saved_count"]}건 저장 완료', 
-        'total': len(articles), 
+        'total': filter_result["total"], 
         'saved': filter_result["saved_count"],
         'skipped': filter_result["skipped_count"],
         'duplicate': filter_result["duplicate_count"],
@@ -486,13 +548,175 @@ def search_all_pages():
         'date_range': f"{start_date} ~ {end_date}" if start_date and end_date else "전체 기간"
     })
 
+@naver_news_bp.route('/news/quota', methods=['GET'])
+def news_quota():
+    """네이버 API 오늘 사용량 및 남은 할당량"""
+    return jsonify(naver_quota.get_usage())
+
+@naver_news_bp.route('/news/filter_stats', methods=['GET'])
+def news_filter_stats():
+    """단계별 필터 제외 통계 (제목 필터로 절약한 본문 다운로드 수 포함)"""
+    return jsonify(filter_stats.snapshot())
+
+@naver_news_bp.route('/news/selector_stats', methods=['GET'])
+def news_selector_stats():
+    """도메인별 학습된 본문 선택자와 적중률"""
+    return jsonify(selector_store.get_stats())
+
+@naver_news_bp.route('/news/http_pool_stats', methods=['GET'])
+def http_pool_stats():
+    """공용 HTTP 커넥션 풀 통계 (재사용률, 열린 커넥션 수)"""
+    return jsonify(http_client.get_pool_stats())
+
+@naver_news_bp.route('/news/backfill', methods=['POST'])
+def create_backfill():
+    """과거 기간 백필 작업 생성 후 백그라운드에서 실행 (진행 위치를 기록하므로 중단되어도 이어서 수집)"""
+    data = request.get_json() or {}
+    keywords = data.get('keywords') or []
+    start_date = data.get('start_date')
+    end_date = data.get('end_date')
+    if not keywords or not start_date or not end_date:
+        return jsonify({'error': 'keywords, start_date, end_date 필요'}), 400
+    try:
+        if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
+            return jsonify({'error': '시작일이 종료일보다 늦습니다.'}), 400
+    except ValueError:
+        return jsonify({'error': '날짜 형식 오류 (YYYY-MM-DD)'}), 400
+    job_id = backfill_store.create_job(keywords, start_date, end_date)
+    threading.Thread(target=run_backfill, args=(job_id,), name=f'news-backfill-{job_id}', daemon=True).start()
+    return jsonify({'job_id': job_id, 'status': 'started'}), 202
+
+@naver_news_bp.route('/news/backfill/<int:job_id>', methods=['GET'])
+def backfill_status(job_id):
+    """백필 작업 상태와 키워드별 진행 위치"""
+    job = backfill_store.get_job(job_id)
+    if not job:
+        return jsonify({'error': '백필 작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job)
+
+@naver_news_bp.route('/news/collection_runs/latest', methods=['GET'])
+def latest_collection_run():
+    """최근 정기 수집 실행의 단계별/키워드별/언론사별 소요 시간"""
+    runs = run_store.latest()
+    if not runs:
+        return jsonify({'error': '수집 실행 기록이 없습니다.'}), 404
+    return jsonify(runs[0])
+
 # ============================================================================
 # 정식 업무 수행 함수들
 # ============================================================================
 
-def run_news_collection():
-    """뉴스 수집 업무 실행 (스케줄러에서 호출)"""
+class HostConcurrencyLimiter:
+    """호스트(언론사 도메인)별 동시 요청 수 제한"""
+
+    def __init__(self, per_host_limit):
+        self.per_host_limit = max(1, per_host_limit)
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._semaphores[host]
+
+    def fetch(self, url):
+        """호스트별 제한을 지키면서 기사 본문 추출"""
+        with self._get_semaphore(url):
+            return extract_article_content(url)
+
+def run_keyword_pipeline(keyword, writer, host_limiter, fetch_workers, start_date=None, end_date=None,
+                         cursor=None, stop_at_duplicate=False, on_result=None, fetch_cache=None):
+    """키워드 하나를 스트리밍 파이프라인으로 수집 (검색 → 중복 제거 → 제목 필터 → 본문 다운로드 → 본문 필터/저장)
+
+    단계 사이를 크기가 정해진 큐로 연결하므로 검색 결과 전체를 메모리에 들고 있지 않고,
+    앞 페이지 기사가 저장되는 동안 다음 페이지를 검색한다.
+    fetch_cache(RunFetchCache)가 주어지면 다른 키워드가 이미 내려받은 기사 본문을 재사용한다.
+
+    Returns:
+        dict: 단계별 처리 건수 (searched, duplicates, title_filtered, fetched, saved, skipped, first_article 등)
+    """
+    fetch = (lambda url: fetch_cache.get_or_fetch(url, host_limiter.fetch)) if fetch_cache else host_limiter.fetch
+
+    def fetch_for_keyword(url):
+        # 본문 다운로드/파싱 시간을 이 키워드에도 귀속
+        with collection_metrics.keyword_context(keyword):
+            return fetch(url)
+
+    pipeline = CollectionPipeline(
+        pages=iter_naver_news_pages(keyword, start_date=start_date, end_date=end_date, cursor=cursor),
+        find_existing=url_index.find_existing,
+        passes_title=lambda article: check_title_stage(article, keyword),
+        fetch=fetch_for_keyword,
+        save=lambda article, content: save_article_to_db(article, keyword, content=content, writer=writer),
+        fetch_workers=fetch_workers,
+        stop_at_duplicate=stop_at_duplicate,
+        on_result=on_result
+    )
+    return pipeline.run()
+
+def collect_articles_streaming(keyword, start_date=None, end_date=None):
+    """키워드 수집 후 기사별 결과 요약 반환 (API 응답용, 저장/중복 기사만 목록에 담는다)"""
+    filtered_articles = []
+
+    def on_result(article, status):
+        if status == STATUS_SAVED:
+            filtered_articles.append({'title': clean_text(article.get('title', '')), 'url': article.get('link', ''), 'status': 'saved'})
+        elif status == STATUS_DUPLICATE:
+            filtered_articles.append({'title': clean_text(article.get('title', '')), 'url': article.get('link', ''), 'status': 'duplicate', 'reason': 'URL 중복'})
+
+    writer = ArticleBatchWriter(DB_PATH)
+    try:
+        stats = run_keyword_pipeline(
+            keyword, writer, HostConcurrencyLimiter(COLLECTION_PER_HOST_LIMIT), COLLECTION_FETCH_WORKERS,
+            start_date=start_date, end_date=end_date, on_result=on_result
+        )
+    finally:
+        writer.close()
+        selector_store.flush()
+    return {
+        'total': stats['searched'],
+        'saved_count': writer.pop_written(keyword),
+        'skipped_count': stats['skipped'] + stats['title_filtered'],
+        'duplicate_count': stats['duplicates'],
+        'filtered_articles': filtered_articles,
+        'pipeline_stats': stats
+    }
+
+def collect_keyword(keyword, host_limiter, writer, fetch_workers, fetch_cache=None):
+    """키워드 하나를 검색하고 신규 기사를 파이프라인으로 저장
+
+    Returns:
+        (검색된 기사 수, 저장된 기사 수)
+    """
+    print(f"\n🔍 키워드 '{keyword}' 처리 중...")
+    cursor = cursor_store.get(keyword)
+    # 날짜순 결과에서 첫 중복 URL 이후는 이미 수집한 구간이므로 검색도 멈춘다
+    stats = run_keyword_pipeline(keyword, writer, host_limiter, fetch_workers, cursor=cursor,
+                                 stop_at_duplicate=True, fetch_cache=fetch_cache)
+
+    # 이 키워드의 기사가 모두 커밋된 뒤에만 커서를 전진시킨다 (중간 실패 시 다음 실행에서 다시 수집)
+    with collection_metrics.timed(STAGE_DB_WRITE, keyword=keyword):
+        writer.flush()
+    # 저장 수는 실제로 INSERT된 행만 (다른 프로세스가 먼저 저장해 무시된 행 제외)
+    saved = writer.pop_written(keyword)
+    print(f"  📊 '{keyword}' 검색 결과: {stats['searched']}개 기사, 중복 {stats['duplicates']}개, 저장 {saved}개")
+    cursor_store.update(keyword, stats['first_article'], stats['searched'])
+    return stats['searched'], saved
+
+def run_news_collection(keyword_workers=None, fetch_workers=None, per_host_limit=None):
+    """뉴스 수집 업무 실행 (스케줄러에서 호출)
+
+    키워드 검색은 keyword_workers 개의 스레드에서 동시에, 기사 본문 추출은 키워드 파이프라인들이
+    fetch_workers 개를 나눠 쓰면서 언론사별 per_host_limit 제한을 두고 병렬로 실행한다.
+    """
+    keyword_workers = keyword_workers or COLLECTION_KEYWORD_WORKERS
+    fetch_workers = fetch_workers or COLLECTION_FETCH_WORKERS
+    per_host_limit = per_host_limit or COLLECTION_PER_HOST_LIMIT
+
     print(f"🚀 뉴스 수집 업무 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⚙️ 동시성 설정: 키워드 {keyword_workers}개, 본문 {fetch_workers}개, 언론사별 {per_host_limit}개")
     if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
         print("❌ 네이버 API 키가 설정되지 않았습니다.")
         return {
@@ -521,53 +745,99 @@ def run_news_collection():
             'total_articles': 0,
             'saved_articles': 0
         }
+    started_at = datetime.now()
     total_articles = 0
     saved_articles = 0
     failed_keywords = []
-    for keyword in active_keywords:
-        print(f"\n🔍 키워드 '{keyword}' 처리 중...")
+    filter_stats.reset()
+    collection_metrics.reset()
+    group_cache.invalidate()
+    host_limiter = HostConcurrencyLimiter(per_host_limit)
+    writer = ArticleBatchWriter(DB_PATH)
+    # 여러 키워드가 같은 기사를 찾아도 본문은 실행당 한 번만 내려받는다
+    fetch_cache = RunFetchCache()
+    # 동시에 도는 키워드 파이프라인들이 본문 다운로드 스레드를 나눠 쓴다
+    fetch_workers_per_keyword = max(1, fetch_workers // keyword_workers)
+    collection_active.set()
+    try:
+        with ThreadPoolExecutor(max_workers=keyword_workers, thread_name_prefix='news-keyword') as keyword_pool:
+            keyword_futures = {
+                keyword: keyword_pool.submit(
+                    collect_keyword, keyword, host_limiter, writer, fetch_workers_per_keyword, fetch_cache
+                )
+                for keyword in active_keywords
+            }
+            for keyword, future in keyword_futures.items():
+                try:
+                    searched_count, saved_count = future.result()
+                    total_articles += searched_count
+                    saved_articles += saved_count
+                except Exception as e:
+                    print(f"  ❌ 키워드 '{keyword}' 처리 중 오류: {e}")
+                    failed_keywords.append(keyword)
         try:
-            articles = search_naver_news_all_pages(keyword)
-            print(f"  📊 검색 결과: {len(articles)}개 기사")
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            for article in articles:
-                url = article.get('link', '')
-                cursor.execute("SELECT id FROM articles WHERE url = ?", (url,))
-                if cursor.fetchone() is not None:
-                    print(f"  ⚠️ 중복 URL 발견: {url} → 다음 키워드로 건너뜁니다.")
-                    break
-                # 중복이 아니면 저장
-                if save_article_to_db(article, keyword):
-                    saved_articles += 1
-            conn.close()
-            total_articles += len(articles)
-        except Exception as e:
-            print(f"  ❌ 키워드 '{keyword}' 처리 중 오류: {e}")
-            failed_keywords.append(keyword)
+            with collection_metrics.timed(STAGE_DB_WRITE):
+                writer.close()
+        except sqlite3.Error as e:
+            print(f"  ❌ 남은 기사 저장 중 오류: {e}")
+    finally:
+        collection_active.clear()
+    writer_stats = writer.get_stats()
+    selector_store.flush()
+    selector_stats = selector_store.get_stats()
     print(f"\n📈 뉴스 수집 완료 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"  총 검색된 기사: {total_articles}개")
     print(f"  총 저장된 기사: {saved_articles}개")
     print(f"  저장 성공률: {(saved_articles/total_articles*100):.1f}%" if total_articles > 0 else "  저장 성공률: 0%")
     if failed_keywords:
         print(f"  실패한 키워드: {failed_keywords}")
-    return {
+    print(f"  DB 저장: {writer_stats['rows_written']}행, 커밋 {writer_stats['flushes']}회, {writer_stats['rows_per_sec_write']}행/초")
+    cache_stats = fetch_cache.get_stats()
+    fetch_cache.clear()
+    print(f"  본문 캐시 적중률: {cache_stats['hit_ratio'] * 100:.1f}% (조회 {cache_stats['lookups']}건, 다운로드 {cache_stats['fetches']}건)")
+    cluster_stats = near_dup_index.get_stats()
+    print(f"  근접 중복 기사: {cluster_stats['near_duplicates_found']}개 (묶음 {cluster_stats['clusters']}개)")
+    if selector_stats['hit_rate'] is not None:
+        print(f"  본문 선택자 적중률: {selector_stats['hit_rate'] * 100:.1f}% ({selector_stats['domains_learned']}개 도메인)")
+    stage_stats = filter_stats.snapshot()
+    print(f"  제목 필터 제외: {stage_stats['stages'][TITLE_STAGE]['rejected']}개 (본문 다운로드 {stage_stats['fetches_avoided']}건 절약)")
+    print(f"  본문 필터 제외: {stage_stats['stages'][BODY_STAGE]['rejected']}개")
+    pool_stats = http_client.get_pool_stats()
+    print(f"  HTTP 커넥션 재사용률: {pool_stats['reuse_ratio']*100:.1f}% (요청 {pool_stats['total_requests']}건, 신규 커넥션 {pool_stats['new_connections']}개)")
+    metrics = collection_metrics.snapshot()
+    stage_summary = format_stage_summary(metrics)
+    if stage_summary:
+        print("  단계별 누적 시간:\n    " + stage_summary.replace('\n', '\n    '))
+    result = {
         'success': True,
         'total_articles': total_articles,
         'saved_articles': saved_articles,
         'failed_keywords': failed_keywords,
-        'success_rate': (saved_articles/total_articles*100) if total_articles > 0 else 0
+        'success_rate': (saved_articles/total_articles*100) if total_articles > 0 else 0,
+        'filter_stats': stage_stats,
+        'writer_stats': writer_stats,
+        'fetch_cache_stats': cache_stats,
+        'stage_metrics': metrics,
+        'stage_summary': stage_summary
     }
+    result['run_id'] = run_store.save(started_at, result, metrics, extra={
+        'filter_stats': stage_stats,
+        'writer_stats': writer_stats,
+        'fetch_cache_stats': cache_stats,
+        'selector_stats': {k: v for k, v in selector_stats.items() if k != 'domains'},
+        'cluster_stats': cluster_stats,
+        'http_pool_stats': pool_stats
+    })
+    return result
 
 def run_news_collection_for_keyword(keyword, start_date=None, end_date=None):
-    """특정 키워드에 대한 뉴스 수집 실행"""
+    """특정 키워드에 대한 뉴스 수집 실행 (스트리밍 파이프라인)"""
     print(f"🔍 키워드 '{keyword}' 뉴스 수집 시작")
     
     try:
-        # 페이지 끝까지 모든 기사 검색
-        articles = search_naver_news_all_pages(keyword, start_date=start_date, end_date=end_date)
+        filter_result = collect_articles_streaming(keyword, start_date=start_date, end_date=end_date)
         
-        if not articles:
+        if not filter_result['total']:
             print(f"키워드 '{keyword}'로 검색된 기사가 없습니다.")
             return {
                 'success': True,
@@ -576,17 +846,16 @@ def run_news_collection_for_keyword(keyword, start_date=None, end_date=None):
                 'saved_articles': 0
             }
         
-        # 필터링 및 저장
-        filter_result = filter_and_save_articles(articles, keyword)
-        
         print(f"✅ 키워드 '{keyword}' 처리 완료")
-        print(f"  검색된 기사: {len(articles)}개")
+        print(f"  검색된 기사: {filter_result['total']}개")
         print(f"  저장된 기사: {filter_result['saved_count']}개")
+        if filter_result['pipeline_stats']['first_save_seconds'] is not None:
+            print(f"  첫 기사 저장까지: {filter_result['pipeline_stats']['first_save_seconds']}초")
         
         return {
             'success': True,
             'keyword': keyword,
-            'total_articles': len(articles),
+            'total_articles': filter_result['total'],
             'saved_articles': filter_result['saved_count'],
             'skipped_count': filter_result['skipped_count'],
             'duplicate_count': filter_result['duplicate_count']
@@ -602,6 +871,156 @@ def run_news_collection_for_keyword(keyword, start_date=None, end_date=None):
             'saved_articles': 0
         }
 
+def wait_for_backfill_turn(keyword):
+    """백필 페이지를 요청하기 전 양보: 정기 수집이 끝날 때까지 대기, 할당량이 부족하면 일시 중지"""
+    waited = False
+    while collection_active.is_set():
+        if not waited:
+            print(f"    ⏸️ 정기 수집 실행 중 - '{keyword}' 백필 대기")
+            waited = True
+        time.sleep(5)
+    usage = naver_quota.get_usage()
+    if usage['remaining'] < usage['daily_quota'] * BACKFILL_QUOTA_RESERVE_RATIO:
+        raise BackfillPausedError(
+            f"남은 네이버 API 할당량 {usage['remaining']}회 - 정기 수집용으로 남겨 두고 백필 일시 중지"
+        )
+
+def backfill_keyword(job_id, keyword, start_date, end_date, checkpoint, writer, host_limiter):
+    """키워드 하나의 기간 백필 (체크포인트 위치부터 이어서, 페이지마다 저장 후 위치 기록)
+
+    Raises:
+        BackfillPausedError: 할당량이 부족해 일시 중지한 경우
+        NaverThrottledError: 429 응답이 계속되는 경우 (체크포인트는 마지막으로 처리한 페이지에 남음)
+    """
+    next_start = checkpoint['next_start']
+    resume_url = checkpoint['last_url']
+    articles = None
+    if next_start is None:
+        # 처음 시작: 종료일보다 새로운 구간을 건너뛴 위치 찾기
+        wait_for_backfill_turn(keyword)
+        next_start, articles = find_date_range_start(keyword, end_date)
+        if next_start is None:
+            return
+        backfill_store.save_checkpoint(job_id, keyword, next_start, None, None, 0, 0)
+    else:
+        print(f"    ▶️ '{keyword}' 백필 재개 (start={next_start}, 마지막 URL: {resume_url})")
+
+    while next_start <= NAVER_MAX_START:
+        if articles is None:
+            wait_for_backfill_turn(keyword)
+            result = search_naver_news(keyword, display=NAVER_MAX_DISPLAY, start=next_start, sort='date')
+            articles = result.get('items', [])
+        if not articles:
+            break
+        _, oldest = get_page_date_span(articles)
+        in_range = filter_by_date_range(articles, start_date, end_date)
+        # 중단 이후 새 기사가 올라와 결과가 밀렸으면 마지막으로 처리한 기사까지는 이미 처리한 구간
+        if resume_url:
+            links = [article.get('link') for article in in_range]
+            if resume_url in links:
+                in_range = in_range[links.index(resume_url) + 1:]
+            resume_url = None
+        stats = {'searched': 0, 'saved': 0}
+        if in_range:
+            pipeline = CollectionPipeline(
+                pages=[in_range],
+                find_existing=url_index.find_existing,
+                passes_title=lambda article: check_title_stage(article, keyword),
+                fetch=host_limiter.fetch,
+                save=lambda article, content: save_article_to_db(article, keyword, content=content, writer=writer),
+                fetch_workers=BACKFILL_FETCH_WORKERS
+            )
+            stats = pipeline.run()
+        # 이 페이지의 기사가 커밋된 뒤에만 위치를 전진시킨다
+        writer.flush()
+        stats['saved'] = writer.pop_written(keyword)
+        next_start += len(articles)
+        last_article = in_range[-1] if in_range else None
+        backfill_store.save_checkpoint(
+            job_id, keyword, next_start,
+            last_article.get('link') if last_article else None,
+            format_date(last_article.get('pubDate', '')) if last_article else None,
+            stats['searched'], stats['saved']
+        )
+        print(f"    📄 '{keyword}' 백필: 기간 내 {len(in_range)}개, 저장 {stats['saved']}개 (다음 start={next_start})")
+        if oldest is not None and oldest < start_date:
+            break
+        articles = None
+        time.sleep(BACKFILL_PAGE_DELAY)
+    if next_start > NAVER_MAX_START:
+        print(f"    ⚠️ '{keyword}' 네이버 검색 한도(최근 {NAVER_MAX_START}건)에 도달해 더 과거 기사는 수집할 수 없습니다.")
+
+def run_backfill(job_id):
+    """백필 작업 실행/재개 (키워드를 하나씩, 체크포인트부터 이어서 수집)
+
+    정기 수집이 도는 동안은 기다리고, 남은 할당량이 BACKFILL_QUOTA_RESERVE_RATIO 아래로 내려가면
+    일시 중지(paused)한다. 실패하거나 중지된 작업은 다시 실행하면 기록된 위치부터 이어서 수집한다.
+    실행 중에는 본문 파싱 프로세스 수를 BACKFILL_PARSE_PROCESSES로 바꿨다가 끝나면 되돌린다.
+    기간은 start_date 00:00:00 ~ end_date 23:59:59.
+
+    Returns:
+        dict: 작업 상태와 키워드별 진행 상황 (이미 다른 백필이 실행 중이면 None)
+    """
+    if not backfill_lock.acquire(blocking=False):
+        print("⚠️ 다른 백필 작업이 실행 중입니다.")
+        return None
+    try:
+        job = backfill_store.get_job(job_id)
+        if not job:
+            return None
+        start_date = datetime.strptime(job['start_date'], '%Y-%m-%d')
+        end_date = datetime.strptime(job['end_date'], '%Y-%m-%d') + timedelta(days=1) - timedelta(seconds=1)
+        print(f"🗄️ 백필 작업 {job_id} 시작: {job['keywords']} ({job['start_date']} ~ {job['end_date']})")
+        backfill_store.set_job_status(job_id, STATUS_RUNNING)
+        group_cache.invalidate()
+        writer = ArticleBatchWriter(DB_PATH)
+        host_limiter = HostConcurrencyLimiter(1)
+        # 백필 동안은 본문 파싱을 프로세스 풀로 돌려 여러 코어를 쓴다 (끝나면 원래 설정으로)
+        previous_parse_settings = html_extractor.configure(processes=BACKFILL_PARSE_PROCESSES)
+        job_status, message = STATUS_DONE, None
+        try:
+            for checkpoint in job['checkpoints']:
+                keyword = checkpoint['keyword']
+                if checkpoint['status'] == STATUS_DONE:
+                    continue
+                backfill_store.set_keyword_status(job_id, keyword, STATUS_RUNNING)
+                try:
+                    backfill_keyword(job_id, keyword, start_date, end_date, checkpoint, writer, host_limiter)
+                except (BackfillPausedError, QuotaExceededError, NaverThrottledError) as e:
+                    # 할당량 부족/속도 제한은 일시적이므로 일시 중지 후 다음 실행에서 이어서 수집
+                    print(f"  ⏸️ {e}")
+                    backfill_store.set_keyword_status(job_id, keyword, STATUS_PAUSED, str(e))
+                    job_status, message = STATUS_PAUSED, str(e)
+                    break
+                except Exception as e:
+                    # 이 키워드는 기록된 위치에 남겨 두고 (다음 실행에서 재시도) 다른 키워드는 계속
+                    print(f"  ❌ '{keyword}' 백필 중 오류: {e}")
+                    backfill_store.set_keyword_status(job_id, keyword, STATUS_FAILED, str(e))
+                    job_status, message = STATUS_FAILED, f"'{keyword}' 오류: {e}"
+                    continue
+                backfill_store.set_keyword_status(job_id, keyword, STATUS_DONE)
+        finally:
+            writer.close()
+            selector_store.flush()
+            html_extractor.configure(**previous_parse_settings)
+            backfill_store.set_job_status(job_id, job_status, message)
+        print(f"🗄️ 백필 작업 {job_id} 종료: {job_status}")
+        return backfill_store.get_job(job_id)
+    finally:
+        backfill_lock.release()
+
+def resume_backfills():
+    """끝나지 않은 백필 작업을 오래된 것부터 이어서 실행 (스케줄러/서버 재시작 후 호출)"""
+    results = []
+    for job_id in backfill_store.list_unfinished():
+        result = run_backfill(job_id)
+        if result is None:
+            break
+        results.append(result)
+        if result['status'] == STATUS_PAUSED:
+            break
+    return results
+
 # ============================================================================
 # 실행 코드 (테스트 및 직접 실행용)
 # ============================================================================
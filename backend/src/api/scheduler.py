@@ -1,11 +1,11 @@
 from apscheduler.schedulers.background import BackgroundScheduler
-from .naver_news_api import run_news_collection
+from .naver_news_api import run_news_collection, resume_backfills
 import sqlite3
 import os
 import logging
-from datetime import datetime
-import requests
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from backend.src.services.http_client import http_client
 load_dotenv()
 
 # 로깅 설정
@@ -37,7 +37,7 @@ def send_telegram_message(message):
         "text": message
     }
     try:
-        response = requests.post(url, data=data, timeout=5)
+        response = http_client.post(url, data=data, timeout=5)
         if response.status_code != 200:
             logging.error(f"텔레그램 전송 실패: {response.text}")
     except Exception as e:
@@ -65,6 +65,9 @@ def scheduled_news_fetch():
             )
             if result.get('failed_keywords'):
                 msg += f"\n⚠️ 실패 키워드: {result['failed_keywords']}"
+            if result.get('stage_summary'):
+                # 단계별 누적 시간과 느린 언론사 (상세: GET /news/collection_runs/latest)
+                msg += f"\n{result['stage_summary']}"
             send_telegram_message(msg)
         else:
             logging.error(f"❌ 뉴스 수집 실패: {result.get('error', '알 수 없는 오류')}")
@@ -74,6 +77,15 @@ def scheduled_news_fetch():
         logging.error(f"❌ 스케줄러 실행 중 오류 발생: {str(e)}")
         send_telegram_message(f"❌ 스케줄러 실행 중 오류 발생: {str(e)}")
 
+def scheduled_backfill():
+    """끝나지 않은 과거 기사 백필 작업을 이어서 실행 (정기 수집 중에는 백필이 스스로 대기)"""
+    try:
+        results = resume_backfills()
+        for job in results:
+            logging.info(f"🗄️ 백필 작업 {job['id']}: {job['status']} {job.get('message') or ''}")
+    except Exception as e:
+        logging.error(f"❌ 백필 실행 중 오류 발생: {str(e)}")
+
 def start_scheduler():
     """스케줄러 시작"""
     try:
@@ -89,6 +101,18 @@ def start_scheduler():
             name='매일 오전 9시 뉴스 수집'
         )
         
+        # 끝나지 않은 백필 작업은 매시간 이어서 실행 (서버 재시작 직후에도 한 번 확인)
+        scheduler.add_job(
+            scheduled_backfill,
+            'interval',
+            hours=1,
+            next_run_time=datetime.now() + timedelta(minutes=1),
+            max_instances=1,
+            coalesce=True,
+            id='news_backfill_resume',
+            name='과거 기사 백필 이어서 실행'
+        )
+        
         # 테스트용: 1분마다 실행 (개발 시에만 사용)
         # scheduler.add_job(scheduled_news_fetch, 'interval', minutes=1, id='test_news_collection')
         
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기존 기사 근접 중복 묶음 부여 스크립트
+simhash가 없는 기사(근접 중복 색인 도입 이전에 저장된 기사)에 simhash와 cluster_id를 채웁니다.
+오래된 기사부터 처리하므로 같은 보도자료 묶음은 가장 먼저 실린 기사의 지문을 cluster_id로 갖습니다.
+"""
+
+import os
+import sys
+import sqlite3
+
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.near_duplicate_index import NearDuplicateIndex
+
+DB_PATH = os.path.join(os.path.dirname(__file__), 'db.sqlite')
+
+
+def assign_article_clusters():
+    """지문이 없는 기사에 cluster_id 부여 후 큰 묶음 출력"""
+    print("🔄 근접 중복 묶음 부여 시작")
+    index = NearDuplicateIndex(DB_PATH)
+    processed = index.backfill()
+    stats = index.get_stats()
+    print(f"✅ {processed}개 기사 처리 완료 (지문 {stats['fingerprints']}개, 묶음 {stats['clusters']}개)")
+
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        rows = conn.execute("""
+            SELECT cluster_id, COUNT(*) AS cnt, MIN(title)
+            FROM articles
+            WHERE cluster_id IS NOT NULL
+            GROUP BY cluster_id
+            HAVING cnt > 1
+            ORDER BY cnt DESC
+            LIMIT 10
+        """).fetchall()
+    finally:
+        conn.close()
+
+    if rows:
+        print("\n📊 기사가 많은 묶음 (상위 10개):")
+        for cluster_id, count, title in rows:
+            print(f"   - {count}건: {title[:50] if title else ''} (cluster_id={cluster_id})")
+
+
+if __name__ == "__main__":
+    assign_article_clusters()
@@ -5,64 +5,31 @@ MLB 야구 관련 기사 자동 분류 스크립트
 2025년 7월 MLB 관련 기사 중 야구 관련 기사들을 '해당없음'으로 분류합니다.
 """
 
+import os
+import sys
 import sqlite3
-import re
 from datetime import datetime
 
-# 야구 관련 키워드 목록
-BASEBALL_KEYWORDS = [
-    # 선수 관련
-    '이정후', '김하성', '김혜성', '오타니', '류현진', '최지만', '추신수', '박찬호',
-    '타자', '투수', '포수', '내야수', '외야수', '지명타자', '마무리', '선발', '불펜',
-    
-    # 야구 용어
-    '이닝', '타석', '타율', '방어율', '홈런', '안타', '삼진', '볼넷', '도루', '타점',
-    'RBI', 'ERA', 'OPS', '승리', '패배', '세이브', '블론세이브', '완봉', '완투',
-    '더블헤더', '연장', '콜드게임', '우천취소',
-    
-    # 팀명
-    '다저스', '양키스', '레드삭스', '자이언츠', '애스트로스', '브루어스', '패드리스',
-    '엔젤스', '메츠', '필리스', '브레이브스', '컵스', '화이트삭스', '오리올스',
-    '레인저스', '마리너스', '레이스', '타이거스', '로열스', '트윈스', '가디언스',
-    '애슬레틱스', '내셔널스', '말린스', '파이리츠', '레즈', '카디널스', '록키스',
-    '디백스', '탬파베이',
-    
-    # 리그/대회
-    'MLB', 'KBO', '메이저리그', '아메리칸리그', '내셔널리그', '월드시리즈',
-    '플레이오프', '포스트시즌', '올스타', '스프링캠프', 'WBC', '프리미어12',
-    
-    # 구장/시설
-    '구장', '스타디움', '마운드', '홈플레이트', '베이스', '덕아웃', '불펜',
-    
-    # 기타 야구 관련
-    '시즌', '트레이드', '웨이버', 'DL', 'IL', '부상자명단', '마이너리그',
-    '메이저리그', '콜업', '옵션', '논텐더', 'FA', '자유계약', '재계약',
-    '구원', '세팅', '클로저', '좌완', '우완', '언더핸드', '사이드암'
-]
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.keyword_matcher import KeywordMatcher
+from backend.src.services.baseball_terms import BASEBALL_KEYWORDS, BASEBALL_PATTERNS
+
+# 키워드/패턴을 한 번만 컴파일해 기사마다 한 번씩만 훑는다
+BASEBALL_MATCHER = KeywordMatcher(BASEBALL_KEYWORDS, patterns=BASEBALL_PATTERNS, ignore_case=True)
 
 def contains_baseball_keywords(title, content=''):
     """제목이나 내용에 야구 관련 키워드가 포함되어 있는지 확인"""
     text = (title + ' ' + content).lower()
     
-    for keyword in BASEBALL_KEYWORDS:
-        if keyword.lower() in text:
-            return True, keyword
+    matched_keyword = BASEBALL_MATCHER.first_term(text)
+    if matched_keyword:
+        return True, matched_keyword
     
     # 정규식으로 추가 패턴 검사
-    patterns = [
-        r'\d+회(?:\s*)?(?:초|말)',  # "5회초", "9회말" 등
-        r'\d+[-\d]*(?:\s*)?승(?:\s*)?(?:\d+[-\d]*)?패',  # "10승5패" 등
-        r'\d+[-\d]*(?:\s*)?패(?:\s*)?(?:\d+[-\d]*)?승',  # "5패10승" 등
-        r'(?:선발|마무리|세팅|중간)(?:\s*)?(?:투수|등판)',
-        r'(?:1|2|3|홈)(?:\s*)?루(?:타|수|베이스)',
-        r'(?:우|좌)(?:\s*)?(?:타|투)',
-        r'\d+(?:\s*)?(?:타수|안타|홈런|타점|득점)',
-        r'(?:승|패|무)(?:\s*)?(?:투수|기록)',
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, text):
-            return True, f"패턴매칭: {pattern}"
+    matched_patterns = BASEBALL_MATCHER.matched_patterns(text)
+    if matched_patterns:
+        return True, f"패턴매칭: {matched_patterns[0]}"
     
     return False, None
 
@@ -1,7 +1,12 @@
+import os
+import sys
 import sqlite3
 import re
 import logging
-from datetime import datetime
+
+# 프로젝트 루트를 경로에 추가 (스크립트 단독 실행용)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from backend.src.services.date_normalizer import article_dates, log_dates
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,6 +32,9 @@ NEWS_PATTERNS = [
 
 SPECIAL_CHARS = r'[★☆◆◇■□●○◎※→←↑↓↔⇒⇐⇑⇓⇔]'
 
+# 이미 표준 형식(yyyy-mm-dd HH:MM:SS)인 날짜
+STANDARD_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
 def get_db_connection():
     """데이터베이스 연결 반환"""
     return sqlite3.connect(DB_PATH)
@@ -158,44 +166,23 @@ def convert_date_format():
     conn = get_db_connection()
     c = conn.cursor()
     
-    # pub_date 변환
+    # pub_date 변환 (표준 형식이 아닌 값만 한 번에 변환 후 일괄 업데이트)
     c.execute("SELECT id, pub_date FROM articles WHERE pub_date IS NOT NULL AND pub_date != ''")
-    pub_dates = c.fetchall()
-    
-    updated_pub_count = 0
-    for article_id, pub_date in pub_dates:
-        try:
-            if pub_date and isinstance(pub_date, str):
-                # 이미 올바른 형식인지 확인 (yyyy-mm-dd HH:MM:SS)
-                if re.match(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$', pub_date):
-                    continue  # 이미 올바른 형식이면 건너뛰기
-                
-                # 다양한 날짜 형식 처리
-                date_formats = [
-                    "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822
-                    "%Y-%m-%d %H:%M:%S",         # ISO 형식
-                    "%Y-%m-%d",                  # 날짜만
-                    "%d %b %Y %H:%M:%S",         # 시간대 없음
-                ]
-                
-                parsed_date = None
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(pub_date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if parsed_date:
-                    formatted_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-                    c.execute("UPDATE articles SET pub_date = ? WHERE id = ?", (formatted_date, article_id))
-                    updated_pub_count += 1
-                    logger.info(f"pub_date 변환: {pub_date} -> {formatted_date}")
-                else:
-                    logger.warning(f"날짜 형식 파싱 실패: {pub_date}")
-                    
-        except Exception as e:
-            logger.error(f"pub_date 변환 오류 (ID: {article_id}): {e}")
+    pub_dates = [
+        (article_id, pub_date) for article_id, pub_date in c.fetchall()
+        if isinstance(pub_date, str) and not STANDARD_DATE_RE.match(pub_date)
+    ]
+    formatted_dates = article_dates.normalize_many(pub_date for _, pub_date in pub_dates)
+    
+    updates = []
+    for (article_id, pub_date), formatted_date in zip(pub_dates, formatted_dates):
+        if formatted_date:
+            updates.append((formatted_date, article_id))
+            logger.debug(f"pub_date 변환: {pub_date} -> {formatted_date}")
+        else:
+            logger.warning(f"날짜 형식 파싱 실패: {pub_date}")
+    c.executemany("UPDATE articles SET pub_date = ? WHERE id = ?", updates)
+    updated_pub_count = len(updates)
     
     # created_at 변환 (SQLite datetime을 표준 형식으로)
     c.execute("""
@@ -240,61 +227,37 @@ def clean_classification_logs_dates():
         for date_format, count in current_formats:
             logger.info(f"  {date_format}: {count}개")
         
-        # 다양한 날짜 형식 처리
-        date_formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",  # 2025-07-23T10:54:29.732630
-            "%Y-%m-%d %H:%M:%S",     # 2025-07-21 15:25:53
-            "%Y-%m-%dT%H:%M:%S",     # 2025-07-23T10:54:29
-            "%Y-%m-%d",              # 날짜만
-            "%d/%m/%Y %H:%M:%S",     # 다른 형식들
-            "%m/%d/%Y %H:%M:%S",
-        ]
-        
-        # 모든 created_at 데이터 가져오기
+        # 모든 created_at 데이터 가져오기 (표준 형식이 아닌 값만 변환 대상)
         c.execute("SELECT rowid, created_at FROM classification_logs WHERE created_at IS NOT NULL")
-        all_dates = c.fetchall()
-        
-        updated_count = 0
+        all_dates = []
         failed_count = 0
-        
-        for rowid, date_str in all_dates:
-            try:
-                if not date_str or date_str == '':
-                    continue
-                
-                # 이미 올바른 형식인지 확인
-                if re.match(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$', date_str):
-                    continue
-                
-                # 다양한 형식으로 파싱 시도
-                parsed_date = None
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if parsed_date:
-                    # 표준 형식으로 변환
-                    formatted_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # 업데이트
-                    c.execute("""
-                        UPDATE classification_logs 
-                        SET created_at = ? 
-                        WHERE rowid = ?
-                    """, (formatted_date, rowid))
-                    
-                    updated_count += 1
-                    logger.info(f"날짜 변환: {date_str} -> {formatted_date}")
-                else:
-                    failed_count += 1
-                    logger.warning(f"날짜 형식 파싱 실패: {date_str}")
-                    
-            except Exception as e:
+        for rowid, date_str in c.fetchall():
+            if not date_str:
+                continue
+            if not isinstance(date_str, str):
                 failed_count += 1
-                logger.error(f"날짜 변환 오류 (rowid: {rowid}): {e}")
+                logger.error(f"날짜 변환 오류 (rowid: {rowid}): 문자열이 아닌 값 {date_str!r}")
+            elif not STANDARD_DATE_RE.match(date_str):
+                all_dates.append((rowid, date_str))
+        
+        # 형식별로 한 번만 판별해 한꺼번에 변환 (ISO, T 구분, 마이크로초, 일/월/연 등)
+        formatted_dates = log_dates.normalize_many(date_str for _, date_str in all_dates)
+        
+        updates = []
+        for (rowid, date_str), formatted_date in zip(all_dates, formatted_dates):
+            if formatted_date:
+                updates.append((formatted_date, rowid))
+                logger.debug(f"날짜 변환: {date_str} -> {formatted_date}")
+            else:
+                failed_count += 1
+                logger.warning(f"날짜 형식 파싱 실패: {date_str}")
+        
+        c.executemany("""
+            UPDATE classification_logs 
+            SET created_at = ? 
+            WHERE rowid = ?
+        """, updates)
+        updated_count = len(updates)
         
         conn.commit()
         
@@ -32,6 +32,8 @@ def init_database():
        press TEXT,
        pub_date TEXT,
        url TEXT UNIQUE,
+       simhash INTEGER,
+       cluster_id INTEGER,
        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
    );
         )
@@ -51,10 +53,106 @@ def init_database():
             confidence_score REAL,
             processing_time REAL,
             is_saved BOOLEAN DEFAULT FALSE,
+            decided_by TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
     
+    # collection_cursors 테이블 생성 (키워드별 증분 수집 위치)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS collection_cursors (
+            keyword TEXT PRIMARY KEY,
+            last_pub_date TEXT,
+            last_url TEXT,
+            recent_volume REAL DEFAULT 0,
+            updated_at TEXT
+        )
+    """)
+    
+    # naver_api_usage 테이블 생성 (네이버 API 일일 사용량 장부)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS naver_api_usage (
+            usage_date TEXT PRIMARY KEY,
+            call_count INTEGER DEFAULT 0,
+            throttled_count INTEGER DEFAULT 0,
+            denied_count INTEGER DEFAULT 0,
+            updated_at TEXT
+        )
+    """)
+    
+    # content_selectors 테이블 생성 (언론사 도메인별 본문 선택자 학습)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS content_selectors (
+            domain TEXT PRIMARY KEY,
+            selector TEXT NOT NULL,
+            hits INTEGER DEFAULT 0,
+            misses INTEGER DEFAULT 0,
+            updated_at TEXT
+        )
+    """)
+    
+    # collection_runs 테이블 생성 (정기 수집 실행별 단계/키워드/언론사 소요 시간)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS collection_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT,
+            finished_at TEXT,
+            duration_seconds REAL,
+            success INTEGER,
+            total_articles INTEGER,
+            saved_articles INTEGER,
+            failed_keywords TEXT,
+            stage_stats TEXT,
+            keyword_stats TEXT,
+            domain_stats TEXT,
+            extra_stats TEXT
+        )
+    """)
+    
+    # backfill_jobs / backfill_checkpoints 테이블 생성 (과거 기사 백필 작업과 키워드별 진행 위치)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS backfill_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            keywords TEXT NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',
+            message TEXT,
+            failed_runs INTEGER DEFAULT 0,
+            created_at TEXT,
+            updated_at TEXT
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+            job_id INTEGER NOT NULL,
+            keyword TEXT NOT NULL,
+            next_start INTEGER,
+            last_url TEXT,
+            last_pub_date TEXT,
+            searched INTEGER DEFAULT 0,
+            saved INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'pending',
+            error TEXT,
+            updated_at TEXT,
+            PRIMARY KEY (job_id, keyword)
+        )
+    """)
+    
+    # llm_response_cache 테이블 생성 (프롬프트 버전/모델/키워드/기사 내용별 OpenAI 응답)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            prompt_version TEXT,
+            model TEXT,
+            keyword TEXT,
+            response TEXT NOT NULL,
+            hits INTEGER DEFAULT 0,
+            created_at TEXT,
+            last_used_at TEXT
+        )
+    """)
+    
     conn.commit()
     conn.close()
     
@@ -63,6 +161,13 @@ def init_database():
     print("- keywords: 키워드 저장 테이블")
     print("- articles: 크롤링된 기사 저장 테이블")
     print("- classification_logs: 분류 로그 저장 테이블")
+    print("- collection_cursors: 키워드별 수집 커서 테이블")
+    print("- naver_api_usage: 네이버 API 일일 사용량 장부 테이블")
+    print("- content_selectors: 도메인별 본문 선택자 테이블")
+    print("- collection_runs: 수집 실행별 단계 소요 시간 테이블")
+    print("- backfill_jobs: 과거 기사 백필 작업 테이블")
+    print("- backfill_checkpoints: 백필 키워드별 진행 위치 테이블")
+    print("- llm_response_cache: AI 분류 응답 캐시 테이블")
 
 if __name__ == "__main__":
     init_database()
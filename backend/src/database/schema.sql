@@ -16,5 +16,9 @@ CREATE TABLE IF NOT EXISTS articles (
     class_evidence TEXT,            -- 분류 근거 문구만 저장
     ai_classification TEXT,         -- AI 분류 결과
     ai_reasoning TEXT,              -- AI 분류 이유
-    ai_confidence REAL              -- AI 분류 신뢰도 (0.0-1.0)
+    ai_confidence REAL,             -- AI 분류 신뢰도 (0.0-1.0)
+    simhash INTEGER,                -- 제목+본문 SimHash 지문 (근접 중복 검사용)
+    cluster_id INTEGER              -- 근접 중복 묶음 ID (같은 보도자료 재게재 기사는 같은 값)
 );
+
+CREATE INDEX IF NOT EXISTS idx_articles_cluster_id ON articles(cluster_id);
@@ -1,6 +1,6 @@
 from flask import Flask
 from backend.src.api.keywords_api import keywords_bp
-from backend.src.api.naver_news_api import naver_news_bp
+from backend.src.api.naver_news_api import naver_news_bp, url_index, near_dup_index
 from backend.src.api.articles_api import articles_bp
 from backend.src.api.dashboard_summary_api import dashboard_bp
 from backend.src.api.keyword_dashboard_api import keyword_dashboard_bp
@@ -24,6 +24,18 @@ def create_app():
     app.register_blueprint(keyword_dashboard_bp, url_prefix='/api')
     #app.register_blueprint(ml_classification_bp, url_prefix='/api')
     
+    # 기사 URL 중복 검사 인덱스 로드
+    try:
+        url_index.warm()
+    except Exception as e:
+        print(f"⚠️ URL 중복 인덱스 로드 실패 (첫 수집 시 다시 시도): {e}")
+    
+    # 근접 중복 기사 색인 로드 (articles.simhash/cluster_id 컬럼이 없으면 추가)
+    try:
+        near_dup_index.warm()
+    except Exception as e:
+        print(f"⚠️ 근접 중복 색인 로드 실패 (첫 저장 시 다시 시도): {e}")
+    
     # 스케줄러 시작
     global scheduler
     scheduler = start_scheduler()
@@ -0,0 +1,101 @@
+"""
+LLM 입력용 기사 본문 압축 서비스
+- 본문이 토큰 예산(AI_CONTEXT_TOKEN_BUDGET)을 넘을 때만 분류 근거가 되는 문장을 골라 줄임
+- 리드(첫 문장들)와 키워드가 나온 문장(앞뒤 문장 포함)을 먼저 넣고, 남은 예산은 앞 문장부터 채움
+- 기자명/이메일, 저작권·재배포 금지 문구, 관련 기사 링크 같은 상용구는 제외
+- 고른 문장은 원래 순서대로 이어 붙이고 건너뛴 자리는 '…'로 표시
+"""
+import os
+import re
+from typing import List, Sequence, Union
+
+from .token_counter import count_tokens, DEFAULT_MODEL
+
+# LLM에 넘길 본문 토큰 예산
+AI_CONTEXT_TOKEN_BUDGET = int(os.getenv('AI_CONTEXT_TOKEN_BUDGET', 1000))
+# 리드로 항상 먼저 넣을 첫 문장 수
+LEAD_SENTENCES = 3
+# 키워드 문장 앞뒤로 함께 넣을 문장 수
+KEYWORD_WINDOW = 1
+GAP_MARK = ' … '
+
+# 문장 경계 (마침표 뒤 공백 또는 줄바꿈, '3.5%' 같은 숫자는 나누지 않음)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+# 문장 안에서 지울 부분: (서울=뉴스1) 같은 발신지, '홍길동 기자 =' 바이라인, 이메일
+_DATELINE_RE = re.compile(r'[\[(][^\[\]()]{0,20}=[^\[\]()]{0,20}[\])]')
+_BYLINE_RE = re.compile(r'[가-힣]{2,4}\s?(?:선임|수습|인턴)?\s?(?:기자|특파원)\s*=\s*')
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+# 통째로 뺄 상용구 문장: 저작권/재배포 금지, 관련 기사 링크, 기자명만 남은 문장
+_BOILERPLATE_RE = re.compile(
+    r'무단\s?전재|재배포\s?금지|저작권자|copyright|all rights reserved|ⓒ|©|▶|관련\s?기사'
+    r'|^[가-힣]{2,4}\s?(?:선임|수습|인턴)?\s?(?:기자|특파원)\W*$',
+    re.IGNORECASE
+)
+
+
+def split_sentences(content: str) -> List[str]:
+    """본문을 문장 목록으로 나누고 상용구를 뺀다"""
+    sentences = []
+    for sentence in _SENTENCE_SPLIT_RE.split(content or ''):
+        sentence = _EMAIL_RE.sub('', _BYLINE_RE.sub('', _DATELINE_RE.sub('', sentence))).strip()
+        if sentence and not _BOILERPLATE_RE.search(sentence):
+            sentences.append(sentence)
+    return sentences
+
+
+def build_article_context(content: str, keywords: Union[str, Sequence[str]],
+                          token_budget: int = AI_CONTEXT_TOKEN_BUDGET, model: str = DEFAULT_MODEL) -> str:
+    """토큰 예산에 맞춘 분류용 본문
+
+    예산 안에 들어가는 본문은 그대로 돌려준다 (짧은 기사는 분류 입력이 바뀌지 않음).
+
+    Args:
+        content (str): 기사 본문
+        keywords (Union[str, Sequence[str]]): 근거 문장을 찾을 키워드 (하나 또는 여러 개)
+        token_budget (int): 본문 토큰 예산
+        model (str): 토큰 수를 셀 모델
+
+    Returns:
+        str: 줄인 본문
+    """
+    if not content or count_tokens(content, model) <= token_budget:
+        return content or ''
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    lowered_keywords = [keyword.lower() for keyword in keywords if keyword]
+
+    sentences = split_sentences(content)
+    if not sentences:
+        return ''
+
+    # 넣을 순서: 리드 → 키워드 문장 → 키워드 앞뒤 문장 → 나머지 (앞 문장부터)
+    keyword_indexes = [index for index, sentence in enumerate(sentences)
+                       if any(keyword in sentence.lower() for keyword in lowered_keywords)]
+    neighbor_indexes = [index + offset for index in keyword_indexes
+                        for offset in range(-KEYWORD_WINDOW, KEYWORD_WINDOW + 1) if offset]
+    priority = list(range(min(LEAD_SENTENCES, len(sentences)))) + keyword_indexes + neighbor_indexes
+    priority += range(len(sentences))
+
+    selected = set()
+    used = 0
+    for index in priority:
+        if index in selected or not 0 <= index < len(sentences):
+            continue
+        tokens = count_tokens(sentences[index], model) + 1
+        if used + tokens > token_budget:
+            continue
+        selected.add(index)
+        used += tokens
+
+    if not selected:
+        # 첫 문장 하나도 예산을 넘으면 앞부분만 (글자 수 ≥ 토큰 수)
+        return sentences[0][:token_budget]
+
+    parts = []
+    previous = None
+    for index in sorted(selected):
+        if previous is not None:
+            parts.append(' ' if index == previous + 1 else GAP_MARK)
+        parts.append(sentences[index])
+        previous = index
+    return ''.join(parts)
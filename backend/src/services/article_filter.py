@@ -0,0 +1,153 @@
+"""
+기사 필터링 서비스
+- 1단계(제목 필터): 네이버 API의 title/description만으로 판단, 본문 다운로드 전에 제외
+- 2단계(본문 필터): 1단계를 통과해 본문을 받은 기사에만 적용
+- 단계별 제외 통계 (절약한 본문 다운로드 수 포함)
+"""
+import re
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from .keyword_matcher import KeywordMatcher
+
+TITLE_STAGE = 'title'
+BODY_STAGE = 'body'
+
+# 야구 관련 키워드 리스트 (MLB/엠엘비 키워드용)
+BASEBALL_TERMS = [
+    '이정후', '김하성', '이닝', '실점', '투수', '타자', '홈런', '야구', 'KBO', '삼진', '타율', '도루',
+    '포수', '마운드', '경기', '선발', '불펜', '타점', '득점', '안타', '볼넷', '스트라이크',
+    '포스트시즌', '월드시리즈', '메이저리그', 'MLB', '구단', '감독', '코치', '선수', '타순',
+    '타격', '수비', '연봉', '이적', '트레이드', '시범경기', '플레이오프', '클린업', '사구', '홈플레이트',
+    '외야수', '내야수', '주루', '슬라이딩', '사이드암', '언더핸드', '좌완', '우완', '완투', '완봉', '노히트', '노런'
+]
+
+# 홀딩스/지주 관련 기업명 리스트 (F&F 키워드 지주사 관련주 나열 기사용)
+HOLDING_COMPANIES = [
+    '홀딩스', '지주', '대상홀딩스', '한화', '하나금융지주', 'GRT', '한진중공업홀딩스',
+    '로스웰', '성창기업지주', '평화홀딩스', 'BNK금융지주', '우리산업홀딩스', '휴맥스홀딩스',
+    '비츠로테크', '네오위즈홀딩스', '부방', '한국콜마홀딩스', '디와이', '한미사이언스',
+    'LS전선아시아', '컴투스홀딩스', 'JB금융지주', '솔본', '글로벌에스엠', '엘브이엠씨홀딩스',
+    'KB금융', 'DGB금융지주', '슈프리마에이치큐', 'KC그린홀딩스', 'CNH', 'BGF', '풀무원',
+    '일동홀딩스', '신송홀딩스', '오가닉티코스메틱', '녹십자홀딩스', '신한지주', '우리금융지주',
+    'APS', '휴온스글로벌', '덕산하이메탈', '이지홀딩스', '일진홀딩스', '윙입푸드', '오리온홀딩스',
+    'CR홀딩스', 'SK디스커버리', '코아시아', 'DRB동일', '골든센츄리', '웅진', '롯데지주',
+    '코오롱', '동국홀딩스', '메리츠금융지주', '해성산업', '제일파마홀딩스', 'LG', 'AJ네트웍스',
+    'HDC', '에코프로', '경동인베스트', 'GS', 'SJM홀딩스', '유수홀딩스', '서연',
+    '유비쿼스홀딩스', '샘표', '삼성물산', '이건홀딩스', '이녹스', '금호건설', '동아쏘시오홀딩스',
+    '대덕', '아세아', 'LX홀딩스', '대웅', '솔브레인홀딩스', '동성케미컬', '효성', 'HD현대',
+    '풍산홀딩스', 'NICE', '삼양홀딩스', 'SK스퀘어', '한세예스24홀딩스', 'KPX홀딩스',
+    '한솔홀딩스', '그래디언트', '심텍홀딩스', 'CS홀딩스', 'F&F홀딩스', '영원무역홀딩스',
+    '골프존뉴딘홀딩스', '하이트진로홀딩스', '노루홀딩스', 'KISCO홀딩스', 'AK홀딩스', 'DB',
+    '예스코홀딩스', '코스맥스비티아이', '아이디스홀딩스', '농심홀딩스', '진양홀딩스', '두산밥캣', '헝셍그룹'
+]
+
+# 본문에 지주사 기업명이 이 개수 이상 언급되면 관련주 나열 기사로 판단
+HOLDING_COMPANY_THRESHOLD = 5
+
+BASEBALL_FILTER_KEYWORDS = ['MLB', '엠엘비']
+
+# 필터 설정별 매처 (모듈 로드 시 한 번만 컴파일)
+BASEBALL_MATCHER = KeywordMatcher(BASEBALL_TERMS)
+HOLDING_COMPANY_MATCHER = KeywordMatcher(HOLDING_COMPANIES)
+
+
+class FilterStats:
+    """단계별 통과/제외 건수 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._passed = {TITLE_STAGE: 0, BODY_STAGE: 0}
+            self._rejected = {TITLE_STAGE: {}, BODY_STAGE: {}}
+
+    def record(self, stage: str, reason: Optional[str]):
+        """필터 결과 기록 (reason이 None이면 통과)"""
+        with self._lock:
+            if reason is None:
+                self._passed[stage] += 1
+            else:
+                self._rejected[stage][reason] = self._rejected[stage].get(reason, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계 조회
+
+        Returns:
+            Dict[str, Any]: 단계별 통과/제외 건수, 사유별 제외 건수, 절약한 본문 다운로드 수
+        """
+        with self._lock:
+            stages = {}
+            for stage in (TITLE_STAGE, BODY_STAGE):
+                rejected = dict(self._rejected[stage])
+                stages[stage] = {
+                    'passed': self._passed[stage],
+                    'rejected': sum(rejected.values()),
+                    'rejected_by_reason': rejected
+                }
+        return {
+            'stages': stages,
+            # 제목 단계에서 제외된 기사는 본문을 내려받지 않았다
+            'fetches_avoided': stages[TITLE_STAGE]['rejected']
+        }
+
+
+def filter_by_title(title: str, description: str, keyword: str) -> Optional[Tuple[str, str]]:
+    """1단계 필터: 제목/요약만으로 제외 여부 판단 (본문 다운로드 전)
+
+    Args:
+        title (str): 정제된 제목
+        description (str): 정제된 네이버 API 요약문
+        keyword (str): 수집 키워드
+
+    Returns:
+        Optional[Tuple[str, str]]: 제외 시 (사유 코드, 로그 메시지), 통과 시 None
+    """
+    # 제목이 모두 영문인지 확인 (한글이 하나도 없으면 제외)
+    if title and not re.search(r'[가-힣]', title) and re.search(r'[A-Za-z]', title):
+        return 'english_title', f"🔤 [필터] 영문 제목 기사 제외: {title[:40]} ..."
+
+    # MLB/엠엘비 + 야구 기사 필터링 (제목/요약에서 먼저 확인)
+    if keyword in BASEBALL_FILTER_KEYWORDS:
+        if BASEBALL_MATCHER.contains_any(title) or BASEBALL_MATCHER.contains_any(description):
+            return 'baseball', f"⚾️ [필터] MLB/엠엘비 키워드 야구 기사 제외: {title[:40]} ..."
+
+    return None
+
+
+def filter_by_body(title: str, content: str, keyword: str) -> Optional[Tuple[str, str]]:
+    """2단계 필터: 본문이 필요한 검사 (1단계 통과 기사에만 적용)
+
+    Args:
+        title (str): 정제된 제목
+        content (str): 정제된 본문
+        keyword (str): 수집 키워드
+
+    Returns:
+        Optional[Tuple[str, str]]: 제외 시 (사유 코드, 로그 메시지), 통과 시 None
+    """
+    # MLB/엠엘비 + 야구 기사 필터링 (본문)
+    if keyword in BASEBALL_FILTER_KEYWORDS:
+        if BASEBALL_MATCHER.contains_any(content):
+            return 'baseball', f"⚾️ [필터] MLB/엠엘비 키워드 야구 기사 제외: {title[:40]} ..."
+
+    # F&F 키워드 특별 필터링
+    if keyword == 'F&F':
+        # 1. 제목이나 본문에 실제로 F&F가 없는 기사 필터링 (네이버 API 오탐지 방지)
+        if 'F&F' not in title and 'F&F' not in content and 'f&f' not in title.lower() and 'f&f' not in content.lower():
+            return 'ff_not_mentioned', f"🔍 [필터] F&F 키워드 오탐지 기사 제외: {title[:40]} ... (제목/본문에 F&F 없음)"
+
+        # 2. 지주사 관련주 나열 기사 필터링
+        if '(지주사 관련주)' in content or '지주사 관련주' in content:
+            # 임계값에 닿으면 더 세지 않는다 (관련주 나열 기사는 기업명이 본문 앞부분부터 촘촘히 나온다)
+            holding_count = HOLDING_COMPANY_MATCHER.count_distinct(content, limit=HOLDING_COMPANY_THRESHOLD)
+            if holding_count >= HOLDING_COMPANY_THRESHOLD:
+                return 'holding_company_list', f"🏢 [필터] F&F 키워드 지주사 관련주 나열 기사 제외: {title[:40]} ... (홀딩스 관련 기업 {holding_count}개 이상 언급)"
+
+    return None
+
+
+# 전역 통계 인스턴스
+filter_stats = FilterStats()
@@ -0,0 +1,211 @@
+"""
+기사 일괄 저장 서비스
+- 저장할 기사를 버퍼에 모았다가 executemany로 한 트랜잭션에 INSERT
+- 배치 크기 또는 시간 창(초)을 넘으면 커밋 (새 기사가 안 들어와도 타이머 스레드가 시간 창마다 커밋)
+- 실제로 INSERT된 행 수를 키워드별로 집계 (INSERT OR IGNORE로 버려진 행은 저장 수에서 제외)
+- 키워드 → 그룹명 매핑 캐시 (기사마다 keywords 테이블을 조회하지 않음)
+- 초당 저장 행 수 등 통계 제공
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+# 한 트랜잭션에 묶을 최대 기사 수
+ARTICLE_WRITER_BATCH_SIZE = int(os.getenv('ARTICLE_WRITER_BATCH_SIZE', 50))
+# 버퍼를 이 시간(초) 이상 들고 있지 않도록 커밋
+ARTICLE_WRITER_FLUSH_SECONDS = float(os.getenv('ARTICLE_WRITER_FLUSH_SECONDS', 2.0))
+# SQLite PRAGMA synchronous 값 (FULL: 기본값, NORMAL: fsync 횟수 감소)
+ARTICLE_WRITER_SYNCHRONOUS = os.getenv('ARTICLE_WRITER_SYNCHRONOUS', 'FULL').upper()
+# 그룹명 캐시 유지 시간 (초)
+GROUP_CACHE_SECONDS = 300
+
+INSERT_SQL = """
+    INSERT OR IGNORE INTO articles (keyword, group_name, title, content, press, pub_date, url, simhash, cluster_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+ArticleRow = Tuple[str, Optional[str], str, str, str, str, str, Optional[int], Optional[int]]
+
+
+class KeywordGroupCache:
+    """활성 키워드 → 그룹명 매핑 캐시"""
+
+    def __init__(self, db_path: str, ttl_seconds: float = GROUP_CACHE_SECONDS):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._groups: Dict[str, Optional[str]] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reload(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute("SELECT keyword, group_name FROM keywords WHERE is_active=1").fetchall()
+        finally:
+            conn.close()
+        self._groups = {keyword: group_name for keyword, group_name in rows}
+        self._loaded_at = time.monotonic()
+
+    def get(self, keyword: str) -> Optional[str]:
+        """키워드의 그룹명 (비활성/미등록 키워드는 None)"""
+        with self._lock:
+            if time.monotonic() - self._loaded_at > self.ttl_seconds:
+                self._reload()
+            return self._groups.get(keyword)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = 0.0
+
+
+class ArticleBatchWriter:
+    """기사 일괄 저장기 (여러 수집 스레드가 공유, 스레드 안전)"""
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = ARTICLE_WRITER_BATCH_SIZE,
+        flush_seconds: float = ARTICLE_WRITER_FLUSH_SECONDS,
+        synchronous: str = ARTICLE_WRITER_SYNCHRONOUS
+    ):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.synchronous = synchronous
+        self._buffer: List[ArticleRow] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._written_by_keyword: Dict[str, int] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_flush = time.monotonic()
+        self._started = time.monotonic()
+        self._rows_written = 0
+        self._rows_ignored = 0
+        self._flush_count = 0
+        self._write_seconds = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        return self._conn
+
+    def add(self, row: ArticleRow):
+        """저장할 기사 추가 (배치 크기/시간 창을 넘으면 바로 커밋)
+
+        Args:
+            row (ArticleRow): (keyword, group_name, title, content, press, pub_date, url, simhash, cluster_id)
+        """
+        with self._lock:
+            if not self._buffer:
+                # 버퍼가 비어 있던 동안은 시간 창을 새로 시작
+                self._last_flush = time.monotonic()
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_seconds:
+                self._flush_locked()
+            self._start_timer_locked()
+
+    def _start_timer_locked(self):
+        """다운로드가 느려 add가 뜸해도 버퍼가 시간 창보다 오래 커밋되지 않도록 타이머 스레드 시작"""
+        if self._timer is not None or self.flush_seconds <= 0:
+            return
+        self._closed.clear()
+        self._timer = threading.Thread(target=self._flush_periodically, name='article-writer-flush', daemon=True)
+        self._timer.start()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_seconds / 2):
+            with self._lock:
+                if not self._buffer or time.monotonic() - self._last_flush < self.flush_seconds:
+                    continue
+                try:
+                    self._flush_locked()
+                except sqlite3.Error:
+                    pass  # 버퍼에 남아 있으므로 다음 주기나 flush/close에서 다시 시도
+
+    def flush(self) -> int:
+        """버퍼에 남은 기사 커밋
+
+        Returns:
+            int: 이번에 실제로 저장된 행 수
+        """
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return 0
+        rows, self._buffer = self._buffer, []
+        conn = self._connection()
+        started = time.perf_counter()
+        written_by_keyword: Dict[str, int] = {}
+        try:
+            with conn:  # 배치 전체를 한 트랜잭션으로 커밋 (실패 시 롤백)
+                # 키워드별로 나눠 executemany → total_changes 증가분이 그 키워드의 실제 저장 수
+                # (INSERT OR IGNORE로 버려진 행은 total_changes에 잡히지 않는다)
+                by_keyword: Dict[str, List[ArticleRow]] = {}
+                for row in rows:
+                    by_keyword.setdefault(row[0], []).append(row)
+                for keyword, keyword_rows in by_keyword.items():
+                    before = conn.total_changes
+                    conn.executemany(INSERT_SQL, keyword_rows)
+                    written_by_keyword[keyword] = conn.total_changes - before
+        except sqlite3.Error as e:
+            # 다음 flush에서 다시 시도하도록 버퍼에 되돌린다
+            self._buffer = rows + self._buffer
+            logger.error(f"기사 일괄 저장 실패 ({len(rows)}건): {e}")
+            raise
+        written = sum(written_by_keyword.values())
+        for keyword, count in written_by_keyword.items():
+            self._written_by_keyword[keyword] = self._written_by_keyword.get(keyword, 0) + count
+        self._write_seconds += time.perf_counter() - started
+        self._rows_written += written
+        self._rows_ignored += len(rows) - written
+        self._flush_count += 1
+        return written
+
+    def pop_written(self, keyword: str) -> int:
+        """키워드의 기사 중 지금까지 실제로 저장된 행 수를 돌려주고 0으로 초기화 (flush 후 호출)"""
+        with self._lock:
+            return self._written_by_keyword.pop(keyword, 0)
+
+    def close(self):
+        """남은 기사를 커밋하고 연결 종료 (타이머 스레드도 멈춘다)"""
+        self._closed.set()
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.join()
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장 통계 조회
+
+        Returns:
+            Dict[str, Any]: 저장/무시 행 수, 커밋 횟수, 쓰기 시간, 초당 저장 행 수
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            return {
+                'rows_written': self._rows_written,
+                'rows_ignored': self._rows_ignored,
+                'pending': len(self._buffer),
+                'flushes': self._flush_count,
+                'batch_size': self.batch_size,
+                'write_seconds': round(self._write_seconds, 3),
+                # 순수 SQLite 쓰기 처리량과, 수집 시작부터의 전체 처리량
+                'rows_per_sec_write': round(self._rows_written / self._write_seconds, 1) if self._write_seconds > 0 else 0.0,
+                'rows_per_sec_wall': round(self._rows_written / elapsed, 1) if elapsed > 0 else 0.0
+            }
@@ -0,0 +1,182 @@
+"""
+과거 기사 백필 작업 저장소 서비스
+- 키워드 묶음 + 기간 단위의 백필 작업과 키워드별 진행 위치(검색 start, 마지막 URL)를 SQLite에 저장
+- 페이지를 처리할 때마다 진행 위치를 기록하므로, 중간에 멈추거나 서버가 재시작되어도 이어서 수집
+- 실패로 끝난 실행 횟수를 세어, BACKFILL_MAX_FAILED_RUNS번 실패한 작업은 자동 재개 대상에서 제외
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+# 작업/키워드 상태
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_PAUSED = 'paused'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+# 이 횟수만큼 실패로 끝난 작업은 자동으로 다시 실행하지 않음
+BACKFILL_MAX_FAILED_RUNS = int(os.getenv('BACKFILL_MAX_FAILED_RUNS', 3))
+
+
+class BackfillPausedError(Exception):
+    """정기 수집용 할당량을 남겨 두기 위해 백필을 일시 중지한 경우"""
+
+
+CREATE_TABLES_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS backfill_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        keywords TEXT NOT NULL,
+        start_date TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        status TEXT DEFAULT 'pending',
+        message TEXT,
+        failed_runs INTEGER DEFAULT 0,
+        created_at TEXT,
+        updated_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+        job_id INTEGER NOT NULL,
+        keyword TEXT NOT NULL,
+        next_start INTEGER,
+        last_url TEXT,
+        last_pub_date TEXT,
+        searched INTEGER DEFAULT 0,
+        saved INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'pending',
+        error TEXT,
+        updated_at TEXT,
+        PRIMARY KEY (job_id, keyword)
+    )
+    """
+]
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class BackfillStore:
+    """백필 작업과 키워드별 체크포인트 저장소"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._table_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        if not self._table_ready:
+            for sql in CREATE_TABLES_SQL:
+                conn.execute(sql)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(backfill_jobs)")}
+            if 'failed_runs' not in columns:
+                conn.execute("ALTER TABLE backfill_jobs ADD COLUMN failed_runs INTEGER DEFAULT 0")
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def create_job(self, keywords: List[str], start_date: str, end_date: str) -> int:
+        """백필 작업 생성 (키워드마다 체크포인트 행을 만든다)
+
+        Args:
+            keywords (List[str]): 수집할 키워드 목록
+            start_date (str): 기간 시작일 (yyyy-mm-dd)
+            end_date (str): 기간 종료일 (yyyy-mm-dd)
+
+        Returns:
+            int: 작업 ID
+        """
+        now = _now()
+        conn = self._connect()
+        try:
+            cursor = conn.execute("""
+                INSERT INTO backfill_jobs (keywords, start_date, end_date, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (json.dumps(keywords, ensure_ascii=False), start_date, end_date, STATUS_PENDING, now, now))
+            job_id = cursor.lastrowid
+            conn.executemany("""
+                INSERT OR IGNORE INTO backfill_checkpoints (job_id, keyword, status, updated_at)
+                VALUES (?, ?, ?, ?)
+            """, [(job_id, keyword, STATUS_PENDING, now) for keyword in keywords])
+            conn.commit()
+            return job_id
+        finally:
+            conn.close()
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업과 키워드별 진행 상황 조회 (없으면 None)"""
+        conn = self._connect()
+        try:
+            job = conn.execute("SELECT * FROM backfill_jobs WHERE id = ?", (job_id,)).fetchone()
+            if not job:
+                return None
+            checkpoints = conn.execute(
+                "SELECT * FROM backfill_checkpoints WHERE job_id = ? ORDER BY rowid", (job_id,)
+            ).fetchall()
+        finally:
+            conn.close()
+        result = dict(job)
+        result['keywords'] = json.loads(result['keywords'])
+        result['checkpoints'] = [dict(row) for row in checkpoints]
+        return result
+
+    def list_unfinished(self, max_failed_runs: int = BACKFILL_MAX_FAILED_RUNS) -> List[int]:
+        """다시 실행할 작업 ID (오래된 순, 실행 중 중단된 작업 포함)
+
+        완료된 작업과 max_failed_runs번 이상 실패로 끝난 작업은 제외한다 (매시간 같은 오류를 반복하지 않도록).
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute("""
+                SELECT id FROM backfill_jobs
+                WHERE status != ? AND NOT (status = ? AND COALESCE(failed_runs, 0) >= ?)
+                ORDER BY id
+            """, (STATUS_DONE, STATUS_FAILED, max_failed_runs)).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    def save_checkpoint(self, job_id: int, keyword: str, next_start: int, last_url: Optional[str],
+                        last_pub_date: Optional[str], searched: int, saved: int):
+        """페이지 하나 처리 후 진행 위치 기록 (searched/saved는 이번 페이지 증가분)"""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                UPDATE backfill_checkpoints
+                SET next_start = ?, last_url = COALESCE(?, last_url), last_pub_date = COALESCE(?, last_pub_date),
+                    searched = searched + ?, saved = saved + ?, status = ?, error = NULL, updated_at = ?
+                WHERE job_id = ? AND keyword = ?
+            """, (next_start, last_url, last_pub_date, searched, saved, STATUS_RUNNING, _now(), job_id, keyword))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def set_keyword_status(self, job_id: int, keyword: str, status: str, error: Optional[str] = None):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE backfill_checkpoints SET status = ?, error = ?, updated_at = ? WHERE job_id = ? AND keyword = ?",
+                (status, error, _now(), job_id, keyword)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def set_job_status(self, job_id: int, status: str, message: Optional[str] = None):
+        """작업 상태 기록 (실패로 끝나면 failed_runs 증가)"""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                UPDATE backfill_jobs
+                SET status = ?, message = ?, failed_runs = COALESCE(failed_runs, 0) + ?, updated_at = ?
+                WHERE id = ?
+            """, (status, message, 1 if status == STATUS_FAILED else 0, _now(), job_id))
+            conn.commit()
+        finally:
+            conn.close()
@@ -0,0 +1,48 @@
+"""
+야구 기사 판별용 용어 목록
+- MLB/엠엘비 키워드에서 패션 브랜드가 아닌 스포츠 야구 기사를 가려낼 때 사용
+- database/classify_mlb_baseball_articles.py 스크립트와 agents/cascade_classifier.py 규칙 단계가 함께 사용
+"""
+
+# 야구 관련 키워드 목록
+BASEBALL_KEYWORDS = [
+    # 선수 관련
+    '이정후', '김하성', '김혜성', '오타니', '류현진', '최지만', '추신수', '박찬호',
+    '타자', '투수', '포수', '내야수', '외야수', '지명타자', '마무리', '선발', '불펜',
+    
+    # 야구 용어
+    '이닝', '타석', '타율', '방어율', '홈런', '안타', '삼진', '볼넷', '도루', '타점',
+    'RBI', 'ERA', 'OPS', '승리', '패배', '세이브', '블론세이브', '완봉', '완투',
+    '더블헤더', '연장', '콜드게임', '우천취소',
+    
+    # 팀명
+    '다저스', '양키스', '레드삭스', '자이언츠', '애스트로스', '브루어스', '패드리스',
+    '엔젤스', '메츠', '필리스', '브레이브스', '컵스', '화이트삭스', '오리올스',
+    '레인저스', '마리너스', '레이스', '타이거스', '로열스', '트윈스', '가디언스',
+    '애슬레틱스', '내셔널스', '말린스', '파이리츠', '레즈', '카디널스', '록키스',
+    '디백스', '탬파베이',
+    
+    # 리그/대회
+    'MLB', 'KBO', '메이저리그', '아메리칸리그', '내셔널리그', '월드시리즈',
+    '플레이오프', '포스트시즌', '올스타', '스프링캠프', 'WBC', '프리미어12',
+    
+    # 구장/시설
+    '구장', '스타디움', '마운드', '홈플레이트', '베이스', '덕아웃', '불펜',
+    
+    # 기타 야구 관련
+    '시즌', '트레이드', '웨이버', 'DL', 'IL', '부상자명단', '마이너리그',
+    '메이저리그', '콜업', '옵션', '논텐더', 'FA', '자유계약', '재계약',
+    '구원', '세팅', '클로저', '좌완', '우완', '언더핸드', '사이드암'
+]
+
+# 정규식으로 추가 검사할 야구 패턴
+BASEBALL_PATTERNS = [
+    r'\d+회(?:\s*)?(?:초|말)',  # "5회초", "9회말" 등
+    r'\d+[-\d]*(?:\s*)?승(?:\s*)?(?:\d+[-\d]*)?패',  # "10승5패" 등
+    r'\d+[-\d]*(?:\s*)?패(?:\s*)?(?:\d+[-\d]*)?승',  # "5패10승" 등
+    r'(?:선발|마무리|세팅|중간)(?:\s*)?(?:투수|등판)',
+    r'(?:1|2|3|홈)(?:\s*)?루(?:타|수|베이스)',
+    r'(?:우|좌)(?:\s*)?(?:타|투)',
+    r'\d+(?:\s*)?(?:타수|안타|홈런|타점|득점)',
+    r'(?:승|패|무)(?:\s*)?(?:투수|기록)',
+]
@@ -0,0 +1,136 @@
+"""
+키워드별 수집 커서 서비스
+- 키워드마다 마지막으로 확인한 최신 기사(pubDate, URL)를 SQLite에 저장
+- 다음 수집 시 커서보다 오래된 결과가 나오면 페이지 요청 중단
+- 최근 신규 기사 수에 맞춰 요청 display 크기 조절
+"""
+import math
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from loguru import logger
+
+from .date_normalizer import rfc2822_dates
+
+# display 크기 범위 (네이버 뉴스 API 최대 100)
+MIN_DISPLAY = 10
+MAX_DISPLAY = 100
+# 최근 신규 기사 수 대비 여유 배수
+DISPLAY_HEADROOM = 1.5
+# 신규 기사 수 지수이동평균 가중치 (최근 실행 비중)
+VOLUME_SMOOTHING = 0.5
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS collection_cursors (
+        keyword TEXT PRIMARY KEY,
+        last_pub_date TEXT,
+        last_url TEXT,
+        recent_volume REAL DEFAULT 0,
+        updated_at TEXT
+    )
+"""
+
+
+def parse_pub_date(pub_date: str) -> Optional[str]:
+    """네이버 pubDate(RFC 2822)를 비교 가능한 yyyy-mm-dd HH:MM:SS 문자열로 변환"""
+    if not pub_date:
+        return None
+    return rfc2822_dates.normalize(pub_date)
+
+
+class CollectionCursorStore:
+    """키워드별 수집 커서 저장소"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._table_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self._table_ready:
+            conn.execute(CREATE_TABLE_SQL)
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def get(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """키워드의 커서 조회
+
+        Args:
+            keyword (str): 수집 키워드
+
+        Returns:
+            Optional[Dict[str, Any]]: last_pub_date, last_url, recent_volume (없으면 None)
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT last_pub_date, last_url, recent_volume FROM collection_cursors WHERE keyword = ?",
+                (keyword,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        return {'last_pub_date': row[0], 'last_url': row[1], 'recent_volume': row[2] or 0}
+
+    def update(self, keyword: str, newest_article: Optional[Dict[str, Any]], new_count: int):
+        """수집 완료 후 커서 갱신
+
+        Args:
+            keyword (str): 수집 키워드
+            newest_article (Optional[Dict[str, Any]]): 이번 실행에서 본 가장 최신 기사 (없으면 위치 유지)
+            new_count (int): 이번 실행에서 커서보다 새로웠던 기사 수
+        """
+        previous = self.get(keyword)
+        if previous:
+            volume = VOLUME_SMOOTHING * new_count + (1 - VOLUME_SMOOTHING) * previous['recent_volume']
+        else:
+            volume = new_count
+
+        last_pub_date = previous['last_pub_date'] if previous else None
+        last_url = previous['last_url'] if previous else None
+        if newest_article:
+            newest_date = parse_pub_date(newest_article.get('pubDate', ''))
+            if newest_date and (not last_pub_date or newest_date >= last_pub_date):
+                last_pub_date = newest_date
+                last_url = newest_article.get('link', '')
+
+        conn = self._connect()
+        try:
+            conn.execute("""
+                INSERT INTO collection_cursors (keyword, last_pub_date, last_url, recent_volume, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(keyword) DO UPDATE SET
+                    last_pub_date = excluded.last_pub_date,
+                    last_url = excluded.last_url,
+                    recent_volume = excluded.recent_volume,
+                    updated_at = excluded.updated_at
+            """, (keyword, last_pub_date, last_url, volume, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            conn.commit()
+        finally:
+            conn.close()
+        logger.debug(f"수집 커서 갱신: {keyword} → {last_pub_date} (최근 신규 {volume:.1f}건)")
+
+    @staticmethod
+    def suggest_display(cursor: Optional[Dict[str, Any]]) -> int:
+        """최근 신규 기사 수에 맞춘 첫 페이지 display 크기
+
+        커서가 없으면 최대 크기로 요청하고, 조용한 키워드는 작은 페이지로 시작한다.
+        """
+        if not cursor:
+            return MAX_DISPLAY
+        wanted = math.ceil(cursor['recent_volume'] * DISPLAY_HEADROOM / 10) * 10
+        return max(MIN_DISPLAY, min(MAX_DISPLAY, wanted))
+
+    @staticmethod
+    def is_behind(article: Dict[str, Any], cursor: Optional[Dict[str, Any]]) -> bool:
+        """기사가 커서 위치이거나 그보다 오래되었는지 여부 (이미 수집한 구간)"""
+        if not cursor or not cursor.get('last_pub_date'):
+            return False
+        if cursor.get('last_url') and article.get('link') == cursor['last_url']:
+            return True
+        pub_date = parse_pub_date(article.get('pubDate', ''))
+        # 같은 초에 발행된 다른 기사는 놓치지 않도록 더 오래된 경우만 중단
+        return pub_date is not None and pub_date < cursor['last_pub_date']
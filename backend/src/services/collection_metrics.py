@@ -0,0 +1,246 @@
+"""
+뉴스 수집 단계별 계측 서비스
+- 단계(검색, 제목 필터, 본문 다운로드, 파싱, 본문 필터, 근접 중복, DB 저장)별 소요 시간/건수 집계
+- 키워드별, 언론사 도메인별로도 집계 (어느 키워드/언론사가 배치를 느리게 하는지 확인)
+- 수집 실행 결과를 collection_runs 테이블에 저장하고 최근 실행 조회
+- 텔레그램용 한두 줄 요약 생성
+"""
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+
+# 단계 이름 (표시 순서)
+STAGE_SEARCH = 'search'
+STAGE_TITLE_FILTER = 'title_filter'
+STAGE_FETCH = 'fetch'
+STAGE_PARSE = 'parse'
+STAGE_BODY_FILTER = 'body_filter'
+STAGE_CLUSTER = 'cluster'
+STAGE_DB_WRITE = 'db_write'
+STAGES = [STAGE_SEARCH, STAGE_TITLE_FILTER, STAGE_FETCH, STAGE_PARSE, STAGE_BODY_FILTER, STAGE_CLUSTER, STAGE_DB_WRITE]
+
+STAGE_LABELS = {
+    STAGE_SEARCH: '검색',
+    STAGE_TITLE_FILTER: '제목필터',
+    STAGE_FETCH: '다운로드',
+    STAGE_PARSE: '파싱',
+    STAGE_BODY_FILTER: '본문필터',
+    STAGE_CLUSTER: '중복묶음',
+    STAGE_DB_WRITE: 'DB저장',
+}
+
+# 결과에 남길 언론사 도메인 수 (누적 시간이 긴 순)
+TOP_DOMAINS = 20
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS collection_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at TEXT,
+        finished_at TEXT,
+        duration_seconds REAL,
+        success INTEGER,
+        total_articles INTEGER,
+        saved_articles INTEGER,
+        failed_keywords TEXT,
+        stage_stats TEXT,
+        keyword_stats TEXT,
+        domain_stats TEXT,
+        extra_stats TEXT
+    )
+"""
+
+
+def _empty_stage() -> Dict[str, float]:
+    return {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0}
+
+
+def _summarize(stages: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+    return {
+        stage: {
+            'count': stat['count'],
+            'seconds': round(stat['seconds'], 3),
+            'avg_ms': round(stat['seconds'] / stat['count'] * 1000, 2) if stat['count'] else 0.0,
+            'max_ms': round(stat['max_seconds'] * 1000, 2)
+        }
+        for stage, stat in stages.items()
+    }
+
+
+class CollectionMetrics:
+    """단계별 소요 시간 집계기 (스레드 안전, 수집 실행마다 reset)
+
+    시간은 각 호출의 소요 시간을 더한 누적값이다. 여러 스레드가 동시에 일하므로
+    단계 합계는 실행 전체 시간(벽시계)보다 클 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stages = {stage: _empty_stage() for stage in STAGES}
+            self._keywords: Dict[str, Dict[str, Dict[str, float]]] = {}
+            self._domains: Dict[str, Dict[str, Dict[str, float]]] = {}
+            self._started = time.monotonic()
+
+    @contextmanager
+    def keyword_context(self, keyword: str):
+        """이 블록에서 keyword 없이 기록한 시간을 keyword에 귀속 (본문 다운로드 스레드 등)"""
+        previous = getattr(self._local, 'keyword', None)
+        self._local.keyword = keyword
+        try:
+            yield
+        finally:
+            self._local.keyword = previous
+
+    def record(self, stage: str, seconds: float, keyword: Optional[str] = None, domain: Optional[str] = None, count: int = 1):
+        """단계 소요 시간 기록
+
+        Args:
+            stage (str): 단계 이름 (STAGES)
+            seconds (float): 소요 시간 (초)
+            keyword (Optional[str]): 키워드 (없으면 keyword_context 값)
+            domain (Optional[str]): 언론사 도메인
+            count (int): 처리 건수
+        """
+        keyword = keyword or getattr(self._local, 'keyword', None)
+        with self._lock:
+            targets = [self._stages.setdefault(stage, _empty_stage())]
+            if keyword:
+                targets.append(self._keywords.setdefault(keyword, {}).setdefault(stage, _empty_stage()))
+            if domain:
+                targets.append(self._domains.setdefault(domain, {}).setdefault(stage, _empty_stage()))
+            for stat in targets:
+                stat['count'] += count
+                stat['seconds'] += seconds
+                stat['max_seconds'] = max(stat['max_seconds'], seconds)
+
+    @contextmanager
+    def timed(self, stage: str, keyword: Optional[str] = None, domain: Optional[str] = None):
+        """with 블록 소요 시간을 stage에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started, keyword=keyword, domain=domain)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지 집계
+
+        Returns:
+            Dict[str, Any]: 전체/키워드별/도메인별(누적 시간 상위) 단계 통계, 경과 시간
+        """
+        with self._lock:
+            domains = sorted(
+                self._domains.items(), key=lambda item: sum(s['seconds'] for s in item[1].values()), reverse=True
+            )[:TOP_DOMAINS]
+            return {
+                'elapsed_seconds': round(time.monotonic() - self._started, 3),
+                'stages': _summarize(self._stages),
+                'keywords': {keyword: _summarize(stages) for keyword, stages in self._keywords.items()},
+                'domains': {domain: _summarize(stages) for domain, stages in domains}
+            }
+
+
+def format_stage_summary(snapshot: Dict[str, Any], slow_domains: int = 3) -> str:
+    """텔레그램용 단계별 요약 (누적 시간)"""
+    stages = snapshot['stages']
+    parts = [
+        f"{STAGE_LABELS.get(stage, stage)} {stages[stage]['seconds']:.1f}s"
+        for stage in STAGES if stage in stages and stages[stage]['count']
+    ]
+    lines = [f"⏱️ {' · '.join(parts)} (실행 {snapshot['elapsed_seconds']:.0f}s)"] if parts else []
+    slow = [
+        f"{domain} {sum(s['seconds'] for s in stats.values()):.1f}s"
+        for domain, stats in list(snapshot['domains'].items())[:slow_domains]
+    ]
+    if slow:
+        lines.append(f"🐢 느린 언론사: {', '.join(slow)}")
+    return '\n'.join(lines)
+
+
+class CollectionRunStore:
+    """수집 실행 기록 저장소 (collection_runs 테이블)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._table_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self._table_ready:
+            conn.execute(CREATE_TABLE_SQL)
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def save(self, started_at: datetime, result: Dict[str, Any], snapshot: Dict[str, Any],
+             extra: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """수집 실행 한 건 저장
+
+        Args:
+            started_at (datetime): 시작 시각
+            result (Dict[str, Any]): run_news_collection 결과 (success, total_articles, saved_articles, failed_keywords)
+            snapshot (Dict[str, Any]): CollectionMetrics.snapshot()
+            extra (Optional[Dict[str, Any]]): 그 밖의 통계 (필터, 저장, 캐시 등)
+
+        Returns:
+            Optional[int]: 저장된 실행 ID (실패 시 None)
+        """
+        finished_at = datetime.now()
+        try:
+            conn = self._connect()
+            try:
+                cursor = conn.execute("""
+                    INSERT INTO collection_runs (
+                        started_at, finished_at, duration_seconds, success, total_articles, saved_articles,
+                        failed_keywords, stage_stats, keyword_stats, domain_stats, extra_stats
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    started_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    finished_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    round((finished_at - started_at).total_seconds(), 3),
+                    1 if result.get('success') else 0,
+                    result.get('total_articles', 0),
+                    result.get('saved_articles', 0),
+                    json.dumps(result.get('failed_keywords', []), ensure_ascii=False),
+                    json.dumps(snapshot['stages'], ensure_ascii=False),
+                    json.dumps(snapshot['keywords'], ensure_ascii=False),
+                    json.dumps(snapshot['domains'], ensure_ascii=False),
+                    json.dumps(extra or {}, ensure_ascii=False, default=str)
+                ))
+                conn.commit()
+                return cursor.lastrowid
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"수집 실행 기록 저장 실패: {e}")
+            return None
+
+    def latest(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """최근 수집 실행 기록 (최신순)"""
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute("SELECT * FROM collection_runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        finally:
+            conn.close()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            for column in ('failed_keywords', 'stage_stats', 'keyword_stats', 'domain_stats', 'extra_stats'):
+                run[column] = json.loads(run[column]) if run[column] else None
+            runs.append(run)
+        return runs
+
+
+# 싱글톤 인스턴스
+collection_metrics = CollectionMetrics()
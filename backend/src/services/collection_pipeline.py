@@ -0,0 +1,274 @@
+"""
+뉴스 수집 스트리밍 파이프라인 서비스
+- 검색 페이지 → URL 중복 제거 → 제목 필터 → 본문 다운로드 → 본문 필터/일괄 저장
+- 단계 사이를 크기가 정해진 큐로 연결해 메모리 사용량을 일정하게 유지 (뒤 단계가 밀리면 앞 단계가 기다림)
+- 첫 페이지 기사가 저장되는 동안 다음 페이지를 검색
+  (stop_at_duplicate면 앞 페이지의 중복 확인이 끝난 뒤에만 다음 페이지를 요청해 API 호출을 낭비하지 않음)
+- 각 단계의 실제 작업(검색, 필터, 다운로드, 저장)은 호출하는 쪽에서 함수로 넘겨준다
+"""
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+# 단계 사이 큐 크기 (기사 수)
+COLLECTION_QUEUE_SIZE = int(os.getenv('COLLECTION_QUEUE_SIZE', 32))
+
+# 단계 종료 신호
+_DONE = object()
+
+# 기사별 처리 결과
+STATUS_DUPLICATE = 'duplicate'
+STATUS_TITLE_FILTERED = 'title_filtered'
+STATUS_SAVED = 'saved'
+STATUS_SKIPPED = 'skipped'
+
+
+class CollectionPipeline:
+    """키워드 하나의 수집 파이프라인 (run() 한 번 실행)"""
+
+    def __init__(
+        self,
+        pages: Iterable[List[Dict[str, Any]]],
+        find_existing: Callable[[List[str]], Set[str]],
+        passes_title: Callable[[Dict[str, Any]], bool],
+        fetch: Callable[[str], str],
+        save: Callable[[Dict[str, Any], str], bool],
+        fetch_workers: int = 4,
+        queue_size: int = COLLECTION_QUEUE_SIZE,
+        stop_at_duplicate: bool = False,
+        on_result: Optional[Callable[[Dict[str, Any], str], None]] = None
+    ):
+        """
+        Args:
+            pages: 검색 결과 페이지(기사 목록)를 차례로 내놓는 이터러블 (제너레이터면 필요한 만큼만 검색)
+            find_existing: URL 목록 중 이미 저장된 URL 집합을 돌려주는 함수
+            passes_title: 제목 필터 통과 여부
+            fetch: URL → 정제된 본문
+            save: (기사, 본문) → 저장 여부 (본문 필터 포함)
+            fetch_workers: 본문 다운로드 스레드 수
+            queue_size: 단계 사이 큐 크기
+            stop_at_duplicate: 날짜순 결과에서 첫 중복 URL을 만나면 이후 기사와 페이지를 건너뜀
+            on_result: 기사별 처리 결과 콜백 (기사, 상태)
+        """
+        self.pages = pages
+        self.find_existing = find_existing
+        self.passes_title = passes_title
+        self.fetch = fetch
+        self.save = save
+        self.fetch_workers = max(1, fetch_workers)
+        self.stop_at_duplicate = stop_at_duplicate
+        self.on_result = on_result
+
+        self._page_queue: queue.Queue = queue.Queue(maxsize=2)
+        self._fetch_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._save_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._stop = threading.Event()          # 오류로 전체 중단
+        self._search_done = threading.Event()   # 더 검색할 필요 없음 (중복 도달)
+        self._screened = threading.Condition()  # 중복 확인을 마친 페이지 수 알림
+        self._screened_pages = 0
+        self._errors: List[BaseException] = []
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            'pages': 0,
+            'searched': 0,
+            'duplicates': 0,
+            'title_filtered': 0,
+            'fetched': 0,
+            'saved': 0,
+            'skipped': 0,
+            'first_article': None,
+            'first_save_seconds': None,
+            'elapsed_seconds': 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 도구
+    # ------------------------------------------------------------------
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """큐가 차 있으면 기다렸다가 넣는다 (전체 중단 시 False)"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fail(self, error: BaseException):
+        with self._lock:
+            self._errors.append(error)
+        self._stop.set()
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _report(self, article: Dict[str, Any], status: str):
+        if self.on_result:
+            self.on_result(article, status)
+
+    # ------------------------------------------------------------------
+    # 단계
+    # ------------------------------------------------------------------
+
+    def _wait_screened(self, pages: int):
+        """앞서 넘긴 페이지의 중복 확인이 모두 끝날 때까지 대기 (중복 도달/중단 시 바로 반환)"""
+        with self._screened:
+            while self._screened_pages < pages and not (self._search_done.is_set() or self._stop.is_set()):
+                self._screened.wait(timeout=0.1)
+
+    def _mark_screened(self):
+        with self._screened:
+            self._screened_pages += 1
+            self._screened.notify_all()
+
+    def _search_stage(self):
+        try:
+            pages = iter(self.pages)
+            sent = 0
+            while True:
+                # 다음 페이지 요청은 API 호출이므로 중단 여부를 먼저 확인한다
+                if self.stop_at_duplicate:
+                    self._wait_screened(sent)
+                if self._search_done.is_set() or self._stop.is_set():
+                    break
+                page = next(pages, _DONE)
+                if page is _DONE:
+                    break
+                if not page:
+                    continue
+                with self._lock:
+                    if self.stats['first_article'] is None:
+                        self.stats['first_article'] = page[0]
+                    self.stats['pages'] += 1
+                    self.stats['searched'] += len(page)
+                if not self._put(self._page_queue, page):
+                    break
+                sent += 1
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(self._page_queue, _DONE)
+
+    def _screen_stage(self):
+        """URL 중복 제거 + 제목 필터 (페이지 단위로 한 번에 DB 대조)"""
+        try:
+            reached_duplicate = False
+            while True:
+                page = self._get(self._page_queue)
+                if page is _DONE:
+                    break
+                if reached_duplicate:
+                    continue  # 검색 단계가 이미 가져온 페이지는 버린다
+                existing = self.find_existing([article.get('link', '') for article in page])
+                cut = len(page)
+                if self.stop_at_duplicate:
+                    # 날짜순 결과라 첫 중복 이후는 모두 이미 수집한 기사 → 다음 페이지 검색을 바로 멈춘다
+                    cut = next((index for index, article in enumerate(page)
+                                if article.get('link', '') in existing), len(page))
+                    if cut < len(page):
+                        reached_duplicate = True
+                        self._search_done.set()
+                self._mark_screened()
+                for article in page[:cut]:
+                    if article.get('link', '') in existing:
+                        self._count('duplicates')
+                        self._report(article, STATUS_DUPLICATE)
+                        continue
+                    if not self.passes_title(article):
+                        self._count('title_filtered')
+                        self._report(article, STATUS_TITLE_FILTERED)
+                        continue
+                    if not self._put(self._fetch_queue, article):
+                        return
+                if reached_duplicate:
+                    logger.debug(f"중복 URL 도달, 이후 기사/페이지 생략: {page[cut].get('link', '')}")
+                    self._count('duplicates')
+                    self._report(page[cut], STATUS_DUPLICATE)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._search_done.set()
+            for _ in range(self.fetch_workers):
+                self._put(self._fetch_queue, _DONE)
+
+    def _fetch_stage(self):
+        try:
+            while True:
+                article = self._get(self._fetch_queue)
+                if article is _DONE:
+                    break
+                content = self.fetch(article.get('link', ''))
+                self._count('fetched')
+                if not self._put(self._save_queue, (article, content)):
+                    return
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(self._save_queue, _DONE)
+
+    def _save_stage(self, started: float):
+        """본문 필터 + 저장 (호출한 스레드에서 실행)"""
+        finished_workers = 0
+        while finished_workers < self.fetch_workers:
+            item = self._get(self._save_queue)
+            if item is _DONE:
+                if self._stop.is_set():
+                    break
+                finished_workers += 1
+                continue
+            article, content = item
+            try:
+                saved = self.save(article, content)
+            except Exception as e:
+                self._fail(e)
+                break
+            if saved:
+                with self._lock:
+                    self.stats['saved'] += 1
+                    if self.stats['first_save_seconds'] is None:
+                        self.stats['first_save_seconds'] = round(time.perf_counter() - started, 3)
+                self._report(article, STATUS_SAVED)
+            else:
+                self._count('skipped')
+                self._report(article, STATUS_SKIPPED)
+
+    def run(self) -> Dict[str, Any]:
+        """파이프라인 실행 (모든 단계가 끝날 때까지 대기)
+
+        Returns:
+            Dict[str, Any]: 단계별 처리 건수, 첫 기사(커서 갱신용), 첫 저장까지 걸린 시간
+
+        Raises:
+            Exception: 어느 단계에서든 처리되지 않은 오류가 나면 모든 단계를 멈춘 뒤 그 오류를 다시 던진다
+        """
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._search_stage, name='pipeline-search', daemon=True),
+            threading.Thread(target=self._screen_stage, name='pipeline-screen', daemon=True),
+        ] + [
+            threading.Thread(target=self._fetch_stage, name=f'pipeline-fetch-{i}', daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        self._save_stage(started)
+        for thread in threads:
+            thread.join()
+        self.stats['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        if self._errors:
+            raise self._errors[0]
+        return self.stats
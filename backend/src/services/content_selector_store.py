@@ -0,0 +1,166 @@
+"""
+도메인별 본문 선택자 학습 서비스
+- 언론사 도메인마다 본문 추출에 성공한 CSS 선택자를 기억 (content_selectors 테이블)
+- 다음 기사부터 학습된 선택자를 먼저 시도하고, 실패하면 전체 목록으로 다시 학습
+- 페이지 전체(body)로 대신 추출한 경우는 학습하지 않음 (메뉴/광고가 섞인 추출에 도메인이 고정되지 않도록)
+- 도메인별 적중률(학습된 선택자로 바로 추출한 비율) 제공
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set
+
+from loguru import logger
+
+# 변경된 도메인이 이만큼 쌓이면 DB에 반영
+FLUSH_EVERY = 50
+# 본문 영역을 못 찾았을 때 쓰는 페이지 전체 선택자 (학습/우선 시도 대상에서 제외)
+BODY_SELECTOR = 'body'
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS content_selectors (
+        domain TEXT PRIMARY KEY,
+        selector TEXT NOT NULL,
+        hits INTEGER DEFAULT 0,
+        misses INTEGER DEFAULT 0,
+        updated_at TEXT
+    )
+"""
+
+
+class ContentSelectorStore:
+    """도메인별 본문 선택자 저장소 (스레드 안전, 메모리 캐시 + SQLite)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._selectors: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._loaded = False
+        self._table_ready = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self._table_ready:
+            conn.execute(CREATE_TABLE_SQL)
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute("SELECT domain, selector, hits, misses FROM content_selectors").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"본문 선택자 로드 실패: {e}")
+            rows = []
+        for domain, selector, hits, misses in rows:
+            self._selectors[domain] = {'selector': selector, 'hits': hits or 0, 'misses': misses or 0}
+        self._loaded = True
+
+    def get(self, domain: str) -> Optional[str]:
+        """도메인에서 마지막으로 성공한 선택자 (없으면 None)"""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._selectors.get(domain)
+            if not entry or entry['selector'] == BODY_SELECTOR:
+                # 이전에 body로 기록된 도메인은 본문 선택자를 다시 학습
+                return None
+            return entry['selector']
+
+    def record(self, domain: str, tried_selector: Optional[str], used_selector: Optional[str]):
+        """추출 결과 기록
+
+        Args:
+            domain (str): 언론사 도메인
+            tried_selector (Optional[str]): 먼저 시도한 학습된 선택자 (없으면 None)
+            used_selector (Optional[str]): 실제로 본문을 찾은 선택자 (못 찾았으면 None, body는 학습하지 않음)
+        """
+        if used_selector == BODY_SELECTOR:
+            used_selector = None
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._selectors.get(domain)
+            if tried_selector and entry:
+                if used_selector == tried_selector:
+                    entry['hits'] += 1
+                else:
+                    entry['misses'] += 1
+            if used_selector:
+                if entry is None:
+                    entry = {'selector': used_selector, 'hits': 0, 'misses': 0}
+                    self._selectors[domain] = entry
+                elif entry['selector'] != used_selector:
+                    logger.debug(f"본문 선택자 변경: {domain} {entry['selector']} → {used_selector}")
+                    entry['selector'] = used_selector
+            if entry is not None:
+                self._dirty.add(domain)
+            should_flush = len(self._dirty) >= FLUSH_EVERY
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """변경된 도메인을 DB에 반영"""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = [
+                (domain, self._selectors[domain]['selector'], self._selectors[domain]['hits'],
+                 self._selectors[domain]['misses'], now)
+                for domain in self._dirty
+            ]
+            self._dirty = set()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany("""
+                        INSERT INTO content_selectors (domain, selector, hits, misses, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(domain) DO UPDATE SET
+                            selector = excluded.selector,
+                            hits = excluded.hits,
+                            misses = excluded.misses,
+                            updated_at = excluded.updated_at
+                    """, rows)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"본문 선택자 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """도메인별 학습된 선택자와 적중률
+
+        Returns:
+            Dict[str, Any]: 전체 적중률과 도메인별 선택자/적중/실패/적중률 (시도가 많은 순)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            domains: List[Dict[str, Any]] = []
+            total_hits = total_misses = 0
+            for domain, entry in self._selectors.items():
+                attempts = entry['hits'] + entry['misses']
+                total_hits += entry['hits']
+                total_misses += entry['misses']
+                domains.append({
+                    'domain': domain,
+                    'selector': entry['selector'],
+                    'hits': entry['hits'],
+                    'misses': entry['misses'],
+                    'hit_rate': round(entry['hits'] / attempts, 3) if attempts else None
+                })
+        domains.sort(key=lambda item: item['hits'] + item['misses'], reverse=True)
+        total = total_hits + total_misses
+        return {
+            'domains_learned': len(domains),
+            'hits': total_hits,
+            'misses': total_misses,
+            'hit_rate': round(total_hits / total, 3) if total else None,
+            'domains': domains
+        }
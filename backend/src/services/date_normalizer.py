@@ -0,0 +1,184 @@
+"""
+날짜 정규화 서비스
+- 기사 pubDate, 분류 로그 created_at 등을 yyyy-mm-dd HH:MM:SS로 변환 (수집 API와 정제 스크립트 공용)
+- 네이버가 돌려주는 RFC 2822 문자열("Mon, 08 Jul 2025 13:34:51 +0900")은 strptime 없이 직접 해석
+- 그 밖의 문자열은 생김새(숫자 자리)별로 맞을 수 있는 형식을 한 번만 골라 두고 그 형식들만 시도
+- 여러 값을 한 번에 변환하는 일괄 변환 제공 (같은 값은 한 번만 해석)
+
+결과와 실패 처리는 형식 목록을 순서대로 strptime 해 보던 기존 방식과 같다.
+"""
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+OUTPUT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+RFC2822_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+
+# 기사 pubDate 형식 (시도 순서대로)
+ARTICLE_DATE_FORMATS = [
+    RFC2822_FORMAT,              # RFC 2822
+    "%Y-%m-%d %H:%M:%S",         # ISO 형식
+    "%Y-%m-%d",                  # 날짜만
+    "%d %b %Y %H:%M:%S",         # 시간대 없음
+]
+
+# 분류 로그 created_at 형식 (시도 순서대로)
+LOG_DATE_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f",  # 2025-07-23T10:54:29.732630
+    "%Y-%m-%d %H:%M:%S",     # 2025-07-21 15:25:53
+    "%Y-%m-%dT%H:%M:%S",     # 2025-07-23T10:54:29
+    "%Y-%m-%d",              # 날짜만
+    "%d/%m/%Y %H:%M:%S",     # 다른 형식들
+    "%m/%d/%Y %H:%M:%S",
+]
+
+# 생김새 캐시 최대 크기 (넘으면 비움)
+MAX_SHAPES = 1024
+
+_MONTHS = {name: index for index, name in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], start=1
+)}
+
+# 네이버 pubDate 표준 모양 (이 모양이 아니면 strptime으로 처리)
+_RFC2822_RE = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), ([0-9]{2}) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) '
+    r'([0-9]{4}) ([0-9]{2}):([0-9]{2}):([0-9]{2}) [+-]([0-9]{2})[0-5][0-9]'
+)
+
+# strptime 지시자별로 "맞을 가능성이 있는" 느슨한 패턴 (strptime이 받아들이는 모든 문자열을 포함)
+_LOOSE_DIRECTIVES = {
+    'Y': r'\d{4}',
+    'm': r'\s?\d{1,2}',
+    'd': r'\s?\d{1,2}',
+    'H': r'\s?\d{1,2}',
+    'M': r'\s?\d{1,2}',
+    'S': r'\s?\d{1,2}',
+    'f': r'\d{1,6}',
+    'a': r'[^\W\d_]+',
+    'b': r'[^\W\d_]+',
+    'z': r'(?:[+-]\d\d:?\d\d(?::?\d\d(?:\.\d{1,6})?)?|Z)',
+}
+
+# 생김새 키: ASCII 숫자만 0으로 (글자/구분자는 그대로 두어 'T', 요일/월 이름 차이도 구분)
+_SHAPE_TABLE = str.maketrans('123456789', '000000000')
+
+
+def _loose_pattern(fmt: str) -> re.Pattern:
+    parts = []
+    index = 0
+    while index < len(fmt):
+        char = fmt[index]
+        if char == '%' and index + 1 < len(fmt):
+            parts.append(_LOOSE_DIRECTIVES[fmt[index + 1]])
+            index += 2
+            continue
+        parts.append(r'\s+' if char.isspace() else re.escape(char))
+        index += 1
+    return re.compile(''.join(parts), re.IGNORECASE)
+
+
+def _rfc2822_fields(value: str) -> Optional[tuple]:
+    """네이버 표준 pubDate에서 (연, 월, 일, 시, 분, 초) 추출 (표준 모양이 아니거나 값이 틀리면 None)"""
+    match = _RFC2822_RE.fullmatch(value)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, offset_hour = match.groups()
+    if year < '1000' or hour > '23' or minute > '59' or second > '59' or offset_hour > '23':
+        return None
+    fields = (int(year), _MONTHS[month_name], int(day), int(hour), int(minute), int(second))
+    try:
+        # 날짜 범위 확인 (2월 30일 등)
+        datetime(*fields)
+    except ValueError:
+        return None
+    return fields
+
+
+def parse_rfc2822_fast(value: str) -> Optional[str]:
+    """네이버 표준 pubDate를 yyyy-mm-dd HH:MM:SS로 변환 (표준 모양이 아니거나 값이 틀리면 None)
+
+    strptime("%a, %d %b %Y %H:%M:%S %z") 후 strftime 한 것과 같은 결과 (시간대 변환 없이 적힌 시각 그대로).
+    """
+    fields = _rfc2822_fields(value)
+    if fields is None:
+        return None
+    return "%04d-%02d-%02d %02d:%02d:%02d" % fields
+
+
+class DateNormalizer:
+    """형식 목록을 순서대로 시도하는 날짜 변환기 (스레드 안전)
+
+    문자열의 생김새마다 형식 목록 중 맞을 가능성이 있는 형식만 골라 기억해 두고 그 형식만 순서대로
+    strptime 한다. 같은 출처의 날짜는 생김새가 같으므로 대부분 한 번의 strptime으로 끝난다.
+    """
+
+    def __init__(self, formats: Sequence[str], output_format: str = OUTPUT_FORMAT):
+        self.formats = list(formats)
+        self.output_format = output_format
+        self._patterns = [_loose_pattern(fmt) for fmt in self.formats]
+        # 빠른 경로는 RFC 2822가 첫 번째로 시도하는 형식일 때만 (결과 순서가 같도록)
+        self._rfc2822_fast = bool(self.formats) and self.formats[0] == RFC2822_FORMAT and output_format == OUTPUT_FORMAT
+        self._shapes: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def _candidates(self, value: str) -> List[str]:
+        shape = value.translate(_SHAPE_TABLE)
+        candidates = self._shapes.get(shape)
+        if candidates is None:
+            candidates = [fmt for fmt, pattern in zip(self.formats, self._patterns) if pattern.fullmatch(value)]
+            with self._lock:
+                if len(self._shapes) >= MAX_SHAPES:
+                    self._shapes.clear()
+                self._shapes[shape] = candidates
+        return candidates
+
+    def parse(self, value: str) -> Optional[datetime]:
+        """형식 목록 중 처음 맞는 형식으로 해석 (실패 시 None)"""
+        if not value:
+            return None
+        for fmt in self._candidates(value):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        return None
+
+    def normalize(self, value: str) -> Optional[str]:
+        """output_format 문자열로 변환 (실패 시 None)"""
+        if not value:
+            return None
+        if self._rfc2822_fast:
+            fast = parse_rfc2822_fast(value)
+            if fast is not None:
+                return fast
+        parsed = self.parse(value)
+        return parsed.strftime(self.output_format) if parsed else None
+
+    def normalize_many(self, values: Iterable[str]) -> List[Optional[str]]:
+        """여러 값을 한 번에 변환 (같은 값은 한 번만 해석, 입력 순서대로 결과 반환)"""
+        memo: Dict[str, Optional[str]] = {}
+        results = []
+        for value in values:
+            if value not in memo:
+                memo[value] = self.normalize(value)
+            results.append(memo[value])
+        return results
+
+
+def parse_naver_pub_date(value: str) -> Optional[datetime]:
+    """네이버 pubDate를 시간대 정보 없는 datetime으로 (적힌 시각 그대로, 실패 시 None)"""
+    if not value:
+        return None
+    fields = _rfc2822_fields(value)
+    if fields is not None:
+        return datetime(*fields)
+    parsed = rfc2822_dates.parse(value)
+    return parsed.replace(tzinfo=None) if parsed else None
+
+
+# 싱글톤 인스턴스
+article_dates = DateNormalizer(ARTICLE_DATE_FORMATS)
+log_dates = DateNormalizer(LOG_DATE_FORMATS)
+rfc2822_dates = DateNormalizer([RFC2822_FORMAT])
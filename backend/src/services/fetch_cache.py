@@ -0,0 +1,105 @@
+"""
+수집 실행 단위 본문 캐시 서비스
+- 한 번의 수집 실행 동안 같은 기사 URL은 한 번만 다운로드/파싱 (여러 키워드가 같은 기사를 찾은 경우)
+- URL 정규화 (스킴, 대소문자, 끝 슬래시, 추적용 파라미터, #fragment 차이 무시)
+- 동시에 같은 URL을 요청하면 먼저 시작한 다운로드 결과를 기다려 함께 사용
+- 다운로드 실패(예외 또는 빈 본문)는 캐시하지 않아 다른 키워드에서 다시 시도
+- 적중률 통계 제공
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Any
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# 캐시에 보관할 최대 기사 수 (넘으면 오래된 것부터 버림)
+MAX_ENTRIES = 5000
+
+# 같은 기사를 가리키는 URL에서 무시할 추적용 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'from', 'sns', 'cmpid'}
+
+
+def normalize_url(url: str) -> str:
+    """같은 기사를 가리키는 URL들이 같은 키가 되도록 정규화"""
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path.rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    # http/https 차이와 #fragment는 무시
+    return f"{host}{path}?{urlencode(query)}" if query else f"{host}{path}"
+
+
+class RunFetchCache:
+    """수집 실행 하나 동안 쓰는 본문 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], str]) -> str:
+        """캐시에 있으면 그 본문을, 없으면 fetch(url)로 내려받아 저장 후 반환
+
+        Args:
+            url (str): 기사 URL
+            fetch (Callable[[str], str]): URL → 정제된 본문 (예: HostConcurrencyLimiter.fetch)
+
+        Returns:
+            str: 정제된 본문
+        """
+        key = normalize_url(url)
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None:
+                self._hits += 1
+                owner = False
+            else:
+                self._misses += 1
+                future = Future()
+                self._entries[key] = future
+                owner = True
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        if not owner:
+            return future.result()
+        try:
+            content = fetch(url)
+        except BaseException as e:
+            # 실패한 다운로드는 캐시에 남기지 않는다 (기다리던 쪽에는 같은 오류 전달)
+            with self._lock:
+                if self._entries.get(key) is future:
+                    del self._entries[key]
+            future.set_exception(e)
+            raise
+        if not content:
+            # extract_article_content는 실패(타임아웃/5xx/파싱 오류)를 빈 본문으로 돌려주므로 이것도 남기지 않는다
+            # (이미 기다리던 쪽은 같은 빈 결과를 받고, 이후 요청은 다시 내려받음)
+            with self._lock:
+                if self._entries.get(key) is future:
+                    del self._entries[key]
+        future.set_result(content)
+        return content
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'lookups': lookups,
+                'hits': self._hits,
+                'fetches': self._misses,
+                'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries)
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
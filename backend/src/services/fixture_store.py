@@ -0,0 +1,73 @@
+"""
+HTTP 응답 녹화 저장소 서비스
+- 네이버 검색 API JSON 응답과 기사 HTML을 파일로 저장 (수집기 오프라인 벤치마크용)
+- 요청 URL + 쿼리 파라미터를 정규화한 키로 저장하므로 대체 서버에서 같은 키로 찾아 재생 가능
+- HTTP_RECORD_DIR 환경변수를 지정하면 공용 HTTP 클라이언트가 모든 GET 응답을 녹화
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, Iterator, Optional
+
+from loguru import logger
+
+from .fetch_cache import normalize_url
+
+
+def fixture_key(url: str) -> str:
+    """녹화/재생 공통 키 (쿼리 문자열까지 포함한 요청 URL 기준, 스킴/www/추적용 파라미터/파라미터 순서 차이 무시)"""
+    return normalize_url(url)
+
+
+class FixtureStore:
+    """녹화된 응답 저장소 (키마다 메타데이터 .json + 본문 .body 파일)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def save(self, key: str, url: str, status: int, content_type: str, body: bytes):
+        """응답 하나 저장 (같은 키는 덮어쓴다)"""
+        path = self._path(key)
+        meta = {'key': key, 'url': url, 'status': status, 'content_type': content_type, 'size': len(body)}
+        with self._lock:
+            with open(path + '.body', 'wb') as f:
+                f.write(body)
+            with open(path + '.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """키로 녹화된 응답 조회 (없으면 None)
+
+        Returns:
+            Optional[Dict[str, Any]]: key, url, status, content_type, size, body(bytes)
+        """
+        path = self._path(key)
+        if not os.path.exists(path + '.json'):
+            return None
+        with open(path + '.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(path + '.body', 'rb') as f:
+            meta['body'] = f.read()
+        return meta
+
+    def iter_meta(self) -> Iterator[Dict[str, Any]]:
+        """저장된 응답 메타데이터 전체 (본문 제외)"""
+        for name in sorted(os.listdir(self.root)):
+            if name.endswith('.json'):
+                with open(os.path.join(self.root, name), encoding='utf-8') as f:
+                    yield json.load(f)
+
+    def record_response(self, response):
+        """requests 응답 녹화 (리다이렉트된 경우에도 처음 요청한 URL 기준으로 저장)"""
+        first = response.history[0] if response.history else response
+        url = first.request.url if first.request is not None else response.url
+        try:
+            self.save(fixture_key(url), url, response.status_code, response.headers.get('Content-Type', ''), response.content)
+        except OSError as e:
+            logger.warning(f"응답 녹화 실패: {url} ({e})")
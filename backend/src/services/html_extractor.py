@@ -0,0 +1,236 @@
+"""
+기사 본문 추출 서비스
+- 다운로드한 HTML에서 본문 영역을 찾아 정제된 텍스트로 변환
+- HTML 파싱은 CPU 작업이라 스레드로는 빨라지지 않으므로 프로세스 풀에서 실행 가능
+- 파서 백엔드 선택 (html.parser 기본, lxml 선택)
+- 도메인별로 이전에 성공한 본문 선택자를 먼저 시도 (선택자 목록 전체를 훑지 않음)
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from loguru import logger
+
+from .text_cleaner import clean_text
+from .content_selector_store import ContentSelectorStore, BODY_SELECTOR
+
+# BeautifulSoup 파서 백엔드 (html.parser | lxml)
+ARTICLE_HTML_PARSER = os.getenv('ARTICLE_HTML_PARSER', 'html.parser')
+# 본문 파싱 프로세스 수 (0이면 호출한 스레드에서 바로 파싱, 음수면 CPU 코어 수)
+ARTICLE_PARSE_PROCESSES = int(os.getenv('ARTICLE_PARSE_PROCESSES', 0))
+
+NAVER_CONTENT_SELECTORS = [
+    '#articleBody',
+    '#articleBodyContents',
+    '.article_body',
+    '#content',
+    '.news_end',
+]
+
+GENERAL_CONTENT_SELECTORS = [
+    'article',
+    '.article-content',
+    '.news-content',
+    '.content',
+    '.post-content',
+    '.entry-content',
+    'main',
+    '.main-content'
+]
+
+
+NAVER_UNWANTED = 'script, style, .reporter_area, .copyright, .link_news'
+GENERAL_UNWANTED = 'script, style, nav, header, footer, .advertisement, .sidebar'
+BODY_UNWANTED = 'script, style, nav, header, footer, .advertisement, .sidebar, .comment'
+
+
+def _try_naver_selector(soup, selector: str) -> str:
+    content_element = soup.select_one(selector)
+    if content_element:
+        for unwanted in content_element.select(NAVER_UNWANTED):
+            unwanted.decompose()
+        content = content_element.get_text(strip=True)
+        if content and len(content) > 100:
+            return clean_text(content)
+    return ""
+
+
+def _try_general_selector(soup, selector: str) -> str:
+    for element in soup.select(selector):
+        for unwanted in element.select(GENERAL_UNWANTED):
+            unwanted.decompose()
+        content = element.get_text(strip=True)
+        if content and len(content) > 200:
+            return clean_text(content)
+    return ""
+
+
+def _try_body(soup) -> str:
+    body = soup.find('body')
+    if body:
+        for unwanted in body.select(BODY_UNWANTED):
+            unwanted.decompose()
+        content = body.get_text(strip=True)
+        if content and len(content) > 300:
+            return clean_text(content)
+    return ""
+
+
+def _try_selector(soup, selector: str, is_naver: bool) -> str:
+    """선택자 하나로 본문 추출 시도 (선택자 종류에 맞는 제거 대상/최소 길이 적용, body는 우선 시도하지 않음)"""
+    if is_naver and selector in NAVER_CONTENT_SELECTORS:
+        return _try_naver_selector(soup, selector)
+    if selector in GENERAL_CONTENT_SELECTORS:
+        return _try_general_selector(soup, selector)
+    return ""
+
+
+def extract_content_with_selector(
+    raw_html: bytes,
+    url: str,
+    parser: str = 'html.parser',
+    preferred_selector: Optional[str] = None
+) -> Tuple[str, Optional[str]]:
+    """HTML에서 기사 본문을 찾아 (정제된 본문, 성공한 선택자)로 반환
+
+    preferred_selector(이 도메인에서 이전에 성공한 선택자)가 있으면 먼저 시도하고,
+    실패했을 때만 전체 선택자 목록을 순서대로 시도한다. 먼저 시도한 선택자가 불필요한 요소를
+    지우면서 문서를 바꿨을 수 있으므로, 전체 목록은 HTML을 다시 파싱해 원래 문서로 시도한다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둔다.
+
+    Args:
+        raw_html (bytes): 응답 본문 (인코딩 판별은 BeautifulSoup에 맡긴다)
+        url (str): 기사 URL (네이버 뉴스 전용 선택자 적용 여부 판단)
+        parser (str): BeautifulSoup 파서 이름
+        preferred_selector (Optional[str]): 먼저 시도할 선택자
+
+    Returns:
+        Tuple[str, Optional[str]]: 정제된 본문 (찾지 못하면 빈 문자열), 성공한 선택자
+    """
+    soup = BeautifulSoup(raw_html, parser)
+    is_naver = 'news.naver.com' in url
+
+    if preferred_selector:
+        content = _try_selector(soup, preferred_selector, is_naver)
+        if content:
+            return content, preferred_selector
+        soup = BeautifulSoup(raw_html, parser)
+
+    if is_naver:
+        for selector in NAVER_CONTENT_SELECTORS:
+            content = _try_naver_selector(soup, selector)
+            if content:
+                return content, selector
+
+    for selector in GENERAL_CONTENT_SELECTORS:
+        content = _try_general_selector(soup, selector)
+        if content:
+            return content, selector
+
+    content = _try_body(soup)
+    if content:
+        return content, BODY_SELECTOR
+
+    return "", None
+
+
+def extract_content_from_html(raw_html: bytes, url: str, parser: str = 'html.parser') -> str:
+    """HTML에서 기사 본문을 찾아 정제된 텍스트로 반환 (찾지 못하면 빈 문자열)"""
+    return extract_content_with_selector(raw_html, url, parser)[0]
+
+
+def resolve_parser(parser: str) -> str:
+    """사용 가능한 파서 이름 반환 (lxml이 설치되어 있지 않으면 html.parser로 대체)"""
+    if parser == 'html.parser':
+        return parser
+    try:
+        BeautifulSoup('<p></p>', parser)
+        return parser
+    except FeatureNotFound:
+        logger.warning(f"HTML 파서 '{parser}'를 사용할 수 없어 html.parser로 대체합니다")
+        return 'html.parser'
+
+
+def _resolve_processes(processes: int) -> int:
+    return (os.cpu_count() or 1) if processes < 0 else processes
+
+
+class HtmlExtractor:
+    """기사 본문 추출기 (프로세스 풀 사용 시 모든 다운로드 스레드가 공유)"""
+
+    def __init__(
+        self,
+        parser: str = ARTICLE_HTML_PARSER,
+        processes: int = ARTICLE_PARSE_PROCESSES,
+        selector_store: Optional[ContentSelectorStore] = None
+    ):
+        self.parser = resolve_parser(parser)
+        self.selector_store = selector_store
+        self.processes = _resolve_processes(processes)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _submit(self, raw_html: bytes, url: str, preferred: Optional[str]):
+        """프로세스 풀이 켜져 있으면 풀에 파싱 작업을 넣고 Future를, 꺼져 있으면 None을 반환
+
+        풀 생성/작업 제출을 같은 잠금 안에서 하므로 configure()가 풀을 바꾸는 중에도 안전하다.
+        """
+        with self._lock:
+            if self.processes <= 0:
+                return None
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.processes)
+                logger.info(f"본문 파싱 프로세스 풀 시작: {self.processes}개 ({self.parser})")
+            return self._pool.submit(extract_content_with_selector, raw_html, url, self.parser, preferred)
+
+    def extract(self, raw_html: bytes, url: str, domain: Optional[str] = None) -> str:
+        """HTML에서 정제된 본문 추출 (프로세스 풀이 켜져 있으면 풀에서 파싱하고 결과를 기다린다)
+
+        Args:
+            raw_html (bytes): 응답 본문
+            url (str): 기사 URL
+            domain (Optional[str]): 언론사 도메인 (주어지면 학습된 선택자를 먼저 시도하고 결과를 기록)
+        """
+        preferred = None
+        if domain and self.selector_store is not None:
+            preferred = self.selector_store.get(domain)
+        future = self._submit(raw_html, url, preferred)
+        if future is not None:
+            content, selector = future.result()
+        else:
+            content, selector = extract_content_with_selector(raw_html, url, self.parser, preferred)
+        if domain and self.selector_store is not None:
+            self.selector_store.record(domain, preferred, selector)
+        return content
+
+    def configure(self, parser: Optional[str] = None, processes: Optional[int] = None) -> Dict[str, Any]:
+        """파서/프로세스 수 변경 (백필처럼 모든 코어를 써야 할 때 실행 중에 켠다)
+
+        Returns:
+            Dict[str, Any]: 변경 전 설정 (작업이 끝나면 configure(**이전 설정)으로 되돌린다)
+        """
+        previous = self.get_stats()
+        if parser is not None:
+            parser = resolve_parser(parser)
+        with self._lock:
+            if parser is not None:
+                self.parser = parser
+            old_pool = None
+            if processes is not None and _resolve_processes(processes) != self.processes:
+                old_pool, self._pool = self._pool, None
+                self.processes = _resolve_processes(processes)
+        if old_pool is not None:
+            # 이미 제출된 파싱은 끝까지 기다린다 (새 작업은 새 설정으로 실행)
+            old_pool.shutdown(wait=True)
+        return previous
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'parser': self.parser, 'processes': self.processes}
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
@@ -0,0 +1,168 @@
+"""
+공용 HTTP 클라이언트 서비스
+- 호스트별 커넥션 풀 / keep-alive 재사용
+- gzip 압축 응답 자동 해제
+- 풀 통계 (커넥션 재사용률, 열린 커넥션 수) 제공
+- HTTP_RECORD_DIR 지정 시 GET 응답 녹화 (오프라인 벤치마크용 fixture)
+"""
+import os
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+# 기본 풀 크기 (호스트당 유지할 커넥션 수)
+DEFAULT_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+# 동시에 유지할 호스트별 풀 개수
+DEFAULT_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 50))
+DEFAULT_TIMEOUT = 10
+# 지정하면 모든 GET 응답을 이 디렉터리에 녹화
+HTTP_RECORD_DIR = os.getenv('HTTP_RECORD_DIR')
+
+# 호스트별 풀 크기 (요청이 몰리는 호스트는 크게 잡는다)
+HOST_POOL_SIZES = {
+    'openapi.naver.com': 8,
+    'n.news.naver.com': 16,
+    'news.naver.com': 16,
+    'api.telegram.org': 2,
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+class HttpClient:
+    """커넥션 풀을 공유하는 HTTP 클라이언트
+
+    requests.Session 하나를 모든 호출자가 공유하며, 호스트별로 크기가 다른
+    HTTPAdapter를 마운트한다. Session/urllib3 풀은 스레드 간 공유가 가능하다.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        host_pool_sizes: Optional[Dict[str, int]] = None
+    ):
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self._adapters: Dict[str, HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self.recorder = None
+
+        # 기본 어댑터 (그 외 언론사 도메인)
+        default_adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', default_adapter)
+        self.session.mount('https://', default_adapter)
+        self._adapters['*'] = default_adapter
+
+        # 호스트 전용 어댑터
+        for host, size in (host_pool_sizes or HOST_POOL_SIZES).items():
+            self.set_host_pool_size(host, size)
+
+    def set_host_pool_size(self, host: str, pool_maxsize: int):
+        """특정 호스트의 커넥션 풀 크기 설정
+
+        Args:
+            host (str): 호스트명 (예: openapi.naver.com)
+            pool_maxsize (int): 유지할 최대 커넥션 수
+        """
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        with self._lock:
+            self.session.mount(f'https://{host}/', adapter)
+            self.session.mount(f'http://{host}/', adapter)
+            self._adapters[host] = adapter
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공용 세션으로 요청 (timeout 미지정 시 기본값 적용)"""
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        response = self.session.request(method, url, **kwargs)
+        if self.recorder is not None and method == 'GET':
+            self.recorder.record_response(response)
+        return response
+
+    def start_recording(self, root: str):
+        """GET 응답 녹화 시작 (네이버 검색 JSON, 기사 HTML 등)
+
+        Args:
+            root (str): fixture 저장 디렉터리
+        """
+        from .fixture_store import FixtureStore
+        self.recorder = FixtureStore(root)
+        logger.info(f"HTTP 응답 녹화 시작: {root}")
+
+    def stop_recording(self):
+        self.recorder = None
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계 조회
+
+        Returns:
+            Dict[str, Any]: 전체/호스트별 요청 수, 신규 커넥션 수, 재사용률, 열린 커넥션 수
+        """
+        hosts = {}
+        with self._lock:
+            adapters = list(self._adapters.values())
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                # 풀 큐에는 빈 슬롯(None)과 유휴 커넥션이 함께 들어 있다
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                stat = hosts.setdefault(pool.host, {'requests': 0, 'new_connections': 0, 'open_connections': 0, 'pool_maxsize': pool.pool.maxsize if pool.pool else 0})
+                stat['requests'] += pool.num_requests
+                stat['new_connections'] += pool.num_connections
+                stat['open_connections'] += idle
+
+        total_requests = sum(s['requests'] for s in hosts.values())
+        total_connections = sum(s['new_connections'] for s in hosts.values())
+        for stat in hosts.values():
+            stat['reuse_ratio'] = _reuse_ratio(stat['requests'], stat['new_connections'])
+
+        return {
+            'total_requests': total_requests,
+            'new_connections': total_connections,
+            'reuse_ratio': _reuse_ratio(total_requests, total_connections),
+            'open_connections': sum(s['open_connections'] for s in hosts.values()),
+            'hosts': hosts
+        }
+
+    def log_pool_stats(self):
+        """풀 통계 요약 로그 출력"""
+        stats = self.get_pool_stats()
+        logger.info(
+            f"HTTP 풀 통계: 요청 {stats['total_requests']}건, 신규 커넥션 {stats['new_connections']}개, "
+            f"재사용률 {stats['reuse_ratio'] * 100:.1f}%, 열린 커넥션 {stats['open_connections']}개"
+        )
+
+    def close(self):
+        self.session.close()
+
+
+def _reuse_ratio(requests_count: int, connections_count: int) -> float:
+    """요청 중 기존 커넥션을 재사용한 비율"""
+    if requests_count <= 0:
+        return 0.0
+    return round(max(0, requests_count - connections_count) / requests_count, 4)
+
+
+# 전역 서비스 인스턴스
+http_client = HttpClient()
+if HTTP_RECORD_DIR:
+    http_client.start_recording(HTTP_RECORD_DIR)
@@ -5,9 +5,10 @@
 """
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
-import requests
 from loguru import logger
 
+from .http_client import http_client
+
 
 class ImageService:
     """이미지 URL 처리 서비스"""
@@ -31,7 +32,7 @@ class ImageService:
                 return None
                 
             # HEAD 요청으로 이미지 존재 여부 및 타입 확인
-            response = requests.head(url, timeout=5)
+            response = http_client.head(url, timeout=5)
             if response.status_code != 200:
                 return None
                 
@@ -59,7 +60,7 @@ class ImageService:
             
         try:
             # HEAD 요청으로 메타데이터 조회
-            response = requests.head(url, timeout=5)
+            response = http_client.head(url, timeout=5)
             if response.status_code != 200:
                 return {}
                 
@@ -87,7 +88,7 @@ class ImageService:
             return False
             
         try:
-            response = requests.head(url, timeout=5)
+            response = http_client.head(url, timeout=5)
             return response.status_code == 200 and response.headers.get('content-type', '').startswith('image/')
         except Exception as e:
             logger.warning(f"이미지 존재 여부 확인 실패 ({url}): {e}")
@@ -0,0 +1,138 @@
+"""
+키워드 다중 매칭 서비스
+- 키워드 목록을 하나의 정규식으로 한 번만 컴파일
+- 텍스트를 한 번 훑어 모든 키워드의 출현 여부/횟수를 반환
+- `any(term in text ...)`, `sum(1 for term in ... if term in text)` 루프 대체
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번에 찾는 매처
+
+    키워드를 길이 내림차순으로 정렬해 하나의 alternation 정규식으로 컴파일한다.
+    각 위치에서는 가장 긴 키워드만 매칭되므로, 같은 위치에서 시작하는 짧은 키워드
+    (예: 'LG'와 'LG전자'를 함께 등록했을 때의 'LG')는 미리 계산해 둔 접두사 표로 함께 집계한다.
+    다음 검색은 매칭 시작 위치 바로 다음 글자부터 하므로 겹치는 키워드
+    (예: '대상홀딩스' 안의 '홀딩스')도 모두 찾으며, 결과는 `term in text` 루프와 동일하다.
+    """
+
+    def __init__(self, terms: Iterable[str], patterns: Optional[Iterable[str]] = None, ignore_case: bool = False):
+        """
+        Args:
+            terms (Iterable[str]): 찾을 키워드 목록 (중복은 한 번만 등록)
+            patterns (Optional[Iterable[str]]): 추가로 검사할 정규식 패턴 목록
+            ignore_case (bool): 대소문자 무시 여부
+        """
+        self.ignore_case = ignore_case
+        self.terms: List[str] = list(dict.fromkeys(term for term in terms if term))
+        self.patterns: List[str] = list(patterns or [])
+
+        # 정규화 키 → 원본 키워드 (대소문자 무시 시 같은 키에 여러 키워드가 묶일 수 있다)
+        self._by_key: Dict[str, List[str]] = {}
+        for term in self.terms:
+            self._by_key.setdefault(self._normalize(term), []).append(term)
+
+        # 매칭된 키 → 같은 위치에서 함께 집계할 원본 키워드 목록
+        # (자기 자신 + 접두사인 짧은 키워드, 같은 위치에서 함께 매칭된 것으로 본다)
+        keys = list(self._by_key)
+        self._hit_terms: Dict[str, List[str]] = {
+            key: [term for other in keys if key.startswith(other) for term in self._by_key[other]]
+            for key in keys
+        }
+
+        flags = re.IGNORECASE if ignore_case else 0
+        if keys:
+            alternation = '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+            self._term_regex = re.compile(alternation, flags)
+        else:
+            self._term_regex = None
+
+        # 정규식 패턴은 이름 있는 그룹으로 묶어 한 번에 검사
+        if self.patterns:
+            combined = '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(self.patterns))
+            self._pattern_regex = re.compile(combined, flags)
+        else:
+            self._pattern_regex = None
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def count(self, text: str) -> Dict[str, int]:
+        """텍스트에 등장한 키워드별 출현 횟수 (겹치는 출현 포함)
+
+        Args:
+            text (str): 검사할 텍스트
+
+        Returns:
+            Dict[str, int]: 등장한 키워드 → 출현 횟수 (등장하지 않은 키워드는 제외)
+        """
+        counts: Dict[str, int] = {}
+        if not text or self._term_regex is None:
+            return counts
+
+        search = self._term_regex.search
+        normalize = self._normalize
+        hit_terms = self._hit_terms
+        match = search(text)
+        while match:
+            for term in hit_terms[normalize(match.group())]:
+                counts[term] = counts.get(term, 0) + 1
+            match = search(text, match.start() + 1)
+        return counts
+
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 등장한 키워드 집합"""
+        return set(self.count(text))
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 등장하는지 여부"""
+        return bool(text) and self._term_regex is not None and self._term_regex.search(text) is not None
+
+    def count_distinct(self, text: str, limit: Optional[int] = None) -> int:
+        """등장한 서로 다른 키워드 수 (`sum(1 for term in terms if term in text)`와 동일)
+
+        Args:
+            text (str): 검사할 텍스트
+            limit (Optional[int]): 서로 다른 키워드가 이만큼 나오면 나머지는 훑지 않는다
+                (임계값 이상인지만 알면 될 때, 이때 반환값은 limit 이상이지만 전체 개수보다 작을 수 있다)
+
+        Returns:
+            int: 서로 다른 키워드 수 (limit에 닿지 않았으면 정확한 개수)
+        """
+        if not text or self._term_regex is None:
+            return 0
+
+        search = self._term_regex.search
+        normalize = self._normalize
+        hit_terms = self._hit_terms
+        found: Set[str] = set()
+        match = search(text)
+        while match:
+            found.update(hit_terms[normalize(match.group())])
+            if limit is not None and len(found) >= limit:
+                break
+            match = search(text, match.start() + 1)
+        return len(found)
+
+    def first_term(self, text: str) -> Optional[str]:
+        """등장한 키워드 중 목록 순서상 가장 앞선 키워드 (`for term in terms: if term in text` 와 동일)"""
+        hits = self.count(text)
+        for term in self.terms:
+            if term in hits:
+                return term
+        return None
+
+    def matched_patterns(self, text: str) -> List[str]:
+        """등장한 정규식 패턴 목록 (목록 순서)
+
+        한 번의 finditer로 검사하므로 같은 구간에 겹쳐 매칭되는 패턴은 먼저 매칭된 것만 집계된다.
+        패턴이 하나라도 등장하는지 여부는 정확하다.
+        """
+        if not text or self._pattern_regex is None:
+            return []
+        found = set()
+        for match in self._pattern_regex.finditer(text):
+            found.add(int(match.lastgroup[1:]))
+        return [self.patterns[i] for i in sorted(found)]
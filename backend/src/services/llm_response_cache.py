@@ -0,0 +1,204 @@
+"""
+LLM 응답 캐시 서비스
+- (프롬프트 버전, 모델, 키워드, 정규화한 제목+본문)의 해시를 키로 OpenAI 원본 응답을 SQLite에 저장
+- 같은 보도자료를 옮겨 실은 기사, 같은 기사 재분류(스키마 수정 후 재실행 등)는 API를 다시 호출하지 않음
+- 프롬프트 템플릿이나 모델이 바뀌면 키가 달라지므로 이전 응답은 자연히 쓰이지 않음
+- 오래된 응답(일 단위)과 최대 개수를 넘는 응답(최근에 쓰지 않은 것부터)을 정리
+- 동시에 같은 키를 요청하면 먼저 시작한 호출 결과를 기다려 함께 사용
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, Optional
+
+from loguru import logger
+
+from .text_cleaner import clean_text
+
+# 응답 보관 기간 (일)
+LLM_CACHE_MAX_AGE_DAYS = int(os.getenv('LLM_CACHE_MAX_AGE_DAYS', 30))
+# 보관할 최대 응답 수 (넘으면 최근에 쓰지 않은 것부터 삭제)
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 50000))
+# 이 횟수만큼 저장할 때마다 정리
+EVICT_EVERY_PUTS = 200
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS llm_response_cache (
+        cache_key TEXT PRIMARY KEY,
+        prompt_version TEXT,
+        model TEXT,
+        keyword TEXT,
+        response TEXT NOT NULL,
+        hits INTEGER DEFAULT 0,
+        created_at TEXT,
+        last_used_at TEXT
+    )
+"""
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def prompt_version(*templates: str) -> str:
+    """프롬프트 템플릿(시스템 프롬프트 포함) 내용으로 만든 버전 문자열"""
+    digest = hashlib.sha256('\x00'.join(templates).encode('utf-8')).hexdigest()
+    return digest[:12]
+
+
+def make_cache_key(version: str, model: str, keyword: str, title: str, content: str) -> str:
+    """캐시 키 (태그/엔티티/공백 차이는 같은 기사로 본다)"""
+    parts = [version, model, keyword or '', clean_text(title or ''), clean_text(content or '')]
+    return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """LLM 원본 응답 캐시 (스레드 안전)
+
+    응답 원문을 저장하므로 파싱 로직이 바뀌어도 캐시된 응답을 그대로 다시 해석할 수 있다.
+    호출이 실패하면 저장하지 않는다.
+    """
+
+    def __init__(self, db_path: str, max_age_days: int = LLM_CACHE_MAX_AGE_DAYS,
+                 max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self._table_ready = False
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._puts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._table_ready:
+            conn.execute(CREATE_TABLE_SQL)
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def _expiry(self) -> str:
+        return (datetime.now() - timedelta(days=self.max_age_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+    def get(self, key: str) -> Optional[str]:
+        """저장된 응답 (없거나 보관 기간이 지났으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT response FROM llm_response_cache WHERE cache_key = ? AND created_at >= ?",
+                (key, self._expiry())
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE llm_response_cache SET hits = hits + 1, last_used_at = ? WHERE cache_key = ?",
+                    (_now(), key)
+                )
+                conn.commit()
+        finally:
+            conn.close()
+        with self._lock:
+            if row:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return row[0] if row else None
+
+    def put(self, key: str, response: str, version: str = None, model: str = None, keyword: str = None):
+        now = _now()
+        conn = self._connect()
+        try:
+            conn.execute("""
+                INSERT OR REPLACE INTO llm_response_cache
+                (cache_key, prompt_version, model, keyword, response, hits, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+            """, (key, version, model, keyword, response, now, now))
+            conn.commit()
+        finally:
+            conn.close()
+        with self._lock:
+            self._puts += 1
+            evict = self._puts % EVICT_EVERY_PUTS == 0
+        if evict:
+            self.evict()
+
+    def get_or_create(self, key: str, create: Callable[[], str], version: str = None,
+                      model: str = None, keyword: str = None) -> str:
+        """캐시에 있으면 저장된 응답을, 없으면 create()로 호출해 저장 후 반환
+
+        Args:
+            key (str): make_cache_key로 만든 키
+            create (Callable[[], str]): 실제 LLM 호출 (응답 원문 반환)
+            version, model, keyword: 정리/조회용으로 함께 저장할 값
+
+        Returns:
+            str: LLM 응답 원문
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+        if not owner:
+            with self._lock:
+                self._hits += 1
+            return future.result()
+        try:
+            response = self.get(key)
+            if response is None:
+                response = create()
+                self.put(key, response, version, model, keyword)
+        except BaseException as e:
+            # 실패한 호출은 저장하지 않는다 (기다리던 쪽에는 같은 오류 전달)
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+        future.set_result(response)
+        return response
+
+    def evict(self) -> int:
+        """보관 기간이 지난 응답과 최대 개수를 넘는 응답 삭제
+
+        Returns:
+            int: 삭제한 응답 수
+        """
+        conn = self._connect()
+        try:
+            removed = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?", (self._expiry(),)
+            ).rowcount
+            removed += conn.execute("""
+                DELETE FROM llm_response_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_response_cache
+                    ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        if removed:
+            logger.debug(f"LLM 응답 캐시 정리: {removed}건 삭제")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            entries = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+        finally:
+            conn.close()
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'lookups': lookups,
+                'hits': self._hits,
+                'calls': self._misses,
+                'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+                'entries': entries
+            }
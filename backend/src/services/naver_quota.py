@@ -0,0 +1,201 @@
+"""
+네이버 검색 API 할당량 관리 서비스
+- 토큰 버킷으로 초당 호출 수 제한 (고정 sleep 대신 허용 가능한 최고 속도로 호출)
+- 429 응답 시 속도를 낮추고 성공이 이어지면 다시 올리는 적응형 속도 조절
+- 429 응답은 잠시 기다렸다가 같은 요청을 다시 보내고, 계속되면 NaverThrottledError
+- 일일 호출 수를 SQLite 장부(naver_api_usage)에 기록
+- 남은 할당량이 적으면 자사 키워드 호출만 허용
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Set
+
+from loguru import logger
+
+# 네이버 검색 API 일일 호출 한도 (애플리케이션 기준)
+NAVER_API_DAILY_QUOTA = int(os.getenv('NAVER_API_DAILY_QUOTA', 25000))
+# 초당 최대 호출 수
+NAVER_API_RATE_PER_SEC = float(os.getenv('NAVER_API_RATE_PER_SEC', 10))
+# 남은 할당량이 이 비율 아래로 떨어지면 자사 키워드만 호출
+NAVER_API_RESERVE_RATIO = float(os.getenv('NAVER_API_RESERVE_RATIO', 0.1))
+# 429 응답 시 같은 요청을 다시 보낼 최대 횟수
+NAVER_API_MAX_RETRIES = int(os.getenv('NAVER_API_MAX_RETRIES', 3))
+
+MIN_RATE_PER_SEC = 1.0
+# 429 재시도 대기 (초, 재시도마다 두 배)
+THROTTLE_BACKOFF_BASE = 1.0
+THROTTLE_BACKOFF_MAX = 30.0
+# 자사 키워드 목록 캐시 유지 시간 (초)
+PRIORITY_CACHE_SECONDS = 600
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS naver_api_usage (
+        usage_date TEXT PRIMARY KEY,
+        call_count INTEGER DEFAULT 0,
+        throttled_count INTEGER DEFAULT 0,
+        denied_count INTEGER DEFAULT 0,
+        updated_at TEXT
+    )
+"""
+
+
+class QuotaExceededError(Exception):
+    """일일 할당량 부족으로 호출이 거부된 경우"""
+
+
+class NaverThrottledError(Exception):
+    """재시도 후에도 429(속도 제한) 응답이 계속된 경우"""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (토큰이 모자라면 다음 토큰 시점까지 대기)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 미리 차감해 대기 중인 호출들이 일정 간격으로 순서대로 나가도록 한다
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self.rate = rate
+
+
+class NaverQuotaManager:
+    """네이버 검색 API 호출 속도/일일 할당량 관리자 (모든 호출자가 공유)"""
+
+    def __init__(
+        self,
+        db_path: str,
+        daily_quota: int = NAVER_API_DAILY_QUOTA,
+        rate_per_sec: float = NAVER_API_RATE_PER_SEC,
+        reserve_ratio: float = NAVER_API_RESERVE_RATIO
+    ):
+        self.db_path = db_path
+        self.daily_quota = daily_quota
+        self.max_rate = rate_per_sec
+        self.reserve_ratio = reserve_ratio
+        self.bucket = TokenBucket(rate_per_sec, capacity=max(1.0, rate_per_sec))
+        self._lock = threading.Lock()
+        self._table_ready = False
+        self._priority_keywords: Set[str] = set()
+        self._priority_loaded_at = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self._table_ready:
+            conn.execute(CREATE_TABLE_SQL)
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def _increment(self, column: str):
+        """오늘 날짜 장부의 카운터 1 증가"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        conn = self._connect()
+        try:
+            conn.execute(f"""
+                INSERT INTO naver_api_usage (usage_date, {column}, updated_at) VALUES (?, 1, ?)
+                ON CONFLICT(usage_date) DO UPDATE SET {column} = {column} + 1, updated_at = excluded.updated_at
+            """, (today, now))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_usage(self) -> Dict[str, Any]:
+        """오늘 사용량 조회
+
+        Returns:
+            Dict[str, Any]: 호출 수, 남은 할당량, 429 횟수, 거부 횟수, 현재 호출 속도
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT call_count, throttled_count, denied_count FROM naver_api_usage WHERE usage_date = ?",
+                (today,)
+            ).fetchone()
+        finally:
+            conn.close()
+        calls, throttled, denied = row if row else (0, 0, 0)
+        return {
+            'date': today,
+            'daily_quota': self.daily_quota,
+            'calls': calls,
+            'remaining': max(0, self.daily_quota - calls),
+            'throttled': throttled,
+            'denied': denied,
+            'rate_per_sec': round(self.bucket.rate, 2),
+            'priority_only': self.daily_quota - calls <= self.daily_quota * self.reserve_ratio
+        }
+
+    def _is_priority_keyword(self, keyword: str) -> bool:
+        """자사 키워드 여부 (keywords.type 기준, 주기적으로 다시 읽는다)"""
+        if time.monotonic() - self._priority_loaded_at > PRIORITY_CACHE_SECONDS:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    rows = conn.execute("SELECT keyword FROM keywords WHERE type = '자사' AND is_active = 1").fetchall()
+                finally:
+                    conn.close()
+                self._priority_keywords = {row[0] for row in rows}
+            except sqlite3.Error as e:
+                logger.warning(f"자사 키워드 조회 실패: {e}")
+            self._priority_loaded_at = time.monotonic()
+        return keyword in self._priority_keywords
+
+    def acquire(self, keyword: str):
+        """API 호출 전 할당량 확인 및 속도 제한 대기
+
+        Args:
+            keyword (str): 검색 키워드 (할당량 부족 시 자사 키워드만 허용)
+
+        Raises:
+            QuotaExceededError: 일일 할당량이 소진되었거나, 예비 할당량 구간에서 자사 키워드가 아닌 경우
+        """
+        with self._lock:
+            usage = self.get_usage()
+            if usage['remaining'] <= 0 or (usage['priority_only'] and not self._is_priority_keyword(keyword)):
+                self._increment('denied_count')
+                raise QuotaExceededError(
+                    f"네이버 API 할당량 부족 (남은 호출 {usage['remaining']}회) - '{keyword}' 호출 보류"
+                )
+            self._increment('call_count')
+        self.bucket.acquire()
+
+    def report_throttled(self):
+        """429 응답 - 호출 속도를 절반으로 낮춘다"""
+        self._increment('throttled_count')
+        new_rate = max(MIN_RATE_PER_SEC, self.bucket.rate / 2)
+        self.bucket.set_rate(new_rate)
+        logger.warning(f"네이버 API 속도 제한 응답(429) - 호출 속도 {new_rate:.1f}회/초로 조정")
+
+    def throttle_delay(self, attempt: int, retry_after=None) -> float:
+        """429 응답 후 재시도까지 기다릴 시간 (Retry-After 헤더가 있으면 우선)"""
+        try:
+            if retry_after is not None:
+                return min(THROTTLE_BACKOFF_MAX, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass
+        return min(THROTTLE_BACKOFF_MAX, THROTTLE_BACKOFF_BASE * (2 ** attempt))
+
+    def report_success(self):
+        """정상 응답 - 최대 속도까지 조금씩 회복"""
+        if self.bucket.rate < self.max_rate:
+            self.bucket.set_rate(min(self.max_rate, self.bucket.rate + 0.5))
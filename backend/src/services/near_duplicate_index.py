@@ -0,0 +1,229 @@
+"""
+근접 중복 기사 인덱스 서비스
+- 같은 보도자료가 여러 언론사에 다른 URL로 실리는 경우를 SimHash 지문으로 묶음
+- 정제된 제목+본문의 단어 2-gram으로 64비트 SimHash 계산
+- 지문을 16비트 구간(band) 4개로 나눈 multi-probe LSH 색인으로 후보만 비교 (전체 기사와 비교하지 않음)
+- 저장 시 cluster_id 부여 (대시보드/분류기가 묶음 하나를 한 단위로 처리)
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from itertools import combinations
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+# 같은 묶음으로 볼 최대 해밍 거리 (64비트 중 다른 비트 수)
+# 같은 보도자료 재게재(바이라인/꼬리말만 다름)는 대개 7 이하, 무관한 기사끼리는 15 이상
+NEAR_DUPLICATE_MAX_DISTANCE = int(os.getenv('NEAR_DUPLICATE_MAX_DISTANCE', 7))
+# 지문을 만들 최소 토큰 수 (본문이 너무 짧으면 엉뚱한 기사끼리 묶이므로 묶지 않음)
+MIN_TOKENS = 20
+
+FINGERPRINT_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = FINGERPRINT_BITS // BAND_COUNT
+_MASK = (1 << FINGERPRINT_BITS) - 1
+_TOKEN_PATTERN = re.compile(r'[0-9a-zA-Z가-힣&]+')
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장할 수 있도록 변환"""
+    return value - (1 << FINGERPRINT_BITS) if value >= 1 << (FINGERPRINT_BITS - 1) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value & _MASK
+
+
+def compute_simhash(title: str, content: str) -> Optional[int]:
+    """정제된 제목+본문의 64비트 SimHash (토큰이 너무 적으면 None)
+
+    비트마다 모든 shingle을 도는 대신, shingle 해시의 바이트 위치별로 바이트 값 가중치만 누적한 뒤
+    (위치 8개 × 값 256개) 표에서 비트별 합을 구한다. 결과는 일반적인 SimHash와 같다.
+
+    Args:
+        title (str): 정제된 제목
+        content (str): 정제된 본문
+
+    Returns:
+        Optional[int]: 부호 없는 64비트 지문
+    """
+    tokens = _TOKEN_PATTERN.findall(f"{title} {content}".lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+    shingles = Counter(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    byte_weights = [[0] * 256 for _ in range(8)]
+    total = 0
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+        for position, value in enumerate(digest):
+            byte_weights[position][value] += count
+        total += count
+    fingerprint = 0
+    for position, weights in enumerate(byte_weights):
+        shift = (7 - position) * 8  # 빅엔디언: 첫 바이트가 최상위
+        for bit in range(8):
+            bit_sum = sum(weight for value, weight in enumerate(weights) if weight and value >> bit & 1)
+            # 해당 비트가 1인 shingle 가중치가 절반을 넘으면 1
+            if bit_sum * 2 > total:
+                fingerprint |= 1 << (shift + bit)
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """SimHash LSH 색인 (스레드 안전, 앱 시작 시 articles에서 로드)
+
+    지문을 16비트 구간 4개로 나누면, 거리가 k 이하인 두 지문은 적어도 한 구간에서
+    k // 4 비트 이하만 다르다 (비둘기집 원리). 각 구간 값과 그 값에서 k // 4 비트 이하를 뒤집은 값의
+    버킷만 후보로 비교하므로, 기사가 100만 건이어도 버킷당 후보는 수십 건 수준이다.
+    """
+
+    def __init__(self, db_path: str, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE):
+        self.db_path = db_path
+        self.max_distance = max_distance
+        # 구간마다 탐색할 비트 뒤집기 마스크 (0 포함)
+        radius = max_distance // BAND_COUNT
+        self._probe_masks: List[int] = [
+            sum(1 << bit for bit in bits)
+            for r in range(radius + 1)
+            for bits in combinations(range(BAND_BITS), r)
+        ]
+        self._buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(BAND_COUNT)]
+        self._clusters: Dict[int, int] = {}  # 지문 → cluster_id
+        self._warmed = False
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        self._near_duplicates = 0
+
+    @staticmethod
+    def _band_keys(fingerprint: int) -> List[int]:
+        mask = (1 << BAND_BITS) - 1
+        return [(fingerprint >> (band * BAND_BITS)) & mask for band in range(BAND_COUNT)]
+
+    def ensure_schema(self, conn: sqlite3.Connection):
+        """articles에 simhash, cluster_id 컬럼과 cluster_id 인덱스 추가 (이미 있으면 건너뜀)"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+        for column in ('simhash', 'cluster_id'):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE articles ADD COLUMN {column} INTEGER")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_cluster_id ON articles(cluster_id)")
+        conn.commit()
+
+    def _insert_locked(self, fingerprint: int, cluster_id: int):
+        if fingerprint in self._clusters:
+            return
+        self._clusters[fingerprint] = cluster_id
+        for bucket, key in zip(self._buckets, self._band_keys(fingerprint)):
+            bucket[key].append(fingerprint)
+
+    def warm(self):
+        """저장된 기사 지문으로 색인 구성 (앱 시작 시 한 번)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT simhash, cluster_id FROM articles WHERE simhash IS NOT NULL ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+        with self._lock:
+            self._buckets = [defaultdict(list) for _ in range(BAND_COUNT)]
+            self._clusters = {}
+            for simhash, cluster_id in rows:
+                self._insert_locked(_to_unsigned(simhash), cluster_id)
+            self._warmed = True
+        logger.info(f"근접 중복 색인 로드 완료: 지문 {len(self._clusters)}개")
+
+    def _ensure_warm(self):
+        if not self._warmed:
+            with self._warm_lock:
+                if not self._warmed:
+                    self.warm()
+
+    def _find_locked(self, fingerprint: int) -> Optional[int]:
+        """가장 가까운 기존 지문의 cluster_id (최대 거리 이내 후보가 없으면 None)"""
+        if fingerprint in self._clusters:
+            return self._clusters[fingerprint]
+        best_distance = self.max_distance + 1
+        best_cluster = None
+        seen = set()
+        for bucket, key in zip(self._buckets, self._band_keys(fingerprint)):
+            for probe in self._probe_masks:
+                for candidate in bucket.get(key ^ probe, ()):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    distance = bin(candidate ^ fingerprint).count('1')
+                    if distance < best_distance:
+                        best_distance = distance
+                        best_cluster = self._clusters[candidate]
+        return best_cluster
+
+    def assign(self, title: str, content: str) -> Tuple[Optional[int], Optional[int]]:
+        """기사 지문 계산 후 cluster_id 부여 (색인에도 바로 반영)
+
+        비슷한 기존 기사가 있으면 그 묶음의 cluster_id를, 없으면 자기 지문을 새 cluster_id로 쓴다.
+
+        Args:
+            title (str): 정제된 제목
+            content (str): 정제된 본문
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: (simhash, cluster_id) - SQLite에 바로 저장 가능한 값,
+                본문이 너무 짧으면 (None, None)
+        """
+        self._ensure_warm()  # 저장 전에 articles.simhash/cluster_id 컬럼이 있도록 보장
+        fingerprint = compute_simhash(title, content)
+        if fingerprint is None:
+            return None, None
+        with self._lock:
+            cluster_id = self._find_locked(fingerprint)
+            if cluster_id is None:
+                cluster_id = _to_signed(fingerprint)
+            else:
+                self._near_duplicates += 1
+            self._insert_locked(fingerprint, cluster_id)
+        return _to_signed(fingerprint), cluster_id
+
+    def backfill(self, batch_size: int = 1000) -> int:
+        """지문이 없는 기존 기사에 simhash/cluster_id 채우기 (오래된 기사부터)
+
+        Returns:
+            int: 처리한 기사 수
+        """
+        self._ensure_warm()
+        processed = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    "SELECT id, title, content FROM articles WHERE simhash IS NULL AND id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
+                if not rows:
+                    break
+                updates = []
+                for article_id, title, content in rows:
+                    simhash, cluster_id = self.assign(title or '', content or '')
+                    if simhash is not None:
+                        updates.append((simhash, cluster_id, article_id))
+                with conn:
+                    conn.executemany("UPDATE articles SET simhash = ?, cluster_id = ? WHERE id = ?", updates)
+                processed += len(rows)
+                last_id = rows[-1][0]
+        finally:
+            conn.close()
+        return processed
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'fingerprints': len(self._clusters),
+                'clusters': len(set(self._clusters.values())),
+                'near_duplicates_found': self._near_duplicates,
+                'max_distance': self.max_distance
+            }
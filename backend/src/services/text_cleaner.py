@@ -0,0 +1,48 @@
+"""
+텍스트 정제 서비스
+- 기사 제목/본문 공통 정제 (HTML 태그/엔티티, 특수 공백, psp 제거, 공백 정리)
+- 수집 API와 본문 추출 프로세스가 함께 사용 (Flask 등 무거운 의존성 없음)
+- 정규식은 미리 컴파일하고, 문자열 전체를 훑는 횟수를 줄인다 (없는 문자/패턴은 건너뜀)
+"""
+import re
+import html
+
+# HTML 태그 (<.*?>와 같은 결과: 줄바꿈을 넘지 않고 처음 나오는 > 까지, 되돌아가기 없음)
+_TAG_RE = re.compile(r'<[^>\n]*>')
+_PSP_RE = re.compile(r'psp', re.IGNORECASE)
+
+# NBSP/폭 없는 공백류는 공백으로, WORD JOINER는 삭제
+# (한글 본문에서는 str.translate가 문자마다 표를 찾아 느리므로, 있는 문자만 str.replace로 바꾼다)
+_SPECIAL_SPACES = (
+    ('\u00A0', ' '),  # NO-BREAK SPACE
+    ('\u200B', ' '),  # ZERO WIDTH SPACE
+    ('\u200C', ' '),  # ZERO WIDTH NON-JOINER
+    ('\u200D', ' '),  # ZERO WIDTH JOINER
+    ('\uFEFF', ' '),  # ZWNBSP (BOM)
+    ('\u2060', ''),   # WORD JOINER
+)
+
+
+def clean_text(text):
+    """텍스트 정제 (HTML 태그 제거, NBSP 제거, 공백 정리, psp 제거, ZWNBSP 제거)
+
+    순서가 결과에 영향을 주므로 기존 정제 순서(태그 → 엔티티 → 특수 공백 → psp → 공백 정리)를 그대로 따른다.
+    """
+    if not text:
+        return ''
+    # HTML 태그 제거
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    # HTML 엔티티 디코딩 (디코딩 결과로 생긴 '&nbsp;' 문자열도 공백으로)
+    if '&' in text:
+        text = html.unescape(text)
+        if '&nbsp;' in text:
+            text = text.replace('&nbsp;', ' ')
+    # NBSP 및 특수 공백 문자 처리
+    for char, replacement in _SPECIAL_SPACES:
+        if char in text:
+            text = text.replace(char, replacement)
+    # psp(대소문자 구분 없이) 모두 제거
+    text = _PSP_RE.sub('', text)
+    # 연속된 공백 정리 (\s와 str.isspace는 같은 문자 집합)
+    return ' '.join(text.split())
@@ -0,0 +1,39 @@
+"""
+LLM 토큰 수 계산 서비스
+- tiktoken이 설치되어 있으면 모델의 토크나이저로 정확히 계산
+- 없으면 글자 종류별 근사치 사용 (한글/한자 1글자 ≈ 1토큰, 그 밖의 문자 4글자 ≈ 1토큰, 넉넉하게 올림)
+"""
+import math
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_MODEL = "gpt-4o"
+
+# 근사치 계산용: 한글/한자/가나 등 글자 하나가 대략 토큰 하나인 문자
+_WIDE_CHAR_RE = re.compile(r'[\u1100-\u11FF\u3040-\u30FF\u3130-\u318F\u3400-\u9FFF\uAC00-\uD7AF\uF900-\uFAFF]')
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """text의 토큰 수 (tiktoken이 없으면 근사치)"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    wide = len(_WIDE_CHAR_RE.findall(text))
+    return wide + math.ceil((len(text) - wide) / 4)
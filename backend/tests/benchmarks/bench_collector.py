@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+뉴스 수집기 벤치마크 모음
+녹화된 응답(fixture)을 로컬 대체 서버로 재생해 실제 네이버 API/언론사 없이 다음을 측정합니다.
+- run_news_collection 처리량 (초당 검색/저장 기사 수)
+- 기사 1건 저장 지연 p50/p99 (save_article_to_db: 본문 필터 + 근접 중복 + 저장)
+- clean_text, 본문 추출(extract_article_content의 HTML 파싱 부분) KB당 비용
+- SQLite 쓰기 처리량 (ArticleBatchWriter 배치 크기/synchronous 별)
+
+결과는 results/latest.json에 저장하고 baselines/collector.json과 비교해 허용 범위(기본 20%)보다
+나빠진 지표가 있으면 종료 코드 1을 돌려줍니다. 녹화본이 없으면 합성 fixture를 만들어 사용합니다.
+저장소의 기준값은 합성 fixture로 측정한 값이며, 측정한 머신은 기준값의 platform/cpu_count에 남아 있습니다.
+다른 머신에서 비교할 때는 그 머신에서 --update-baseline으로 기준값을 다시 만드세요.
+
+실행:
+    python backend/tests/benchmarks/bench_collector.py                      # 합성 fixture
+    python backend/tests/benchmarks/bench_collector.py --fixtures backend/tests/fixtures/naver --latency-ms 50
+    python backend/tests/benchmarks/bench_collector.py --update-baseline    # 현재 결과를 기준값으로 저장
+    python backend/tests/benchmarks/bench_collector.py --require-baseline   # CI: 기준값이 없으면 실패
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(BENCH_DIR, '..', '..', '..'))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(BENCH_DIR)
+
+from backend.src.services.fixture_store import FixtureStore, fixture_key
+from naver_stub_server import start_stub_server, SEARCH_PATH
+
+RESULTS_PATH = os.path.join(BENCH_DIR, 'results', 'latest.json')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baselines', 'collector.json')
+
+BENCH_KEYWORDS = [('F&F', '자사', 'F&F'), ('MLB', '자사', 'F&F'), ('디스커버리', '자사', 'F&F'), ('나이키', '경쟁사', '경쟁사')]
+
+SENTENCES = [
+    "패션 브랜드가 올 가을 신상품을 공개했다.",
+    "업계 관계자는 소비 심리가 회복되고 있다고 말했다.",
+    "F&F는 오늘 중국 시장 확대 계획을 밝혔다.",
+    "이번 컬렉션은 MZ세대를 겨냥한 디자인이 특징이다.",
+    "매장 방문객은 전년 대비 두 배 가까이 늘었다.",
+    "회사 측은 하반기에도 성장세가 이어질 것으로 내다봤다.",
+    "MLB 브랜드는 아시아 시장에서 꾸준히 매출을 늘리고 있다.",
+]
+
+
+# ============================================================================
+# 합성 fixture / 벤치마크 DB
+# ============================================================================
+
+def build_article_html(rng, paragraphs):
+    body = ''.join(
+        f"<p>{' '.join(rng.choice(SENTENCES) for _ in range(5))}&nbsp;</p>\n" for _ in range(paragraphs)
+    )
+    return (
+        "<html><head><title>기사</title><script>var ad = 1;</script><style>p{}</style></head><body>"
+        "<header><nav>홈 | 경제 | 사회</nav></header>"
+        f"<article><h1>기사 제목</h1>{body}<div class='advertisement'>광고</div></article>"
+        "<footer>무단전재 및 재배포 금지</footer></body></html>"
+    ).encode('utf-8')
+
+
+def build_synthetic_fixtures(root, article_count=200, seed=7):
+    """녹화본 대신 쓸 합성 fixture (검색 결과 1페이지 + 기사 HTML) 생성"""
+    rng = random.Random(seed)
+    store = FixtureStore(root)
+    now = datetime.now().astimezone()
+    items = []
+    for i in range(article_count):
+        link = f"https://press{i % 20}.co.kr/news/article/{i}"
+        store.save(fixture_key(link), link, 200, 'text/html; charset=utf-8', build_article_html(rng, rng.randint(4, 40)))
+        items.append({
+            'title': f"{rng.choice(['F&F', 'MLB', '디스커버리'])} {rng.choice(SENTENCES)}",
+            'originallink': link,
+            'link': link,
+            'description': rng.choice(SENTENCES),
+            'pubDate': (now - timedelta(minutes=i)).strftime('%a, %d %b %Y %H:%M:%S %z'),
+        })
+    search_url = f"https://openapi.naver.com{SEARCH_PATH}?query=fixture&display=100&start=1&sort=date"
+    store.save(fixture_key(search_url), search_url, 200, 'application/json', json.dumps({'items': items}, ensure_ascii=False).encode('utf-8'))
+    return store
+
+
+def create_bench_db(path):
+    """벤치마크 전용 DB (운영 DB를 건드리지 않음)"""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE keywords (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ip TEXT NOT NULL DEFAULT '',
+            keyword TEXT NOT NULL,
+            group_name TEXT,
+            type TEXT DEFAULT '자사',
+            is_active BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            keyword TEXT NOT NULL,
+            group_name TEXT,
+            title TEXT,
+            content TEXT,
+            press TEXT,
+            pub_date TEXT,
+            url TEXT UNIQUE,
+            simhash INTEGER,
+            cluster_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+    conn.executemany(
+        "INSERT INTO keywords (keyword, type, group_name, is_active) VALUES (?, ?, ?, 1)", BENCH_KEYWORDS
+    )
+    conn.commit()
+    conn.close()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def metric(value, unit, better):
+    return {'value': round(value, 4), 'unit': unit, 'better': better}
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def bench_clean_text(news_api, store):
+    """clean_text KB당 비용 (기사 HTML을 그대로 넣어 태그/엔티티 처리까지 포함)"""
+    samples = [store.load(meta['key'])['body'].decode('utf-8', 'ignore')
+               for meta in store.iter_meta() if 'html' in meta.get('content_type', '')][:100]
+    total_kb = sum(len(text.encode('utf-8')) for text in samples) / 1024
+    repeat = 5
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in samples:
+            news_api.clean_text(text)
+    elapsed = time.perf_counter() - started
+    return {'clean_text_us_per_kb': metric(elapsed / (total_kb * repeat) * 1e6, 'us/KB', 'lower')}
+
+
+def bench_extract(news_api, store):
+    """본문 추출 KB당 비용 (네트워크 제외, 파서 + 선택자 탐색 + 정제)"""
+    pages = [(meta['url'], store.load(meta['key'])['body'])
+             for meta in store.iter_meta() if 'html' in meta.get('content_type', '')][:100]
+    total_kb = sum(len(body) for _, body in pages) / 1024
+    started = time.perf_counter()
+    for url, body in pages:
+        news_api.html_extractor.extract(body, url)
+    elapsed = time.perf_counter() - started
+    return {'extract_us_per_kb': metric(elapsed / total_kb * 1e6, 'us/KB', 'lower')}
+
+
+def bench_save_latency(news_api, store, round_no=0):
+    """기사 1건 저장 지연 (본문 필터 + 근접 중복 지문 + 일괄 저장 버퍼, 커밋 포함)"""
+    from backend.src.services.article_writer import ArticleBatchWriter
+    pages = [(meta['url'], store.load(meta['key'])['body'])
+             for meta in store.iter_meta() if 'html' in meta.get('content_type', '')][:200]
+    contents = [news_api.html_extractor.extract(body, url) for url, body in pages]
+    writer = ArticleBatchWriter(news_api.DB_PATH)
+    latencies = []
+    for i, content in enumerate(contents):
+        article = {
+            'title': f"F&F 벤치마크 기사 {round_no}-{i}",
+            'link': f"https://bench.example.com/save/{round_no}/{i}",
+            'originallink': f"https://bench.example.com/save/{round_no}/{i}",
+            'pubDate': 'Mon, 08 Jul 2025 13:34:51 +0900',
+        }
+        started = time.perf_counter()
+        news_api.save_article_to_db(article, 'F&F', content=content, writer=writer)
+        latencies.append((time.perf_counter() - started) * 1000)
+    writer.close()
+    return {
+        'save_latency_p50_ms': metric(percentile(latencies, 50), 'ms', 'lower'),
+        'save_latency_p99_ms': metric(percentile(latencies, 99), 'ms', 'lower'),
+    }
+
+
+def bench_sqlite_writes(tmp_dir, round_no=0):
+    """ArticleBatchWriter 쓰기 처리량 (배치 크기, synchronous 별)"""
+    from backend.src.services.article_writer import ArticleBatchWriter
+    results = {}
+    tmp_dir = os.path.join(tmp_dir, f"writes_{round_no}")
+    os.makedirs(tmp_dir, exist_ok=True)
+    body = ' '.join(SENTENCES) * 20
+    for batch_size, synchronous in ((1, 'FULL'), (50, 'FULL'), (500, 'NORMAL')):
+        path = os.path.join(tmp_dir, f"writes_{batch_size}_{synchronous}.sqlite")
+        create_bench_db(path)
+        writer = ArticleBatchWriter(path, batch_size=batch_size, flush_seconds=3600, synchronous=synchronous)
+        rows = 1000 if batch_size > 1 else 200
+        started = time.perf_counter()
+        for i in range(rows):
+            writer.add(('F&F', 'F&F', f"제목 {i}", body, 'press', '2025-07-08 13:34:51', f"https://w.example.com/{i}", None, None))
+        writer.close()
+        elapsed = time.perf_counter() - started
+        results[f"sqlite_rows_per_sec_batch{batch_size}_{synchronous.lower()}"] = metric(rows / elapsed, 'rows/s', 'higher')
+    return results
+
+
+def bench_collection(news_api):
+    """run_news_collection 전체 처리량 (대체 서버 상대로 검색 → 다운로드 → 저장)"""
+    started = time.perf_counter()
+    result = news_api.run_news_collection()
+    elapsed = time.perf_counter() - started
+    return {
+        'collection_articles_per_sec': metric(result['total_articles'] / elapsed, 'articles/s', 'higher'),
+        'collection_saved_per_sec': metric(result['saved_articles'] / elapsed, 'articles/s', 'higher'),
+        'collection_seconds': metric(elapsed, 's', 'lower'),
+    }
+
+
+def keep_best(metrics, new_metrics):
+    """반복 측정한 지표 중 가장 좋은 값만 남긴다 (한 번의 튀는 측정으로 기준값 비교가 실패하지 않도록)"""
+    for name, current in new_metrics.items():
+        best = metrics.get(name)
+        if best is None:
+            metrics[name] = current
+        elif (current['value'] > best['value']) == (current['better'] == 'higher'):
+            metrics[name] = current
+
+
+# ============================================================================
+# 기준값 비교
+# ============================================================================
+
+def compare_with_baseline(results, baseline, tolerance):
+    """기준값보다 tolerance 비율 이상 나빠진 지표 목록"""
+    regressions = []
+    for name, current in results['metrics'].items():
+        base = baseline.get('metrics', {}).get(name)
+        if not base or not base['value']:
+            continue
+        change = (current['value'] - base['value']) / base['value']
+        worse = change < -tolerance if current['better'] == 'higher' else change > tolerance
+        marker = '❌' if worse else '✅'
+        print(f"  {marker} {name:<45} {base['value']:>12.2f} → {current['value']:>12.2f} {current['unit']} ({change * 100:+.1f}%)")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 수집기 벤치마크')
+    parser.add_argument('--fixtures', help='HTTP_RECORD_DIR로 녹화한 디렉터리 (없으면 합성 fixture 사용)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='대체 서버 응답 지연 (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='대체 서버 500 응답 비율')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 성능 저하 비율')
+    parser.add_argument('--repeat', type=int, default=5, help='수집 외 지표 반복 측정 횟수 (가장 좋은 값 사용)')
+    parser.add_argument('--update-baseline', action='store_true', help='현재 결과를 기준값으로 저장')
+    parser.add_argument('--require-baseline', action='store_true', help='기준값이 없으면 종료 코드 1 (CI용)')
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='bench_collector_')
+    fixtures_dir = args.fixtures or os.path.join(tmp_dir, 'fixtures')
+    store = FixtureStore(fixtures_dir) if args.fixtures else build_synthetic_fixtures(fixtures_dir)
+    server, base_url, stub_config = start_stub_server(
+        fixtures_dir, latency_ms=args.latency_ms, jitter_ms=args.latency_ms / 2,
+        error_rate=args.error_rate, synthesize=True, max_results=300, seed=1
+    )
+
+    # naver_news_api는 import 시점에 설정을 읽으므로 환경변수를 먼저 지정한다
+    db_path = os.path.join(tmp_dir, 'bench.sqlite')
+    create_bench_db(db_path)
+    os.environ['NEWS_DB_PATH'] = db_path
+    os.environ['NAVER_API_BASE_URL'] = base_url
+    os.environ.setdefault('NAVER_CLIENT_ID', 'bench')
+    os.environ.setdefault('NAVER_CLIENT_SECRET', 'bench')
+    os.environ['NAVER_API_RATE_PER_SEC'] = '1000'
+    # 대체 서버는 호스트가 하나뿐이라 언론사별 동시 다운로드 제한을 풀어 준다
+    os.environ.setdefault('COLLECTION_PER_HOST_LIMIT', os.getenv('COLLECTION_FETCH_WORKERS', '16'))
+    from backend.src.api import naver_news_api as news_api
+
+    print(f"🏁 수집기 벤치마크 시작 (fixture: {fixtures_dir}, 대체 서버: {base_url})")
+    metrics = {}
+    for name, bench in (
+        ('clean_text', lambda round_no: bench_clean_text(news_api, store)),
+        ('extract', lambda round_no: bench_extract(news_api, store)),
+        ('save_latency', lambda round_no: bench_save_latency(news_api, store, round_no)),
+        ('sqlite_writes', lambda round_no: bench_sqlite_writes(tmp_dir, round_no)),
+    ):
+        print(f"\n⏱️ {name} 측정 중... ({args.repeat}회)")
+        for round_no in range(max(1, args.repeat)):
+            keep_best(metrics, bench(round_no))
+    print("\n⏱️ collection 측정 중...")
+    metrics.update(bench_collection(news_api))
+    server.shutdown()
+
+    results = {
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'fixtures': 'recorded' if args.fixtures else 'synthetic',
+        'stub_latency_ms': args.latency_ms,
+        'repeat': args.repeat,
+        'stub_requests': stub_config.counters,
+        'metrics': metrics,
+    }
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    print("\n📊 결과")
+    for name, value in metrics.items():
+        print(f"  {name:<45} {value['value']:>12.2f} {value['unit']}")
+    print(f"  → {RESULTS_PATH}")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📌 기준값 저장: {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        if args.require_baseline:
+            print(f"❌ 기준값이 없습니다: {BASELINE_PATH}")
+            return 1
+        print("ℹ️ 기준값이 없습니다. --update-baseline으로 먼저 저장하세요.")
+        return 0
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\n📐 기준값 비교 ({baseline.get('created_at')}, {baseline.get('platform')}, 허용 {args.tolerance * 100:.0f}%)")
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"⚠️ 성능 저하: {regressions}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
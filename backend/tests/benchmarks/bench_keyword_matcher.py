@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+키워드 매처 벤치마크
+기존 `any(term in text ...)` / `sum(1 for company in ...)` 루프와
+KeywordMatcher(한 번 컴파일한 정규식, 한 번 훑기)를 긴 기사 본문에서 비교합니다.
+
+실행: python backend/tests/benchmarks/bench_keyword_matcher.py
+"""
+import os
+import sys
+import random
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from backend.src.services.keyword_matcher import KeywordMatcher
+from backend.src.services.article_filter import BASEBALL_TERMS, HOLDING_COMPANIES, HOLDING_COMPANY_THRESHOLD
+
+# 일반 기사 문장 (키워드가 드물게 등장)
+SENTENCES = [
+    "패션 브랜드가 올 가을 신상품을 공개했다. ",
+    "업계 관계자는 소비 심리가 회복되고 있다고 말했다. ",
+    "F&F는 오늘 중국 시장 확대 계획을 밝혔다. ",
+    "이번 컬렉션은 MZ세대를 겨냥한 디자인이 특징이다. ",
+    "매장 방문객은 전년 대비 두 배 가까이 늘었다. ",
+    "회사 측은 하반기에도 성장세가 이어질 것으로 내다봤다. ",
+]
+
+# 지주사 관련주 나열 기사 문장 (키워드가 촘촘히 등장하는 최악의 경우)
+LISTING_SENTENCES = [
+    "지주사 관련주 가운데 대상홀딩스와 한화, LG, GS가 강세를 보였다. ",
+    "F&F홀딩스, 농심홀딩스, 하이트진로홀딩스도 상승 마감했다. ",
+]
+
+
+def build_body(length_kb, sentences=SENTENCES, seed=42):
+    """length_kb 크기의 가짜 기사 본문 생성"""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length_kb * 1024:
+        sentence = rng.choice(sentences)
+        parts.append(sentence)
+        size += len(sentence.encode('utf-8'))
+    return ''.join(parts)
+
+
+def bench(label, func, number):
+    seconds = timeit.timeit(func, number=number) / number
+    print(f"  {label:<40} {seconds * 1e3:8.3f} ms")
+    return seconds
+
+
+def main():
+    baseball_matcher = KeywordMatcher(BASEBALL_TERMS)
+    holding_matcher = KeywordMatcher(HOLDING_COMPANIES)
+
+    cases = [
+        (f"일반 기사 {length_kb}KB", build_body(length_kb), length_kb) for length_kb in (4, 16, 64)
+    ] + [
+        (f"관련주 나열 기사 {length_kb}KB", build_body(length_kb, SENTENCES + LISTING_SENTENCES), length_kb)
+        for length_kb in (4, 16)
+    ]
+
+    for label, body, length_kb in cases:
+        number = max(20, 2000 // length_kb)
+
+        # 결과가 기존 루프와 같은지 먼저 확인
+        assert baseball_matcher.contains_any(body) == any(term in body for term in BASEBALL_TERMS)
+        holding_count = sum(1 for company in HOLDING_COMPANIES if company in body)
+        assert holding_matcher.count_distinct(body) == holding_count
+        assert (holding_matcher.count_distinct(body, limit=HOLDING_COMPANY_THRESHOLD) >= HOLDING_COMPANY_THRESHOLD) \
+            == (holding_count >= HOLDING_COMPANY_THRESHOLD)
+
+        print(f"\n📄 {label} ({len(body)}자, {number}회 평균)")
+        loop = bench("야구 용어 any() 루프", lambda: any(term in body for term in BASEBALL_TERMS), number)
+        fast = bench("야구 용어 KeywordMatcher.contains_any", lambda: baseball_matcher.contains_any(body), number)
+        print(f"  → {loop / fast:.1f}배")
+        loop = bench("지주사 sum() 루프", lambda: sum(1 for company in HOLDING_COMPANIES if company in body), number)
+        fast = bench("지주사 KeywordMatcher.count_distinct", lambda: holding_matcher.count_distinct(body), number)
+        print(f"  → {loop / fast:.1f}배")
+        # filter_by_body는 임계값 이상인지만 본다
+        fast = bench(f"지주사 count_distinct(limit={HOLDING_COMPANY_THRESHOLD})",
+                     lambda: holding_matcher.count_distinct(body, limit=HOLDING_COMPANY_THRESHOLD), number)
+        print(f"  → {loop / fast:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
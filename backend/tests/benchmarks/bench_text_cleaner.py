@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+clean_text 벤치마크
+이전 정규식 체인 구현(태그/엔티티/특수 공백/psp/공백을 십여 번 나눠 훑기)과
+현재 clean_text(미리 컴파일한 정규식 + 있는 문자만 str.replace, 두세 번 훑기)를 기사 제목/본문 크기별로 비교합니다.
+
+실행: python backend/tests/benchmarks/bench_text_cleaner.py
+"""
+import os
+import random
+import sys
+import timeit
+
+# 프로젝트 루트와 테스트 디렉터리를 Python 경로에 추가
+TESTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.abspath(os.path.join(TESTS_DIR, '..', '..')))
+sys.path.append(TESTS_DIR)
+
+from backend.src.services.text_cleaner import clean_text
+from test_text_cleaner import legacy_clean_text
+
+SENTENCES = [
+    "패션 브랜드가 올 가을 신상품을 공개했다. ",
+    "업계 관계자는 소비 심리가 회복되고 있다고 말했다.&nbsp; ",
+    "F&amp;F는 오늘 중국 시장 확대 계획을 밝혔다. ",
+    "<b>MLB</b> 브랜드는 아시아 시장에서 꾸준히 매출을 늘리고 있다. ",
+    "매장 방문객은\xa0전년 대비 두 배 가까이 늘었다.\u200B ",
+    "</p>\n<p>회사 측은 하반기에도 성장세가 이어질 것으로 내다봤다. ",
+]
+
+
+def build_text(length_kb, seed=42):
+    """length_kb 크기의 가짜 기사 HTML 조각 생성"""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length_kb * 1024:
+        sentence = rng.choice(SENTENCES)
+        parts.append(sentence)
+        size += len(sentence.encode('utf-8'))
+    return '<p>' + ''.join(parts) + '</p>'
+
+
+def bench(label, func, number):
+    seconds = timeit.timeit(func, number=number) / number
+    print(f"  {label:<28} {seconds * 1e6:10.1f} us")
+    return seconds
+
+
+def main():
+    cases = [("제목 (<b> 태그 포함)", "<b>F&amp;F</b>, MLB 신상품 공개&quot;완판&quot;", 0)] + [
+        (f"본문 {length_kb}KB", build_text(length_kb), length_kb) for length_kb in (4, 16, 64)
+    ]
+
+    for label, text, length_kb in cases:
+        number = max(20, 20000 // max(1, length_kb * 10))
+
+        # 결과가 기존 구현과 같은지 먼저 확인
+        assert clean_text(text) == legacy_clean_text(text)
+
+        print(f"\n📄 {label} ({len(text)}자, {number}회 평균)")
+        legacy = bench("기존 정규식 체인", lambda: legacy_clean_text(text), number)
+        fast = bench("clean_text", lambda: clean_text(text), number)
+        print(f"  → {legacy / fast:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+네이버 검색 API / 언론사 기사 대체 서버
+HTTP_RECORD_DIR로 녹화한 응답(fixture)을 로컬에서 다시 내보내, 실제 네이버 API와 언론사 사이트 없이
+수집기(run_news_collection)를 부하 테스트합니다. 응답 지연과 오류(500)/속도 제한(429) 비율을 지정할 수 있습니다.
+
+1) 녹화: HTTP_RECORD_DIR=backend/tests/fixtures/naver python backend/src/api/naver_news_api.py
+2) 재생: python backend/tests/benchmarks/naver_stub_server.py --fixtures backend/tests/fixtures/naver --latency-ms 80
+3) 수집기 실행: NAVER_API_BASE_URL=http://127.0.0.1:8765 NAVER_CLIENT_ID=stub NAVER_CLIENT_SECRET=stub python ...
+
+검색 응답의 기사 link는 이 서버의 /article/<원래 주소> 로 바꿔서 내보내므로, 본문 다운로드도 이 서버로 옵니다.
+--synthesize를 주면 녹화되지 않은 검색 요청(다른 키워드/페이지)에도 녹화된 기사들로 새 URL의 결과를 만들어
+실제 규모의 키워드 수/페이지 수로 부하를 줄 수 있습니다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from backend.src.services.fixture_store import FixtureStore, fixture_key
+
+SEARCH_PATH = '/v1/search/news.json'
+ARTICLE_PREFIX = '/article/'
+# 합성 결과에 붙이는 파라미터 (기사 요청 시 떼고 원본 녹화를 찾는다)
+STUB_PARAM = 'stub_id'
+
+
+class StubConfig:
+    """대체 서버 설정과 녹화 데이터"""
+
+    def __init__(self, store, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, throttle_rate=0.0,
+                 synthesize=False, max_results=1000, seed=None):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.synthesize = synthesize
+        self.max_results = max_results
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {'search': 0, 'article': 0, 'errors': 0, 'throttled': 0, 'missing': 0}
+        # 합성용 기사 풀 (녹화된 검색 결과의 기사 전체)
+        self.item_pool = []
+        for meta in store.iter_meta():
+            if SEARCH_PATH in meta['key']:
+                record = store.load(meta['key'])
+                try:
+                    self.item_pool.extend(json.loads(record['body']).get('items', []))
+                except ValueError:
+                    continue
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        seconds = max(0.0, self.latency_ms + jitter) / 1000
+        if seconds:
+            time.sleep(seconds)
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+
+def _strip_scheme(url):
+    return url.split('://', 1)[-1]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    config: StubConfig = None
+    protocol_version = 'HTTP/1.1'  # keep-alive (수집기 커넥션 재사용과 같은 조건)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type='application/json; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _base_url(self):
+        return f"http://{self.headers.get('Host', '127.0.0.1')}"
+
+    def _rewrite_links(self, items):
+        for item in items:
+            if item.get('link'):
+                item['link'] = f"{self._base_url()}{ARTICLE_PREFIX}{_strip_scheme(item['link'])}"
+        return items
+
+    def _synthesize_search(self, params):
+        """녹화되지 않은 검색 요청에 대해 녹화된 기사들로 새 결과 페이지 생성"""
+        pool = self.config.item_pool
+        display = int(params.get('display', 10))
+        start = int(params.get('start', 1))
+        query = params.get('query', '')
+        if not pool or start > self.config.max_results:
+            return {'total': 0, 'start': start, 'display': 0, 'items': []}
+        query_hash = hashlib.sha1(query.encode('utf-8')).hexdigest()[:8]
+        now = datetime.now().astimezone()
+        items = []
+        for offset in range(min(display, self.config.max_results - start + 1)):
+            index = start + offset
+            item = dict(pool[(index + int(query_hash, 16)) % len(pool)])
+            separator = '&' if '?' in item['link'] else '?'
+            item['link'] = f"{item['link']}{separator}{STUB_PARAM}={query_hash}-{index}"
+            # 최신순 정렬처럼 보이도록 순번마다 1분씩 과거로
+            item['pubDate'] = (now - timedelta(minutes=index)).strftime('%a, %d %b %Y %H:%M:%S %z')
+            items.append(item)
+        return {'total': self.config.max_results, 'start': start, 'display': len(items), 'items': items}
+
+    def _handle_search(self):
+        self.config.count('search')
+        if self.config.roll(self.config.throttle_rate):
+            self.config.count('throttled')
+            return self._send(429, b'{"errorMessage": "Rate limit exceeded", "errorCode": "012"}')
+        record = self.config.store.load(fixture_key(f"openapi.naver.com{self.path}"))
+        if record is not None:
+            result = json.loads(record['body'])
+        elif self.config.synthesize:
+            result = self._synthesize_search(dict(parse_qsl(urlsplit(self.path).query)))
+        else:
+            self.config.count('missing')
+            result = {'total': 0, 'start': 1, 'display': 0, 'items': []}
+        result['items'] = self._rewrite_links(result.get('items', []))
+        return self._send(200, json.dumps(result, ensure_ascii=False).encode('utf-8'))
+
+    def _handle_article(self):
+        self.config.count('article')
+        original = self.path[len(ARTICLE_PREFIX):]
+        parts = urlsplit(f"http://{original}")
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != STUB_PARAM]
+        original = f"{parts.netloc}{parts.path}" + (f"?{urlencode(query)}" if query else '')
+        record = self.config.store.load(fixture_key(f"http://{original}"))
+        if record is None:
+            self.config.count('missing')
+            return self._send(404, b'not recorded', 'text/plain')
+        return self._send(record['status'], record['body'], record['content_type'] or 'text/html')
+
+    def do_GET(self):
+        self.config.delay()
+        if self.config.roll(self.config.error_rate):
+            self.config.count('errors')
+            return self._send(500, b'stub error', 'text/plain')
+        if self.path.startswith(SEARCH_PATH):
+            return self._handle_search()
+        if self.path.startswith(ARTICLE_PREFIX):
+            return self._handle_article()
+        return self._send(404, b'not found', 'text/plain')
+
+
+def start_stub_server(fixtures_dir, host='127.0.0.1', port=0, **options):
+    """대체 서버를 백그라운드 스레드로 시작 (벤치마크 스크립트에서 사용)
+
+    Returns:
+        (서버, 기본 URL, 설정) - 종료는 server.shutdown()
+    """
+    config = StubConfig(FixtureStore(fixtures_dir), **options)
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'config': config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='naver-stub', daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}", config
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 검색 API / 언론사 기사 대체 서버')
+    parser.add_argument('--fixtures', required=True, help='HTTP_RECORD_DIR로 녹화한 디렉터리')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='지연 편차 (± ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율 (0~1)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='검색 429 응답 비율 (0~1)')
+    parser.add_argument('--synthesize', action='store_true', help='녹화되지 않은 검색 요청도 녹화 기사로 결과 생성')
+    parser.add_argument('--max-results', type=int, default=1000, help='합성 검색 결과 최대 수')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server, base_url, config = start_stub_server(
+        args.fixtures, host=args.host, port=args.port,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, synthesize=args.synthesize,
+        max_results=args.max_results, seed=args.seed
+    )
+    print(f"🛰️ 네이버 대체 서버 실행 중: {base_url} (녹화 기사 {len(config.item_pool)}개)")
+    print(f"   수집기 실행 시 NAVER_API_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(10)
+            print(f"   요청 통계: {config.counters}")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+일괄(여러 기사 한 요청) 분류 테스트
+일괄 응답 파서가 번호가 빠지거나 중복되거나 JSON이 깨진 응답을 걸러내는지,
+걸러진 기사는 기사별 요청으로 다시 분류되어 빠지거나 다른 기사 결과가 붙지 않는지 확인합니다.
+OpenAI는 호출하지 않고 정해진 응답을 돌려주는 가짜 클라이언트를 씁니다.
+
+실행: python backend/tests/test_batch_classification.py
+"""
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.agents.news_ai_classification import NewsAIClassifier
+
+KEYWORD = '노스페이스'
+# 기사별 요청 응답 (일괄 응답에서 빠진 기사인지 구분할 수 있도록 근거를 고정)
+SINGLE_RESPONSE = json.dumps({'classification': '오가닉', 'confidence': 0.7, 'reason': '기사별 분류'}, ensure_ascii=False)
+
+
+class FakeCompletions:
+    """일괄 요청에는 정해 둔 응답을 차례로, 기사별 요청에는 SINGLE_RESPONSE를 돌려준다"""
+
+    def __init__(self, batch_responses):
+        self.batch_responses = list(batch_responses)
+        self.batch_prompts = []
+        self.single_calls = 0
+
+    def create(self, model, messages, temperature, max_tokens):
+        prompt = messages[-1]['content']
+        if '건을 분류하세요' in prompt:
+            self.batch_prompts.append(prompt)
+            content = self.batch_responses.pop(0)
+            if isinstance(content, Exception):
+                raise content
+        else:
+            self.single_calls += 1
+            content = SINGLE_RESPONSE
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_classifier(batch_responses=()):
+    os.environ.pop('OPENAI_API_KEY', None)
+    classifier = NewsAIClassifier(db_path=os.path.join(tempfile.mkdtemp(), 'test.sqlite'))
+    completions = FakeCompletions(batch_responses)
+    classifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return classifier, completions
+
+
+def item(index, classification='보도자료', confidence=0.9, reason='일괄 분류'):
+    return {'index': index, 'classification': classification, 'confidence': confidence, 'reason': reason}
+
+
+def articles(count, tag):
+    return [(position, f'{tag} 기사 {position} 제목', f'{KEYWORD} {tag} 기사 {position} 본문') for position in range(count)]
+
+
+def test_parse_batch_response_keeps_only_valid_items():
+    classifier, _ = make_classifier()
+    parse = classifier._parse_batch_response
+
+    assert set(parse(json.dumps([item(0), item(1), item(2)]), 3)) == {0, 1, 2}
+    # 코드블록으로 감싼 응답
+    assert set(parse('```json\n' + json.dumps([item(0)]) + '\n```', 1)) == {0}
+    # 빠진 번호는 결과에 없음
+    assert set(parse(json.dumps([item(0), item(2)]), 3)) == {0, 2}
+    # 중복 번호는 어느 쪽이 맞는지 모르므로 둘 다 버림
+    assert set(parse(json.dumps([item(0), item(1, '오가닉'), item(1, '해당없음')]), 2)) == {0}
+    # 범위 밖/숫자가 아닌/불리언 번호
+    assert parse(json.dumps([item(3), item(-1), {**item(0), 'index': '0'}, {**item(0), 'index': True}]), 3) == {}
+    # 분류 값/신뢰도가 틀린 항목
+    assert parse(json.dumps([item(0, '광고'), item(1, confidence=1.5), item(2, confidence='높음')]), 3) == {}
+    # 깨진 JSON, 배열이 아닌 JSON, 빈 응답
+    assert parse('[{"index": 0, "classification": "보도자료"', 1) == {}
+    assert parse(json.dumps(item(0)), 1) == {}
+    assert parse('', 1) == {}
+    assert parse(None, 1) == {}
+    print("✅ 일괄 응답 파서가 빠진/중복/잘못된 항목을 걸러냅니다.")
+
+
+def assert_complete(results, expected_indexes):
+    indexes = [index for index, _, _ in results]
+    assert sorted(indexes) == sorted(expected_indexes), f"빠지거나 중복된 기사: {indexes}"
+
+
+def test_missing_and_duplicate_items_fall_back_per_article():
+    batch = [item(0, '보도자료'), item(2, '해당없음'), item(2, '보도자료'), item(3, '해당없음')]
+    classifier, completions = make_classifier([json.dumps(batch, ensure_ascii=False)])
+    batch_results = classifier._classify_batch(articles(4, '누락'), KEYWORD)
+    assert_complete(batch_results, [0, 1, 2, 3])
+    results = {index: result for index, result, _ in batch_results}
+    assert results[0]['classification'] == '보도자료' and results[0]['reason'] == '일괄 분류'
+    assert results[3]['classification'] == '해당없음' and results[3]['reason'] == '일괄 분류'
+    # 1번(누락)과 2번(중복)만 기사별로 다시 분류
+    assert results[1]['reason'] == '기사별 분류'
+    assert results[2]['reason'] == '기사별 분류'
+    assert len(completions.batch_prompts) == 1 and completions.single_calls == 2
+    print("✅ 빠지거나 중복된 기사만 기사별 요청으로 다시 분류합니다.")
+
+
+def test_malformed_json_falls_back_for_every_article():
+    classifier, completions = make_classifier(['분류 결과: 보도자료, 오가닉, 해당없음'])
+    results = classifier._classify_batch(articles(3, '깨짐'), KEYWORD)
+    assert_complete(results, [0, 1, 2])
+    assert all(result['reason'] == '기사별 분류' for _, result, _ in results)
+    assert len(completions.batch_prompts) == 1 and completions.single_calls == 3
+    print("✅ JSON이 깨진 일괄 응답은 모든 기사를 기사별로 다시 분류합니다.")
+
+
+def test_failed_batch_request_falls_back_for_every_article():
+    classifier, completions = make_classifier([ValueError('요청 실패')])
+    results = classifier._classify_batch(articles(2, '실패'), KEYWORD)
+    assert_complete(results, [0, 1])
+    assert all(result['reason'] == '기사별 분류' for _, result, _ in results)
+    assert completions.single_calls == 2
+    print("✅ 일괄 요청이 실패하면 모든 기사를 기사별로 다시 분류합니다.")
+
+
+def test_only_valid_items_are_cached():
+    batch = [item(0, '보도자료'), item(1, '광고')]
+    classifier, completions = make_classifier([json.dumps(batch, ensure_ascii=False), '[]'])
+    batch_articles = articles(2, '캐시')
+    classifier._classify_batch(batch_articles, KEYWORD)
+    # 같은 묶음을 다시 분류하면 0번은 캐시에서 가져오고, 잘못된 응답이었던 1번만 다시 요청한다
+    results = {index: result for index, result, _ in classifier._classify_batch(batch_articles, KEYWORD)}
+    assert results[0]['classification'] == '보도자료' and results[0]['reason'] == '일괄 분류'
+    assert results[1]['reason'] == '기사별 분류'
+    second_prompt = completions.batch_prompts[1]
+    assert '캐시 기사 1 제목' in second_prompt and '캐시 기사 0 제목' not in second_prompt
+    print("✅ 형식이 맞는 일괄 응답 항목만 캐시에 저장합니다.")
+
+
+if __name__ == "__main__":
+    test_parse_batch_response_keeps_only_valid_items()
+    test_missing_and_duplicate_items_fall_back_per_article()
+    test_malformed_json_falls_back_for_every_article()
+    test_failed_batch_request_falls_back_for_every_article()
+    test_only_valid_items_are_cached()
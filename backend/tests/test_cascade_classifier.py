@@ -0,0 +1,131 @@
+"""
+단계별(캐스케이드) 분류 테스트
+LLM 없이 결정하는 규칙 단계(야구, 디스커버리 제외, 제목 확정 사례)와
+로컬 모델 단계의 임계값 판단이 의도한 기사만 결정하고 나머지는 LLM으로 넘기는지 확인합니다.
+로컬 모델은 정해진 예측을 돌려주는 가짜 모델을 씁니다.
+
+실행: python backend/tests/test_cascade_classifier.py
+"""
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.agents.cascade_classifier import (
+    classify_by_rules, ClassificationCascade, TIER_RULE, TIER_LOCAL, TIER_LLM
+)
+
+
+class StubModel:
+    """predict(title, content)가 정해 둔 예측을 돌려주는 가짜 로컬 모델"""
+
+    def __init__(self, prediction=None, error=None):
+        self.prediction = prediction or {}
+        self.error = error
+        self.calls = 0
+
+    def predict(self, title, content):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.prediction
+
+
+def test_baseball_rule_uses_title_terms():
+    result = classify_by_rules('이정후 9회말 끝내기 홈런', '', 'MLB')
+    assert result['classification'] == '해당없음' and result['rule'] == 'baseball'
+    # 그룹이 MLB인 다른 키워드도 같은 규칙
+    assert classify_by_rules('다저스 투수 오타니 선발 등판', '', '엠엘비', 'MLB')['rule'] == 'baseball'
+    # 패션 단어가 함께 있으면 브랜드 기사일 수 있으므로 LLM으로
+    assert classify_by_rules('다저스 홈런 기념 모자 신상 출시', '', 'MLB') is None
+    # 브랜드 기사에도 흔한 단어(시즌, 메이저리그)만 있으면 규칙으로 결정하지 않음
+    assert classify_by_rules('MLB 메이저리그 시즌 컬래버', '', 'MLB') is None
+    # 강한 야구 용어 하나만으로는 부족
+    assert classify_by_rules('MLB 양키스 로고 티셔츠', '', 'MLB') is None
+    # 본문에만 야구 용어가 있으면 LLM으로
+    assert classify_by_rules('MLB 가을 신상품 공개', '이정후 홈런 투수 타자 안타', 'MLB') is None
+    # MLB가 아닌 키워드에는 적용하지 않음
+    assert classify_by_rules('이정후 9회말 끝내기 홈런', '', '노스페이스') is None
+    print("✅ 야구 규칙이 제목의 야구 용어로만 결정합니다.")
+
+
+def test_discovery_rule_uses_title_only():
+    result = classify_by_rules('SK디스커버리 2분기 실적 발표', '', '디스커버리')
+    assert result['classification'] == '해당없음' and result['rule'] == 'discovery_exclude'
+    assert classify_by_rules('랜드로버 디스커버리 스포츠 신형 출시', '', '디스커버리 익스페디션')['rule'] == 'discovery_exclude'
+    assert classify_by_rules('디스커버리 채널 새 다큐 방영', '', '디스커버리')['rule'] == 'discovery_exclude'
+    # 본문에 지나가듯 나온 제외 표현으로는 결정하지 않음 (LLM 판단)
+    content = '디스커버리 익스페디션이 겨울 패딩을 출시했다. 모회사 F&F는 SK디스커버리와 무관하다. 디스커버리 채널 협업 아님.'
+    assert classify_by_rules('디스커버리 익스페디션 겨울 패딩 출시', content, '디스커버리') is None
+    # 디스커버리가 아닌 키워드에는 적용하지 않음
+    assert classify_by_rules('SK디스커버리 2분기 실적 발표', '', 'F&F') is None
+    print("✅ 디스커버리 제외 규칙이 제목만 보고 결정합니다.")
+
+
+def test_title_rules():
+    result = classify_by_rules('F&F엔터 신인 아홉 데뷔', '', 'F&F')
+    assert result['classification'] == '보도자료' and result['confidence'] == 1.0
+    assert classify_by_rules('ahof 첫 팬미팅', '', 'F&F')['classification'] == '보도자료'
+    assert classify_by_rules('롯데온 노스페이스 할인전', '', '노스페이스')['classification'] == '오가닉'
+    # 키워드가 다르거나 본문에만 있으면 결정하지 않음
+    assert classify_by_rules('롯데온 노스페이스 할인전', '', 'F&F') is None
+    assert classify_by_rules('노스페이스 겨울 신상', '롯데온 단독 판매', '노스페이스') is None
+    assert classify_by_rules('F&F 3분기 실적', '', 'F&F') is None
+    print("✅ 제목 확정 사례 규칙이 해당 키워드에서만 결정합니다.")
+
+
+def test_decide_rule_tier():
+    model = StubModel({'classification': '오가닉', 'confidence': 0.99})
+    cascade = ClassificationCascade(local_model=model)
+    result = cascade.decide('SK디스커버리 2분기 실적 발표', '', '디스커버리')
+    assert result['decided_by'] == TIER_RULE and result['classification'] == '해당없음'
+    assert model.calls == 0
+    # 규칙 신뢰도(0.95)가 임계값보다 낮으면 다음 단계로
+    cascade = ClassificationCascade(local_model=StubModel(), rule_threshold=0.99)
+    assert cascade.decide('SK디스커버리 2분기 실적 발표', '', '디스커버리') is None
+    print("✅ 규칙 단계가 임계값 이상일 때만 결정합니다.")
+
+
+def test_decide_local_tier_thresholds():
+    # classification을 돌려주는 모델: 신뢰도가 임계값 이상일 때만 결정
+    cascade = ClassificationCascade(local_model=StubModel({'classification': '보도자료', 'confidence': 0.96}))
+    result = cascade.decide('노스페이스 신상품', '본문', '노스페이스')
+    assert result['decided_by'] == TIER_LOCAL and result['classification'] == '보도자료'
+    cascade = ClassificationCascade(local_model=StubModel({'classification': '보도자료', 'confidence': 0.94}))
+    assert cascade.decide('노스페이스 신상품', '본문', '노스페이스') is None
+
+    # KeywordClassifier 형식: 다른 브랜드로 확실할 때만 해당없음
+    other = {'keyword': 'MLB', 'confidence': 0.97, 'probabilities': {'MLB': 0.97, '노스페이스': 0.03}}
+    result = ClassificationCascade(local_model=StubModel(other)).decide('제목', '본문', '노스페이스')
+    assert result['decided_by'] == TIER_LOCAL and result['classification'] == '해당없음'
+    # 키워드 확률이 1 - 임계값보다 크면 LLM으로
+    unsure = {'keyword': 'MLB', 'confidence': 0.9, 'probabilities': {'MLB': 0.9, '노스페이스': 0.1}}
+    assert ClassificationCascade(local_model=StubModel(unsure)).decide('제목', '본문', '노스페이스') is None
+    # 같은 브랜드로 예측하면 보도자료/오가닉 구분은 LLM이 한다
+    same = {'keyword': '노스페이스', 'confidence': 0.99, 'probabilities': {'노스페이스': 0.99}}
+    assert ClassificationCascade(local_model=StubModel(same)).decide('제목', '본문', '노스페이스') is None
+    # 모델 오류는 LLM으로 넘김
+    failing = ClassificationCascade(local_model=StubModel(error=RuntimeError('모델 오류')))
+    assert failing.decide('제목', '본문', '노스페이스') is None
+    print("✅ 로컬 모델 단계가 임계값 이상일 때만 결정합니다.")
+
+
+def test_stats_count_each_tier():
+    cascade = ClassificationCascade(local_model=StubModel({'classification': '오가닉', 'confidence': 0.99}))
+    cascade.decide('SK디스커버리 실적', '', '디스커버리')
+    cascade.decide('노스페이스 신상품', '본문', '노스페이스')
+    cascade.record(TIER_LLM)
+    stats = cascade.get_stats()
+    assert stats['total'] == 3 and stats['llm_calls_saved'] == 2
+    assert stats['tiers'][TIER_RULE]['count'] == 1 and stats['tiers'][TIER_LOCAL]['count'] == 1
+    print("✅ 단계별 결정 건수가 집계됩니다.")
+
+
+if __name__ == "__main__":
+    test_baseball_rule_uses_title_terms()
+    test_discovery_rule_uses_title_only()
+    test_title_rules()
+    test_decide_rule_tier()
+    test_decide_local_tier_thresholds()
+    test_stats_count_each_tier()
@@ -0,0 +1,270 @@
+"""
+동시 분류 요청 테스트
+classify_articles_by_keyword를 동시 요청 1건(순서대로)과 4건으로 실행해 같은 결과가 같은 순서로 나오는지,
+processing_time이 기사별 요청 시간인지 확인합니다.
+OpenAI 일시 오류(429/5xx/연결 끊김)는 재시도하고 400은 재시도하지 않는지, Retry-After를 지키는지도 확인합니다.
+OpenAI는 호출하지 않고 기사 제목으로 정해진 응답을 돌려주는 가짜 클라이언트를 씁니다.
+
+실행: python backend/tests/test_concurrent_classification.py
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.agents import news_ai_classification
+from backend.src.agents.news_ai_classification import NewsAIClassifier, _is_retryable, _retry_delay
+
+KEYWORD = '노스페이스'
+ARTICLE_COUNT = 12
+CLASSIFICATIONS = ('보도자료', '오가닉', '해당없음')
+OPENAI_URL = 'https://api.openai.com/v1/chat/completions'
+
+
+def article_delay(number):
+    """기사별 가짜 응답 시간 (기사마다 달라서 동시 실행 시 완료 순서가 섞인다)"""
+    return (0.0, 0.2, 0.1)[number % 3]
+
+
+def article_number(prompt):
+    """프롬프트에 든 제목에서 기사 번호를 찾는다"""
+    for number in range(ARTICLE_COUNT - 1, -1, -1):
+        if f"분류 테스트 기사 {number:02d}" in prompt:
+            return number
+    raise AssertionError('프롬프트에서 기사 제목을 찾지 못했습니다')
+
+
+class ScriptedCompletions:
+    """기사 번호로 정해진 분류를 돌려주는 가짜 클라이언트 (응답 전에 기사별 시간만큼 기다린다)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def create(self, model, messages, temperature, max_tokens):
+        number = article_number(messages[-1]['content'])
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(article_delay(number))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        content = json.dumps({
+            'classification': CLASSIFICATIONS[number % 3],
+            'confidence': 0.5 + number / 100,
+            'reason': f"기사 {number} 근거"
+        }, ensure_ascii=False)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FailingCompletions:
+    """정해 둔 오류를 차례로 낸 뒤 정상 응답을 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create(self, model, messages, temperature, max_tokens):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"classification": "오가닉"}'))])
+
+
+def create_test_db(path):
+    """테스트 전용 DB (articles + classify_articles_by_keyword가 저장하는 classification_logs 칼럼)"""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            keyword TEXT NOT NULL,
+            group_name TEXT,
+            title TEXT,
+            content TEXT,
+            press TEXT,
+            pub_date TEXT,
+            url TEXT UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE classification_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            keyword TEXT NOT NULL,
+            group_name TEXT,
+            title TEXT,
+            content TEXT,
+            url TEXT,
+            classification_result TEXT,
+            confidence_score REAL,
+            reason TEXT,
+            processing_time REAL,
+            created_at TIMESTAMP,
+            is_saved BOOLEAN DEFAULT FALSE
+        );
+    """)
+    conn.executemany(
+        "INSERT INTO articles (keyword, group_name, title, content, pub_date, url, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (KEYWORD, 'F&F', f"분류 테스트 기사 {number:02d}", f"{KEYWORD} 겨울 신상품 기사 {number} 본문입니다.",
+             '2025-07-08 13:34:51', f"https://press.example.com/news/{number}", f"2025-07-08 10:{number:02d}:00")
+            for number in range(ARTICLE_COUNT)
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+
+def make_classifier(completions):
+    os.environ.pop('OPENAI_API_KEY', None)
+    db_path = os.path.join(tempfile.mkdtemp(), 'test.sqlite')
+    create_test_db(db_path)
+    classifier = NewsAIClassifier(db_path=db_path)
+    classifier.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return classifier
+
+
+def run_classification(max_in_flight):
+    completions = ScriptedCompletions()
+    classifier = make_classifier(completions)
+    results = classifier.classify_articles_by_keyword(KEYWORD, max_in_flight=max_in_flight, batch_max_articles=1, cascade=False)
+    conn = sqlite3.connect(classifier.db_path)
+    logged = conn.execute(
+        "SELECT url, classification_result, confidence_score, reason FROM classification_logs ORDER BY url"
+    ).fetchall()
+    conn.close()
+    return results, logged, completions.max_in_flight
+
+
+def comparable(results):
+    """실행마다 달라지는 값(저장 시각, 처리 시간)을 뺀 결과"""
+    return [{key: value for key, value in row.items() if key not in ('created_at', 'processing_time')} for row in results]
+
+
+def test_concurrent_results_match_sequential():
+    sequential, sequential_logged, sequential_peak = run_classification(1)
+    concurrent, concurrent_logged, concurrent_peak = run_classification(4)
+    assert sequential_peak == 1 and concurrent_peak > 1, f"동시 요청 수: {sequential_peak}, {concurrent_peak}"
+    assert len(sequential) == ARTICLE_COUNT
+    assert comparable(concurrent) == comparable(sequential), "동시 실행 결과/순서가 순서대로 실행한 결과와 다릅니다"
+    assert concurrent_logged == sequential_logged
+    # 반환 순서는 조회 순서(created_at 내림차순)
+    assert [row['title'] for row in concurrent] == [f"분류 테스트 기사 {number:02d}" for number in reversed(range(ARTICLE_COUNT))]
+    print("✅ 동시 요청 4건과 1건의 분류 결과/순서가 같습니다.")
+
+
+def test_processing_time_is_per_article():
+    for max_in_flight in (1, 4):
+        results, _, _ = run_classification(max_in_flight)
+        for row in results:
+            number = int(row['title'].rsplit(' ', 1)[1])
+            # 다른 기사를 기다린 시간이 섞이지 않고 그 기사의 요청 시간만 남아야 한다
+            assert abs(row['processing_time'] - article_delay(number)) <= 0.1, \
+                f"동시 {max_in_flight}건: 기사 {number} 처리시간 {row['processing_time']} (기대 {article_delay(number)})"
+    print("✅ processing_time이 기사별 요청 시간입니다.")
+
+
+def status_error(error_class, status_code, headers=None):
+    response = httpx.Response(status_code, headers=headers or {}, request=httpx.Request('POST', OPENAI_URL))
+    return error_class(f"HTTP {status_code}", response=response, body=None)
+
+
+def connection_error():
+    return openai.APIConnectionError(request=httpx.Request('POST', OPENAI_URL))
+
+
+def test_retryable_errors():
+    assert _is_retryable(status_error(openai.RateLimitError, 429))
+    assert _is_retryable(status_error(openai.InternalServerError, 500))
+    assert _is_retryable(status_error(openai.InternalServerError, 503))
+    assert _is_retryable(connection_error())
+    assert _is_retryable(openai.APITimeoutError(request=httpx.Request('POST', OPENAI_URL)))
+    assert not _is_retryable(status_error(openai.BadRequestError, 400))
+    assert not _is_retryable(status_error(openai.AuthenticationError, 401))
+    assert not _is_retryable(ValueError('파싱 오류'))
+    print("✅ 429/5xx/연결 오류만 재시도 대상입니다.")
+
+
+def with_recorded_sleeps(run):
+    """재시도 대기를 실제로 기다리지 않고 대기 시간만 기록"""
+    sleeps = []
+    original = news_ai_classification.time
+    news_ai_classification.time = SimpleNamespace(sleep=sleeps.append, time=time.time)
+    try:
+        return run(), sleeps
+    finally:
+        news_ai_classification.time = original
+
+
+def test_request_completion_retries_transient_errors():
+    errors = [status_error(openai.RateLimitError, 429), status_error(openai.InternalServerError, 502), connection_error()]
+    completions = FailingCompletions(errors)
+    classifier = make_classifier(completions)
+    response, sleeps = with_recorded_sleeps(lambda: classifier._request_completion('프롬프트'))
+    assert response == '{"classification": "오가닉"}'
+    assert completions.calls == 4 and len(sleeps) == 3
+    print("✅ 429/5xx/연결 오류는 재시도 후 성공합니다.")
+
+
+def test_request_completion_does_not_retry_bad_request():
+    completions = FailingCompletions([status_error(openai.BadRequestError, 400)])
+    classifier = make_classifier(completions)
+    try:
+        with_recorded_sleeps(lambda: classifier._request_completion('프롬프트'))
+        raise AssertionError('400 오류가 전달되지 않았습니다')
+    except openai.BadRequestError:
+        pass
+    assert completions.calls == 1
+    print("✅ 400 오류는 재시도하지 않습니다.")
+
+
+def test_request_completion_gives_up_after_max_retries():
+    retries = news_ai_classification.AI_CLASSIFY_MAX_RETRIES
+    completions = FailingCompletions([status_error(openai.RateLimitError, 429) for _ in range(retries + 1)])
+    classifier = make_classifier(completions)
+    try:
+        with_recorded_sleeps(lambda: classifier._request_completion('프롬프트'))
+        raise AssertionError('재시도 횟수를 넘긴 429 오류가 전달되지 않았습니다')
+    except openai.RateLimitError:
+        pass
+    assert completions.calls == retries + 1
+    print(f"✅ 429가 계속되면 {retries}회 재시도 후 오류를 전달합니다.")
+
+
+def test_retry_after_is_honored():
+    throttled = status_error(openai.RateLimitError, 429, {'retry-after': '7'})
+    for attempt in range(3):
+        assert _retry_delay(attempt, throttled) >= 7.0
+    # 백오프 상한보다 긴 Retry-After는 상한까지만 기다린다
+    too_long = status_error(openai.RateLimitError, 429, {'retry-after': '3600'})
+    assert _retry_delay(0, too_long) == news_ai_classification.AI_CLASSIFY_BACKOFF_MAX
+    # 숫자가 아닌 Retry-After는 무시하고 백오프만 쓴다
+    invalid = status_error(openai.RateLimitError, 429, {'retry-after': 'soon'})
+    assert 0.0 <= _retry_delay(0, invalid) <= news_ai_classification.AI_CLASSIFY_BACKOFF_BASE
+
+    completions = FailingCompletions([throttled])
+    classifier = make_classifier(completions)
+    _, sleeps = with_recorded_sleeps(lambda: classifier._request_completion('프롬프트'))
+    assert sleeps and sleeps[0] >= 7.0, f"Retry-After 7초보다 짧게 기다림: {sleeps}"
+    print("✅ Retry-After 헤더만큼 기다린 뒤 재시도합니다.")
+
+
+if __name__ == "__main__":
+    test_concurrent_results_match_sequential()
+    test_processing_time_is_per_article()
+    test_retryable_errors()
+    test_request_completion_retries_transient_errors()
+    test_request_completion_does_not_retry_bad_request()
+    test_request_completion_gives_up_after_max_retries()
+    test_retry_after_is_honored()
@@ -0,0 +1,146 @@
+"""
+DateNormalizer 회귀 테스트
+형식 목록을 순서대로 strptime 해 보던 기존 방식(legacy_normalize)과 DateNormalizer가
+같은 입력에서 같은 결과(변환 결과 또는 실패)를 돌려주는지 확인합니다.
+
+실행: python backend/tests/test_date_normalizer.py
+"""
+import os
+import random
+import sys
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.services.date_normalizer import (
+    DateNormalizer, ARTICLE_DATE_FORMATS, LOG_DATE_FORMATS, RFC2822_FORMAT, OUTPUT_FORMAT, parse_naver_pub_date
+)
+
+
+def legacy_normalize(value, formats):
+    """형식 목록을 순서대로 strptime 하던 이전 구현 (비교 기준, 실패 시 None)"""
+    if not value:
+        return None
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt).strftime(OUTPUT_FORMAT)
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_parse_naver_pub_date(value):
+    """search_naver_news 날짜 필터에서 쓰던 이전 해석 (비교 기준)"""
+    try:
+        return datetime.strptime(value, RFC2822_FORMAT).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return None
+
+
+# 대표 입력과 형식이 어긋난 입력
+EDGE_CASES = [
+    None,
+    '',
+    ' ',
+    'Mon, 08 Jul 2025 13:34:51 +0900',
+    'Tue, 09 Jul 2025 00:00:00 -0500',
+    'Sun, 31 Dec 2023 23:59:59 +0000',
+    'Mon, 08 Jul 2025 13:34:51 +09:00',
+    'Mon, 08 Jul 2025 13:34:51 Z',
+    'mon, 08 jul 2025 13:34:51 +0900',
+    'Monday, 08 July 2025 13:34:51 +0900',
+    'Mon, 8 Jul 2025 13:34:51 +0900',
+    'Mon,  08 Jul 2025 13:34:51 +0900',
+    'Mon, 08 Jul 2025 13:34:51 +0960',
+    'Mon, 08 Jul 2025 24:00:00 +0900',
+    'Mon, 30 Feb 2025 10:00:00 +0900',
+    'Fri, 29 Feb 2024 10:00:00 +0900',
+    'Mon, 08 Jul 0999 13:34:51 +0900',
+    'Mon, 08 Jul 2025 13:34:51',
+    '08 Jul 2025 13:34:51',
+    '2025-07-08 13:34:51',
+    '2025-07-08',
+    '2025-7-8',
+    '2025-07-08T13:34:51',
+    '2025-07-23T10:54:29.732630',
+    '2025-07-23T10:54:29.7',
+    '2025-07-23T10:54:29.1234567',
+    '2025-13-01 00:00:00',
+    '2025-02-29',
+    '23/07/2025 10:54:29',
+    '07/23/2025 10:54:29',
+    '03/04/2025 10:54:29',
+    '2025/07/08 13:34:51',
+    '2025-07-08 13:34:51 ',
+    ' 2025-07-08',
+    '２０２５-07-08',
+    '2025-07-08 13:34',
+    'not a date',
+]
+
+# 무작위 조합용 조각 (숫자, 구분자, 요일/월 이름, 시간대)
+FRAGMENTS = [
+    '0', '1', '2', '3', '9', '00', '07', '12', '13', '23', '29', '30', '31', '59', '60', '2024', '2025', '0999',
+    '-', '/', ':', '.', ' ', '  ', 'T', ',', '+0900', '-0500', '+09:00', 'Z',
+    'Mon', 'Tue', 'Sun', 'mon', 'Jul', 'Feb', 'Dec', 'jul', 'July',
+]
+
+
+def build_corpus(size=20000, seed=18):
+    """가장자리 사례 + 형식에 가깝게 만든 값 + 조각을 무작위로 이어 붙인 값"""
+    rng = random.Random(seed)
+    corpus = list(EDGE_CASES)
+    start = datetime(1990, 1, 1).timestamp()
+    end = datetime(2030, 12, 31).timestamp()
+    for _ in range(size):
+        if rng.random() < 0.5:
+            # 실제 날짜를 형식 중 하나로 쓴 뒤 가끔 한 글자를 바꾼다
+            moment = datetime.fromtimestamp(rng.uniform(start, end))
+            fmt = rng.choice(ARTICLE_DATE_FORMATS + LOG_DATE_FORMATS)
+            value = moment.strftime(fmt.replace('%z', rng.choice(['+0900', '-0500', '+0000'])))
+            if rng.random() < 0.3:
+                index = rng.randrange(len(value))
+                value = value[:index] + rng.choice(FRAGMENTS) + value[index + 1:]
+            corpus.append(value)
+        else:
+            corpus.append(''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))))
+    return corpus
+
+
+def _check(formats, name):
+    normalizer = DateNormalizer(formats)
+    corpus = build_corpus()
+    mismatches = [value for value in corpus if normalizer.normalize(value) != legacy_normalize(value, formats)]
+    for value in mismatches[:5]:
+        print(f"❌ 불일치 ({name}): {value!r}\n   기존: {legacy_normalize(value, formats)!r}\n   현재: {normalizer.normalize(value)!r}")
+    assert not mismatches, f"{name}: {len(mismatches)}건 불일치"
+    # 일괄 변환도 하나씩 변환한 결과와 같아야 한다
+    assert normalizer.normalize_many(corpus) == [legacy_normalize(value, formats) for value in corpus]
+    print(f"✅ {name}: {len(corpus)}개 값 모두 기존 구현과 일치합니다.")
+
+
+def test_article_formats_match_legacy():
+    _check(ARTICLE_DATE_FORMATS, 'ARTICLE_DATE_FORMATS')
+
+
+def test_log_formats_match_legacy():
+    _check(LOG_DATE_FORMATS, 'LOG_DATE_FORMATS')
+
+
+def test_rfc2822_format_matches_legacy():
+    _check([RFC2822_FORMAT], 'RFC2822_FORMAT')
+
+
+def test_parse_naver_pub_date_matches_legacy():
+    mismatches = [value for value in build_corpus()
+                  if parse_naver_pub_date(value) != legacy_parse_naver_pub_date(value)]
+    assert not mismatches, f"parse_naver_pub_date: {len(mismatches)}건 불일치 (예: {mismatches[:3]!r})"
+    print("✅ parse_naver_pub_date 결과가 기존 구현과 모두 일치합니다.")
+
+
+if __name__ == "__main__":
+    test_article_formats_match_legacy()
+    test_log_formats_match_legacy()
+    test_rfc2822_format_matches_legacy()
+    test_parse_naver_pub_date_matches_legacy()
@@ -0,0 +1,135 @@
+"""
+KeywordMatcher 동작 테스트
+겹치는 키워드, 접두사를 공유하는 키워드, 정규식 특수문자가 든 키워드를 하나의 정규식으로 묶어도
+`term in text` 부분 문자열 검사와 같은 결과를 돌려주는지 확인합니다.
+
+실행: python backend/tests/test_keyword_matcher.py
+"""
+import os
+import random
+import re
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.services.keyword_matcher import KeywordMatcher
+from backend.src.services.article_filter import BASEBALL_TERMS, HOLDING_COMPANIES
+from backend.src.services.baseball_terms import BASEBALL_KEYWORDS, BASEBALL_PATTERNS
+
+
+def substring_count(term, text):
+    """겹치는 출현까지 센 횟수 (비교 기준)"""
+    return sum(1 for index in range(len(text)) if text.startswith(term, index))
+
+
+def expected_counts(terms, text, ignore_case=False):
+    """`term in text` 루프로 구한 키워드별 출현 횟수 (비교 기준)"""
+    haystack = text.lower() if ignore_case else text
+    counts = {}
+    for term in dict.fromkeys(term for term in terms if term):
+        needle = term.lower() if ignore_case else term
+        occurrences = substring_count(needle, haystack)
+        if occurrences:
+            counts[term] = occurrences
+    return counts
+
+
+def assert_matches_substring(matcher, terms, text, ignore_case=False):
+    expected = expected_counts(terms, text, ignore_case)
+    assert matcher.count(text) == expected, f"count 불일치: {text!r}\n기대 {expected}\n결과 {matcher.count(text)}"
+    assert matcher.find_all(text) == set(expected)
+    assert matcher.contains_any(text) == bool(expected)
+    assert matcher.count_distinct(text) == len(expected)
+    for limit in (1, 2, 3, 5):
+        limited = matcher.count_distinct(text, limit=limit)
+        if len(expected) >= limit:
+            assert limit <= limited <= len(expected), f"count_distinct(limit={limit}) 불일치: {text!r}"
+        else:
+            assert limited == len(expected), f"count_distinct(limit={limit}) 불일치: {text!r}"
+    first = next((term for term in dict.fromkeys(terms) if term in expected), None)
+    assert matcher.first_term(text) == first, f"first_term 불일치: {text!r}"
+
+
+# 겹치는 키워드 / 접두사 공유 / 정규식 특수문자
+OVERLAPPING_TERMS = ['홀딩스', '대상홀딩스', '상홀', '스대', 'aa', 'aaa', 'aba', 'bab']
+PREFIX_TERMS = ['LG', 'LG전자', 'LG전자우', 'SK', 'SK디스커버리', '디스커버리', '디스커버리 채널', '디']
+SPECIAL_TERMS = ['F&F', 'C++', '(주)', 'a.b', '[MLB]', 'x|y', '^엠', '$5', '\\d', '*', '?', '+', 'a.b.']
+
+CASES = [
+    ('대상홀딩스', OVERLAPPING_TERMS),
+    ('대상홀딩스대상홀딩스', OVERLAPPING_TERMS),
+    ('aaaa ababab', OVERLAPPING_TERMS),
+    ('LG전자우 LG전자 LG', PREFIX_TERMS),
+    ('SK디스커버리와 디스커버리 채널', PREFIX_TERMS),
+    ('디디디', PREFIX_TERMS),
+    ('F&F(주) C++ a.b a-b [MLB] x|y ^엠 $5 \\d *?+', SPECIAL_TERMS),
+    ('axb a.b.a.b.', SPECIAL_TERMS),
+    ('', PREFIX_TERMS),
+    ('관련 없는 문장', PREFIX_TERMS),
+]
+
+
+def test_fixed_cases_match_substring():
+    for text, terms in CASES:
+        assert_matches_substring(KeywordMatcher(terms), terms, text)
+    print("✅ 겹침/접두사/특수문자 키워드가 부분 문자열 검사와 일치합니다.")
+
+
+def test_random_texts_match_substring():
+    """좁은 알파벳으로 만든 키워드/텍스트 (겹침과 접두사 공유가 많이 생기도록)"""
+    rng = random.Random(4)
+    alphabet = 'ab.+(가나'
+    for _ in range(2000):
+        terms = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert_matches_substring(KeywordMatcher(terms), terms, text)
+    print("✅ 무작위 키워드/텍스트 2000건이 부분 문자열 검사와 일치합니다.")
+
+
+def test_ignore_case_matches_lowercased_substring():
+    rng = random.Random(5)
+    alphabet = 'aAbB.F&'
+    for _ in range(2000):
+        terms = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 6))]
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        matcher = KeywordMatcher(terms, ignore_case=True)
+        expected = expected_counts(terms, text, ignore_case=True)
+        assert matcher.find_all(text) == set(expected), f"ignore_case 불일치: {terms!r} {text!r}"
+        assert matcher.contains_any(text) == bool(expected)
+    print("✅ ignore_case 결과가 소문자 부분 문자열 검사와 일치합니다.")
+
+
+def test_production_lists_match_substring():
+    """실제 제외 목록(야구 용어, 지주사 목록)으로 기사 문장 검사"""
+    texts = [
+        '이정후가 9회말 끝내기 홈런을 쳤다. 투수 교체 후 삼진 세 개.',
+        'MLB 뉴욕양키스 볼캡 신상품이 매장에 입고됐다.',
+        '대상홀딩스, 한국콜마홀딩스, F&F홀딩스, LG, GS, DB 등 지주사 관련주가 일제히 올랐다.',
+        'SK디스커버리 주가와 LX홀딩스, HD현대 동향',
+        '패션 브랜드 F&F가 신제품을 공개했다.',
+    ]
+    for terms in (BASEBALL_TERMS, HOLDING_COMPANIES, BASEBALL_KEYWORDS):
+        matcher = KeywordMatcher(terms)
+        for text in texts:
+            assert_matches_substring(matcher, terms, text)
+    print("✅ 실제 키워드 목록에서도 부분 문자열 검사와 일치합니다.")
+
+
+def test_merged_patterns_match_individual_search():
+    """여러 정규식 패턴을 하나로 묶어도 패턴 등장 여부는 패턴별 re.search와 같다"""
+    matcher = KeywordMatcher([], patterns=BASEBALL_PATTERNS)
+    texts = ['5회초 2루타', '10승5패 기록', '선발 투수', '우타자', '3타수 2안타', '승리 투수', '신상품 출시', '']
+    for text in texts:
+        expected = [pattern for pattern in BASEBALL_PATTERNS if re.search(pattern, text)]
+        assert bool(matcher.matched_patterns(text)) == bool(expected), f"패턴 불일치: {text!r}"
+        assert set(matcher.matched_patterns(text)) <= set(expected)
+    print("✅ 묶은 정규식 패턴의 등장 여부가 패턴별 검사와 일치합니다.")
+
+
+if __name__ == "__main__":
+    test_fixed_cases_match_substring()
+    test_random_texts_match_substring()
+    test_ignore_case_matches_lowercased_substring()
+    test_production_lists_match_substring()
+    test_merged_patterns_match_individual_search()
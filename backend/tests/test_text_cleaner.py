@@ -0,0 +1,90 @@
+"""
+clean_text 회귀 테스트
+기존 정규식 체인 구현(legacy_clean_text)과 현재 clean_text가 같은 말뭉치에서
+완전히 같은 문자열을 돌려주는지 확인합니다.
+
+실행: python backend/tests/test_text_cleaner.py
+"""
+import html
+import os
+import random
+import re
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.src.services.text_cleaner import clean_text
+
+
+def legacy_clean_text(text):
+    """정규식 체인으로 구현했던 이전 clean_text (비교 기준)"""
+    if not text:
+        return ''
+    text = re.sub(r'<.*?>', '', text)
+    text = html.unescape(text)
+    text = text.replace('&nbsp;', ' ').replace('\xa0', ' ')
+    text = re.sub(r'[\xa0\u200B\u200C\u200D\uFEFF]', ' ', text)
+    text = text.replace('\uFEFF', '')
+    text = text.replace('\u2060', '')
+    text = text.replace('\u200B', '')
+    text = text.replace('\u200C', '')
+    text = text.replace('\u200D', '')
+    text = re.sub(r'psp', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+# 정제 순서에 따라 결과가 달라지는 경우들
+EDGE_CASES = [
+    None,
+    '',
+    '   ',
+    '<b>F&amp;F</b> 신제품 출시',
+    '<p>첫 문단&nbsp;</p>\n<p>둘째 문단</p>',
+    '&amp;nbsp; 이중 인코딩',
+    '&amp;lt;b&amp;gt; 이중 인코딩 태그',
+    '&lt;b&gt;엔티티로 된 태그&lt;/b&gt;',
+    '<a href="x"\n>줄바꿈 태그</a>',
+    '<<b>>',
+    '열린 태그만 <b',
+    'ps\u2060p 단어 결합자 사이의 psp',
+    'p\u200Bsp 폭 없는 공백 사이의 psp',
+    'ppspsp PsP pSP',
+    '\u017F 긴 s: p\u017Fp',
+    '\uFEFF\uFEFF앞뒤 BOM\uFEFF',
+    '&nb\u2060sp; 결합자로 나뉜 엔티티',
+    '탭\t줄바꿈\n\r\x0b\x0c\x1c\x1d \u3000 여러 공백',
+    '&#8203;&#xFEFF;&#160; 숫자 엔티티 공백',
+    '&nbsp &amp &lt 세미콜론 없는 엔티티',
+    '<script>var a = "<b>";</script>본문',
+]
+
+# 무작위 조합용 조각 (태그, 엔티티, 특수 공백, psp 변형, 한글 문장)
+FRAGMENTS = [
+    '<p>', '</p>', '<br/>', '<', '>', '\n', ' ', '\t', '&', '&amp;', '&nbsp;', '&lt;', '&gt;', '&#160;',
+    '&#x200B;', 'nbsp;', '\xa0', '\u200B', '\u200C', '\u200D', '\uFEFF', '\u2060', '\u3000', 'p', 's', 'P',
+    'S', 'psp', 'PSP', '\u017F', '패션 브랜드가 신상품을 공개했다.', 'F&F', 'MLB', '"', "'",
+]
+
+
+def build_corpus(size=5000, seed=17):
+    """가장자리 사례 + 조각을 무작위로 이어 붙인 문자열 말뭉치"""
+    rng = random.Random(seed)
+    corpus = list(EDGE_CASES)
+    for _ in range(size):
+        corpus.append(''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 40))))
+    return corpus
+
+
+def test_clean_text_matches_legacy():
+    """말뭉치 전체에서 기존 구현과 결과가 같은지 확인"""
+    mismatches = [text for text in build_corpus() if clean_text(text) != legacy_clean_text(text)]
+    for text in mismatches[:5]:
+        print(f"❌ 불일치: {text!r}\n   기존: {legacy_clean_text(text)!r}\n   현재: {clean_text(text)!r}")
+    assert not mismatches, f"{len(mismatches)}건 불일치"
+    print("✅ clean_text 결과가 기존 구현과 모두 일치합니다.")
+
+
+if __name__ == "__main__":
+    test_clean_text_matches_legacy()